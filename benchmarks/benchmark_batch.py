@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -----------------------------------------------------------------------------
+# benchmarks/benchmark_batch.py
+#
+# Batch-mode scaling benchmark for my_spotify_playlists_downloader.py.
+#
+# License: MIT
+# -----------------------------------------------------------------------------
+
+"""
+Exports the same set of accounts (--batch_config) from the local mock server with an increasing
+number of worker processes (--batch_workers 1, 2, 4...) and reports, for each run, the wall time,
+the speedup over 1 worker process and the efficiency (speedup divided by the number of processes).
+It also checks that every run exported every account completely. Exits with status 1 otherwise.
+
+Every account exports the whole mock library. The per-request latency (--latency_ms) stands for the
+network round trips that batch mode overlaps. With --latency_ms 0 only local work is left (the
+exports, and the mock server answering in this process), so the numbers depend on the cores
+available. Runs with more processes than CPUs are marked.
+
+Usage:
+    python benchmarks/benchmark_batch.py [--accounts 4] [--batch_workers 1,2,4] [--playlists 40] [--tracks 200] [--latency_ms 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import my_spotify_playlists_downloader as downloader  # noqa: E402
+
+
+def _mock_client(config: dict, *args, **kwargs):
+    """Replacement for create_spotify_client pointing at the mock server (no OAuth)."""
+    import spotipy
+    sp = spotipy.Spotify(auth="mock-token")
+    sp.prefix = os.environ['MOCK_SPOTIFY_PREFIX']
+    return sp
+
+
+# Module level, so the spawned batch worker processes (which import this file again) use it too
+downloader.create_spotify_client = _mock_client
+
+
+def _run(config_path: Path, output_dir: Path, workers: int) -> tuple:
+    """Run one batch export and return (seconds, totals of the batch metrics file)."""
+    sys.argv = ['my_spotify_playlists_downloader.py', '--batch_config', str(config_path), '--batch_workers', str(workers),
+                '--all_playlists', '--output_dir', str(output_dir)]
+    start = time.perf_counter()
+    downloader.main()
+    elapsed = time.perf_counter() - start
+    metrics_path = next(output_dir.glob('batch_metrics_*.json'))
+    return elapsed, json.loads(metrics_path.read_text(encoding='utf-8'))['totals']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch mode with an increasing number of worker processes")
+    parser.add_argument('--accounts', type=int, default=4)
+    parser.add_argument('--batch_workers', type=str, default=None,
+                        help='Comma-separated numbers of worker processes (default: 1, 2, 4... up to --accounts)')
+    parser.add_argument('--playlists', type=int, default=40)
+    parser.add_argument('--tracks', type=int, default=200, help='Tracks per playlist')
+    parser.add_argument('--latency_ms', type=float, default=20, help='Artificial latency per request')
+    args = parser.parse_args()
+
+    from mock_spotify_server import start_mock_server
+
+    cpus = os.cpu_count() or 1
+    worker_counts = [int(w) for w in args.batch_workers.split(',')] if args.batch_workers else \
+        [w for w in (1, 2, 4, 8, 16, 32) if w <= args.accounts]
+
+    server, prefix = start_mock_server(args.playlists, args.tracks, 0, args.latency_ms)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        # Dummy credentials and a quiet log in the temporary directory (the .env file does not override them)
+        os.environ.update({'MOCK_SPOTIFY_PREFIX': prefix, 'SPOTIFY_CLIENT_ID': 'mock', 'SPOTIFY_CLIENT_SECRET': 'mock',
+                           'SPOTIFY_REDIRECT_URI': 'http://127.0.0.1:8888/callback', 'LOG_DIR': str(tmp_dir / 'logs'),
+                           'LOG_LEVEL': 'WARNING'})
+        config_path = tmp_dir / 'accounts.json'
+        config_path.write_text(json.dumps({'accounts': [
+            {'name': f"account{a}", 'cache_path': str(tmp_dir / f".cache-account{a}")} for a in range(args.accounts)
+        ]}), encoding='utf-8')
+
+        print(f"{args.accounts} accounts x {args.playlists} playlists x {args.tracks} tracks, "
+              f"{args.latency_ms:g} ms latency per request, {cpus} CPUs")
+        failed = False
+        single_process = None
+        try:
+            for workers in worker_counts:
+                elapsed, totals = _run(config_path, tmp_dir / f"batch_{workers}", workers)
+                complete = (totals['completed'] == args.accounts
+                            and totals['total_tracks'] == args.accounts * args.playlists * args.tracks)
+                failed |= not complete
+                if workers == 1:
+                    single_process = elapsed
+                scaling = ""
+                if single_process is not None:
+                    speedup = single_process / elapsed
+                    scaling = f"  x{speedup:4.1f} vs 1 process, {speedup / workers:4.0%} efficiency"
+                    if workers > cpus:
+                        scaling += " (more processes than CPUs)"
+                print(f"{workers:3d} worker processes {elapsed:8.2f} s  "
+                      f"{'complete' if complete else 'INCOMPLETE'}{scaling}")
+        finally:
+            server.shutdown()
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -----------------------------------------------------------------------------
+# benchmarks/benchmark_http_session.py
+#
+# HTTP session benchmark for my_spotify_playlists_downloader.py.
+#
+# License: MIT
+# -----------------------------------------------------------------------------
+
+"""
+Exports a synthetic library from the local mock server with different HTTP session settings
+and worker counts, and reports wall time and TCP connections opened:
+
+- spotipy's default session, serial fetch (previous behavior)
+- spotipy's default session (pool of 10), N workers
+- the tuned session from create_http_session, N workers, with and without compression
+
+The mock server speaks plain HTTP on localhost, so the cost of new TLS handshakes against
+the real API is not included; the connection count shows how many would happen.
+
+Usage:
+    python benchmarks/benchmark_http_session.py [--workers 16] [--playlists 200] [--tracks 150] [--latency_ms 20]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import spotipy  # noqa: E402
+
+import my_spotify_playlists_downloader as downloader  # noqa: E402
+from mock_spotify_server import start_mock_server  # noqa: E402
+
+
+def _run(server, prefix: str, session, workers: int) -> tuple:
+    """Export all playlists once and return (seconds, connections opened)."""
+    sp = spotipy.Spotify(auth="mock-token", requests_session=session if session is not None else True)
+    sp.prefix = prefix
+    logger = logging.getLogger("benchmark")
+    connections_before = server.connections
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        downloader.export_playlists(sp, True, Path(output_dir), "", "", None, logger, workers=workers)
+        elapsed = time.perf_counter() - start
+    return elapsed, server.connections - connections_before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP session settings against the mock server")
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--playlists', type=int, default=200)
+    parser.add_argument('--tracks', type=int, default=150, help='Tracks per playlist')
+    parser.add_argument('--latency_ms', type=float, default=20, help='Artificial latency per request')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    # urllib3 reports discarded connections at WARNING level; count them silently instead
+    logging.getLogger("urllib3").setLevel(logging.ERROR)
+
+    server, prefix = start_mock_server(args.playlists, args.tracks, 0, args.latency_ms)
+    scenarios = [
+        ("default session, 1 worker", None, 1),
+        (f"default session, {args.workers} workers", None, args.workers),
+        (f"tuned session, {args.workers} workers", downloader.create_http_session(args.workers + 1), args.workers),
+        (f"tuned session, {args.workers} workers, no compression",
+         downloader.create_http_session(args.workers + 1, compression='off'), args.workers),
+    ]
+    try:
+        print(f"{args.playlists} playlists x {args.tracks} tracks, {args.latency_ms:g} ms latency per request")
+        for label, session, workers in scenarios:
+            elapsed, connections = _run(server, prefix, session, workers)
+            print(f"{label:<45} {elapsed:8.2f} s  {connections:6d} connections")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -----------------------------------------------------------------------------
+# benchmarks/benchmark_serialization.py
+#
+# Serialization benchmark for the combined JSON export.
+#
+# License: MIT
+# -----------------------------------------------------------------------------
+
+"""
+Writes a synthetic combined export (in memory, no API calls) with:
+
+- a single json.dumps of the whole list (the original way of writing the combined file)
+- the streaming JSON sink encoding inline (--serialize_workers 0)
+- the streaming JSON sink encoding in process pools of increasing size (--serialize_workers N)
+
+and checks that every variant produces the same bytes. Exits with status 1 on a mismatch.
+
+Each pool is reported with its speedup over json.dumps and over a pool of 1 process, and its
+efficiency (speedup over 1 process divided by the pool size), which is what shows how the
+encoding scales with cores. Pools larger than the number of CPUs are still measured by default
+up to 4 processes, but marked: they share cores, so they show the overhead of the pool rather
+than its scaling.
+
+Usage:
+    python benchmarks/benchmark_serialization.py [--playlists 400] [--tracks 500] [--workers 1,2,4,8]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import my_spotify_playlists_downloader as downloader  # noqa: E402
+
+
+def build_library(playlists: int, tracks: int) -> list:
+    """Build playlist objects in the export format, with non-ASCII names as in real libraries."""
+    return [
+        {
+            'playlist_name': f"Playlist {p} – été",
+            'playlist_id': f"mockplaylist{p:06d}",
+            'owner_id': 'mock_user',
+            'owner': 'Mock User',
+            'description': '',
+            'snapshot_id': f"snap{p}",
+            'tracks': [
+                {
+                    'position': t,
+                    'name': f"Track {t} «{p}»",
+                    'artist': f"Artist {(p * 31 + t) % 997}",
+                    'artists': [f"Artist {(p * 31 + t) % 997}"],
+                    'album': f"Album {(p * 7 + t) % 3331}",
+                    'album_release_date': f"{1960 + t % 65}-01-01",
+                    'spotify_url': f"https://open.spotify.com/track/mock{p:04d}{t:06d}",
+                    'spotify_uri': f"spotify:track:mock{p:04d}{t:06d}",
+                    'added_at': f"20{10 + t % 15:02d}-01-01T00:00:00Z",
+                    'added_by': 'mock_user',
+                }
+                for t in range(tracks)
+            ],
+        }
+        for p in range(playlists)
+    ]
+
+
+def write_with_sink(library: list, path: Path, workers: int) -> float:
+    """Write the combined file through the JSON sink and return the elapsed seconds."""
+    start = time.perf_counter()
+    pool = downloader.create_serialization_pool(workers) if workers else None
+    try:
+        sink = downloader.JsonSink(path, executor=pool)
+        for playlist_obj in library:
+            sink.write_playlist(playlist_obj)
+        sink.close()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serialization of the combined JSON export")
+    parser.add_argument('--playlists', type=int, default=400)
+    parser.add_argument('--tracks', type=int, default=500, help='Tracks per playlist')
+    parser.add_argument('--workers', type=str, default=None,
+                        help='Comma-separated pool sizes (default: 1, 2, 4... up to the number of CPUs, at least up to 4)')
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    pool_sizes = [int(w) for w in args.workers.split(',')] if args.workers else \
+        [w for w in (1, 2, 4, 8, 16, 32) if w <= max(cpus, 4)]
+
+    library = build_library(args.playlists, args.tracks)
+    print(f"{args.playlists} playlists x {args.tracks} tracks, {cpus} CPUs")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        start = time.perf_counter()
+        reference = json.dumps(library, ensure_ascii=False, indent=4).encode('utf-8')
+        (tmp_dir / 'reference.json').write_bytes(reference)
+        baseline = time.perf_counter() - start
+        print(f"json.dumps (single call):  {baseline:7.2f} s  ({len(reference) / 1e6:.0f} MB)")
+
+        failed = False
+        single_process = None
+        for workers in [0] + pool_sizes:
+            path = tmp_dir / f"sink_{workers}.json"
+            elapsed = write_with_sink(library, path, workers)
+            identical = path.read_bytes() == reference
+            failed |= not identical
+            label = "inline" if workers == 0 else f"{workers} processes"
+            scaling = ""
+            if workers == 1:
+                single_process = elapsed
+            if workers and single_process is not None:
+                speedup = single_process / elapsed
+                scaling = f"  x{speedup:4.1f} vs 1 process, {speedup / workers:4.0%} efficiency"
+                if workers > cpus:
+                    scaling += " (more processes than CPUs)"
+            print(f"JSON sink, {label:12s} {elapsed:7.2f} s  x{baseline / elapsed:4.1f}  "
+                  f"{'identical' if identical else 'DIFFERENT'}{scaling}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -----------------------------------------------------------------------------
+# benchmarks/benchmark_startup.py
+#
+# Startup-time benchmark for my_spotify_playlists_downloader.py.
+#
+# License: MIT
+# -----------------------------------------------------------------------------
+
+"""
+Measures, in fresh interpreter processes:
+
+- interpreter baseline (`python -c pass`)
+- importing the script module
+- `--help`
+- time to first API request (import + client creation + one call against the local mock server)
+
+It also checks that importing the module does not import spotipy or dotenv, and exits with
+status 1 when that happens or when the import overhead exceeds --max_import_ms.
+
+Usage:
+    python benchmarks/benchmark_startup.py [--runs 10] [--max_import_ms 150]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+SCRIPT = REPO_DIR / "my_spotify_playlists_downloader.py"
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from mock_spotify_server import start_mock_server  # noqa: E402
+
+FIRST_REQUEST_SNIPPET = """
+import sys
+import my_spotify_playlists_downloader as m
+
+def factory():
+    import spotipy
+    sp = spotipy.Spotify(auth="mock-token")
+    sp.prefix = sys.argv[1]
+    return sp
+
+sp = m.LazySpotifyClient(factory)
+sp.current_user_playlists(limit=1)
+"""
+
+HEAVY_MODULES_CHECK = """
+import sys
+import my_spotify_playlists_downloader
+heavy = [name for name in ('spotipy', 'dotenv', 'requests', 'urllib3') if name in sys.modules]
+print(','.join(heavy))
+"""
+
+
+def _time_command(cmd: list, runs: int) -> float:
+    """Run a command `runs` times and return the median wall time in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=REPO_DIR, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark startup time of the downloader script")
+    parser.add_argument('--runs', type=int, default=10, help='Runs per measurement (median is reported)')
+    parser.add_argument('--max_import_ms', type=float, default=150.0,
+                        help='Fail if importing the module costs more than this over the baseline')
+    args = parser.parse_args()
+
+    server, prefix = start_mock_server(playlists=1, tracks_per_playlist=1, saved_tracks=1)
+    try:
+        baseline = _time_command([sys.executable, "-c", "pass"], args.runs)
+        import_ms = _time_command([sys.executable, "-c", "import my_spotify_playlists_downloader"], args.runs)
+        help_ms = _time_command([sys.executable, str(SCRIPT), "--help"], args.runs)
+        first_request_ms = _time_command([sys.executable, "-c", FIRST_REQUEST_SNIPPET, prefix], args.runs)
+    finally:
+        server.shutdown()
+
+    heavy = subprocess.run([sys.executable, "-c", HEAVY_MODULES_CHECK], cwd=REPO_DIR, check=True,
+                           capture_output=True, text=True).stdout.strip()
+
+    print(f"Interpreter baseline:   {baseline:8.1f} ms")
+    print(f"Import module:          {import_ms:8.1f} ms  (+{import_ms - baseline:.1f} ms)")
+    print(f"--help:                 {help_ms:8.1f} ms  (+{help_ms - baseline:.1f} ms)")
+    print(f"Time to first request:  {first_request_ms:8.1f} ms  (+{first_request_ms - baseline:.1f} ms)")
+    print(f"Heavy modules at import: {heavy or 'none'}")
+
+    if heavy or import_ms - baseline > args.max_import_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -----------------------------------------------------------------------------
+# benchmarks/mock_spotify_server.py
+#
+# Minimal local stand-in for the Spotify Web API used by the benchmarks.
+#
+# License: MIT
+# -----------------------------------------------------------------------------
+
+"""
+Serves a synthetic library (playlists, playlist details and items, saved tracks, albums, shows and
+episodes, followed artists, top items and the current user) with the same paging shape as the
+Spotify Web API (offset paging, and cursor paging for followed artists), so benchmarks can run offline.
+
+Usage:
+    python benchmarks/mock_spotify_server.py [--port 8765] [--playlists 50] [--tracks 200] [--latency_ms 0]
+
+Responses are gzip-compressed when the client accepts it, and the number of TCP connections
+opened by clients is counted in `server.connections` (to observe connection reuse).
+
+Point a spotipy client at it with:
+    sp = spotipy.Spotify(auth="mock-token")
+    sp.prefix = "http://127.0.0.1:8765/v1/"
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PAGE_LIMIT_DEFAULT = 50
+
+
+def _track_item(index: int) -> dict:
+    """Build one synthetic playlist/saved-track item."""
+    return {
+        'added_at': f"20{10 + index % 15:02d}-{1 + index % 12:02d}-01T00:00:00Z",
+        'added_by': {'id': 'mock_user'},
+        'track': {
+            'name': f"Track {index}",
+            'uri': f"spotify:track:mock{index:08d}",
+            'external_urls': {'spotify': f"https://open.spotify.com/track/mock{index:08d}"},
+            'artists': [{'name': f"Artist {index % 97}"}],
+            'album': {'name': f"Album {index % 331}", 'release_date': f"{1960 + index % 65}-01-01"},
+        },
+    }
+
+
+def _artist_item(index: int) -> dict:
+    """Build one synthetic artist."""
+    return {
+        'name': f"Artist {index}",
+        'uri': f"spotify:artist:mock{index:08d}",
+        'external_urls': {'spotify': f"https://open.spotify.com/artist/mock{index:08d}"},
+        'genres': [f"genre {index % 7}"],
+    }
+
+
+def _album_item(index: int) -> dict:
+    """Build one synthetic saved album."""
+    return {
+        'added_at': f"20{10 + index % 15:02d}-01-01T00:00:00Z",
+        'album': {
+            'name': f"Album {index}",
+            'uri': f"spotify:album:mock{index:08d}",
+            'external_urls': {'spotify': f"https://open.spotify.com/album/mock{index:08d}"},
+            'artists': [{'name': f"Artist {index % 97}"}],
+            'release_date': f"{1960 + index % 65}-01-01",
+        },
+    }
+
+
+def _show(index: int) -> dict:
+    return {
+        'name': f"Show {index}",
+        'publisher': f"Publisher {index % 13}",
+        'uri': f"spotify:show:mock{index:08d}",
+        'external_urls': {'spotify': f"https://open.spotify.com/show/mock{index:08d}"},
+    }
+
+
+def _show_item(index: int) -> dict:
+    """Build one synthetic saved show."""
+    return {'added_at': "2020-01-01T00:00:00Z", 'show': _show(index)}
+
+
+def _episode_item(index: int) -> dict:
+    """Build one synthetic saved episode."""
+    return {
+        'added_at': "2021-01-01T00:00:00Z",
+        'episode': {
+            'name': f"Episode {index}",
+            'release_date': "2021-01-01",
+            'uri': f"spotify:episode:mock{index:08d}",
+            'external_urls': {'spotify': f"https://open.spotify.com/episode/mock{index:08d}"},
+            'show': _show(index % 5),
+        },
+    }
+
+
+class MockSpotifyLibrary:
+    """Synthetic library served by the mock server."""
+
+    def __init__(self, playlists: int, tracks_per_playlist: int, saved_tracks: int, collection_items: int = 30):
+        self.playlists = [
+            {
+                'id': f"mockplaylist{i:06d}",
+                'name': f"Mock Playlist {i}",
+                'description': '',
+                'snapshot_id': f"snap{i}",
+                'owner': {'id': 'mock_user', 'display_name': 'Mock User'},
+                'tracks': {'total': tracks_per_playlist},
+            }
+            for i in range(playlists)
+        ]
+        self.tracks_per_playlist = tracks_per_playlist
+        self.saved_tracks = saved_tracks
+        self.collection_items = collection_items
+
+
+def _page(base_url: str, path: str, items_total: int, offset: int, limit: int, build_item) -> dict:
+    """Build an offset-paginated response with a `next` link like the real API."""
+    end = min(offset + limit, items_total)
+    next_url = f"{base_url}{path}?offset={end}&limit={limit}" if end < items_total else None
+    return {
+        'href': f"{base_url}{path}?offset={offset}&limit={limit}",
+        'items': [build_item(i) for i in range(offset, end)],
+        'limit': limit,
+        'next': next_url,
+        'offset': offset,
+        'previous': None,
+        'total': items_total,
+    }
+
+
+COLLECTION_ITEMS = {
+    '/v1/me/albums': _album_item,
+    '/v1/me/shows': _show_item,
+    '/v1/me/episodes': _episode_item,
+    '/v1/me/top/tracks': lambda i: _track_item(i)['track'],
+    '/v1/me/top/artists': _artist_item,
+}
+
+
+def make_handler(library: MockSpotifyLibrary, latency_ms: float):
+    """Create a request handler class bound to the given library."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):  # noqa: A002 - signature defined by the base class
+            pass
+
+        def setup(self):
+            super().setup()
+            with self.server.connections_lock:
+                self.server.connections += 1
+
+        def do_GET(self):
+            if latency_ms:
+                time.sleep(latency_ms / 1000.0)
+            parsed = urlparse(self.path)
+            query = parse_qs(parsed.query)
+            offset = int(query.get('offset', ['0'])[0])
+            limit = int(query.get('limit', [str(PAGE_LIMIT_DEFAULT)])[0])
+            base_url = f"http://{self.headers.get('Host')}"
+            path = parsed.path.rstrip('/')
+
+            if path == '/v1/me':
+                body = {'id': 'mock_user', 'display_name': 'Mock User'}
+            elif path == '/v1/me/playlists':
+                body = _page(base_url, path, len(library.playlists), offset, limit,
+                             lambda i: library.playlists[i])
+            elif path == '/v1/me/tracks':
+                body = _page(base_url, path, library.saved_tracks, offset, limit, _track_item)
+            elif path in COLLECTION_ITEMS:
+                body = _page(base_url, path, library.collection_items, offset, limit, COLLECTION_ITEMS[path])
+            elif path == '/v1/me/following':
+                # Cursor paging: 'after' is the ID of the last artist of the previous page
+                after = query.get('after', [''])[0]
+                start = int(after.replace('mockartist', '')) + 1 if after else 0
+                end = min(start + limit, library.collection_items)
+                body = {'artists': {
+                    'items': [_artist_item(i) for i in range(start, end)],
+                    'limit': limit,
+                    'next': f"{base_url}{path}?type=artist&after=mockartist{end - 1}&limit={limit}"
+                            if end < library.collection_items else None,
+                    'cursors': {'after': f"mockartist{end - 1}" if end < library.collection_items else None},
+                    'total': library.collection_items,
+                }}
+            elif path.startswith('/v1/playlists/') and path.count('/') == 3:
+                playlist_id = path.rsplit('/', 1)[1]
+                matches = [p for p in library.playlists if p['id'] == playlist_id]
+                if not matches:
+                    self.send_error(404)
+                    return
+                body = matches[0]
+            elif path.startswith('/v1/playlists/') and path.endswith('/tracks'):
+                body = _page(base_url, path, library.tracks_per_playlist, offset, limit, _track_item)
+            else:
+                self.send_error(404)
+                return
+
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                payload = gzip.compress(payload, compresslevel=5)
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    return Handler
+
+
+def start_mock_server(playlists: int = 50, tracks_per_playlist: int = 200, saved_tracks: int = 500,
+                      latency_ms: float = 0, port: int = 0, collection_items: int = 30):
+    """
+    Start the mock server in a background thread.
+
+    Returns:
+        tuple: (server, api_prefix) where api_prefix is suitable for `spotipy.Spotify.prefix`.
+    """
+    library = MockSpotifyLibrary(playlists, tracks_per_playlist, saved_tracks, collection_items)
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(library, latency_ms))
+    server.daemon_threads = True
+    server.connections = 0
+    server.connections_lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1/"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a mock Spotify Web API server for benchmarks")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--playlists', type=int, default=50)
+    parser.add_argument('--tracks', type=int, default=200, help='Tracks per playlist')
+    parser.add_argument('--saved_tracks', type=int, default=500)
+    parser.add_argument('--latency_ms', type=float, default=0, help='Artificial latency per request')
+    args = parser.parse_args()
+
+    server, prefix = start_mock_server(args.playlists, args.tracks, args.saved_tracks, args.latency_ms, args.port)
+    print(f"Mock Spotify API listening at {prefix} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -23,16 +23,51 @@
 my_spotify_playlists_downloader.py
 
 Usage:
-    python my_spotify_playlists_downloader.py [--split] [--output_dir /path/to/dir] [--playlist_name "Playlist Name"] [--liked_songs] [--all_playlists] [--html_report] [--clean_output]
+    python my_spotify_playlists_downloader.py [--split] [--output_dir /path/to/dir] [--playlist_name "Playlist Name"] [--playlist_glob PATTERN] [--playlist_regex REGEX] [--playlist_ids_file FILE] [--liked_songs] [--saved_albums] [--saved_shows] [--saved_episodes] [--followed_artists] [--top_tracks] [--top_artists] [--top_time_range RANGE] [--all_playlists] [--html_report] [--clean_output] [--changelog] [--archive] [--archive_dir DIR] [--list_archive] [--restore_run RUN_ID] [--search_index] [--search QUERY] [--search_field FIELD] [--formats LIST] [--serialize_workers N] [--incremental] [--writer_threads N] [--shard_split] [--workers N] [--http_compression MODE] [--watch] [--poll_interval SECONDS] [--max_poll_interval SECONDS] [--watch_cycles N] [--batch_config FILE] [--batch_workers N] [--batch_max_rps N] [--offline_report] [--profile]
 
 Options:
     --split                    Export each playlist as an individual JSON file named after the playlist (sanitized).
+                               Playlists whose names would produce the same file name get their ID appended.
     --output_dir DIR           Override the output directory path defined in .env or default.
-    --playlist_name NAME       Export only the playlist with this name (case-insensitive, normalized).
+    --playlist_name NAME       Export only the playlist with this name (case-insensitive, normalized). Can be repeated.
+    --playlist_glob PATTERN    Export playlists whose normalized name matches a glob pattern (e.g. "rock*"). Can be repeated.
+    --playlist_regex REGEX     Export playlists whose name matches a regular expression (case-insensitive). Can be repeated.
+    --playlist_ids_file FILE   Export the playlists listed in a file (IDs, spotify:playlist: URIs or URLs, one per line).
     --liked_songs              Export liked songs (saved tracks). Can be combined with --playlist_name or --all_playlists.
+    --saved_albums             Export saved albums. Like --liked_songs, can be combined with playlist options.
+    --saved_shows              Export saved podcasts and shows.
+    --saved_episodes           Export saved episodes.
+    --followed_artists         Export followed artists.
+    --top_tracks               Export your top tracks.
+    --top_artists              Export your top artists.
+    --top_time_range RANGE     Period of the top items: short_term, medium_term (default) or long_term.
     --all_playlists            Export all playlists. Can be combined with --liked_songs.
     --html_report              Generate a HTML report with export summary and statistics.
-    --clean_output             Delete all JSON files in the output directory before exporting playlists.
+    --clean_output             Delete all export files (JSON, CSV, M3U, XSPF) in the output directory before exporting playlists.
+    --changelog                Compare with the previous export and write a changelog (added/removed/moved tracks).
+    --archive                  Store this export in the history archive (unchanged playlists are stored only once).
+    --archive_dir DIR          Override the archive directory defined in .env or default (<output_dir>/archive).
+    --list_archive             List the runs stored in the history archive.
+    --restore_run RUN_ID       Write the files of an archived run into the output directory.
+    --search_index             Update the local search index (used by --search) after exporting.
+    --search QUERY             Find the exported playlists containing tracks matching QUERY (no API calls).
+    --search_field FIELD       Restrict --search to track, artist or album names (default: any).
+    --formats LIST             Comma-separated export formats written in one pass: json, csv, m3u, xspf (default: json).
+    --serialize_workers N      Without --split, processes encoding the combined JSON file in parallel (default: 0 = inline).
+    --incremental              Without --split, copy playlists unchanged since the previous combined file instead of downloading them.
+    --writer_threads N         In --split mode, threads writing files in the background (default: 2, 0 = inline).
+    --shard_split              In --split mode, place playlist files in subdirectories 00-ff.
+    --workers N                Number of playlists (or pages of a collection) fetched concurrently (default: 1); sizes the HTTP connection pool.
+    --http_compression MODE    Response compression: auto (default), gzip or off.
+    --watch                    Keep running and rewrite only playlists/liked songs that changed since the last poll.
+    --poll_interval SECONDS    Seconds between polls in --watch mode (default: 300), doubled while idle.
+    --max_poll_interval SECONDS  Longest wait between polls when idle (default: 3600).
+    --watch_cycles N           Stop --watch mode after N polls (default: run until interrupted).
+    --batch_config FILE        Export several accounts listed in a JSON file, in parallel processes.
+    --batch_workers N          Maximum number of accounts exported at the same time (default: 2).
+    --batch_max_rps N          Global API requests per second shared by all batch workers (default: no limit).
+    --offline_report           Generate the HTML report from existing exports in the output directory (no API calls).
+    --profile                  Write a CPU and memory allocation profile of each phase of the run next to the log file.
 
 Examples:
     python my_spotify_playlists_downloader.py                                    # Export all playlists
@@ -42,21 +77,54 @@ Examples:
     python my_spotify_playlists_downloader.py --liked_songs --all_playlists      # Export liked songs + all playlists
     python my_spotify_playlists_downloader.py --all_playlists                    # Export all playlists (same as no flags)
     python my_spotify_playlists_downloader.py --all_playlists --html_report      # Export all playlists + generate HTML report
+    python my_spotify_playlists_downloader.py --saved_albums --followed_artists  # Export saved albums and followed artists only
+    python my_spotify_playlists_downloader.py --playlist_name "Rock" --playlist_glob "chill*"  # Export "Rock" + playlists starting with "chill"
+    python my_spotify_playlists_downloader.py --offline_report                   # Rebuild the HTML report from existing exports
+    python my_spotify_playlists_downloader.py --split --formats json,csv,m3u     # Export JSON, CSV and M3U files in one pass
+    python my_spotify_playlists_downloader.py --search "daft punk" --search_field artist  # Playlists with songs by Daft Punk
+    python my_spotify_playlists_downloader.py --incremental                      # Download only playlists changed since the last export
 """
 
+from __future__ import annotations
+
 import argparse
+import itertools
 import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from html import escape
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import spotipy
 import unicodedata
-from dotenv import load_dotenv
-from spotipy.oauth2 import SpotifyOAuth
+
+# spotipy, dotenv and their HTTP stack are imported lazily (see load_env and
+# create_spotify_client) so that --help and offline operations start fast.
+if TYPE_CHECKING:
+    import spotipy
+
+SPOTIFY_SCOPE = "playlist-read-private user-library-read"
+
+# HTTP session tuning (see create_http_session)
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = 15
+HTTP_RETRIES = 3
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+HTTP_MIN_POOL_SIZE = 10
+
+# Pagination (see iter_paginated): retries of a failed page on top of the HTTP-level retries
+PAGE_RETRIES = 2
+PAGE_RETRY_BACKOFF = 1.0
+
+# Fields requested for playlist items, so the API only sends what the export uses
+PLAYLIST_ITEMS_FIELDS = ("items(added_at,added_by.id,track(name,uri,external_urls.spotify,artists(name),"
+                         "album(name,release_date))),limit,next,offset,total")
 
 # Ensure minimum Python version for compatibility
 if sys.version_info < (3, 10):
@@ -64,52 +132,65 @@ if sys.version_info < (3, 10):
     sys.exit(1)
 
 
-def load_env():
+REQUIRED_ENV_VARS = ["SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET", "SPOTIFY_REDIRECT_URI"]
+
+
+def load_env(require_credentials: bool = True):
     """
     Load and validate required and optional environment variables from .env file.
 
+    Args:
+        require_credentials (bool): Validate the Spotify credentials now. When False, missing
+            credentials are stored as empty strings and validated later by create_spotify_client.
+
     Returns:
         dict: Dictionary containing configuration variables.
     Raises:
         ValueError: If any required variable is missing or empty.
     """
+    from dotenv import load_dotenv
+
     load_dotenv()
-    required_vars = ["SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET", "SPOTIFY_REDIRECT_URI"]
     config = {}
 
-    for var in required_vars:
+    for var in REQUIRED_ENV_VARS:
         val = os.getenv(var)
-        if not val or not val.strip():
+        if require_credentials and (not val or not val.strip()):
             raise ValueError(f"Missing required environment variable: {var}")
-        config[var] = val.strip()
+        config[var] = (val or "").strip()
 
     # Optional variables
     config["OUTPUT_DIR"] = os.getenv("OUTPUT_DIR", "").strip()
     config["OUTPUT_PREFIX_SPLIT"] = os.getenv("OUTPUT_PREFIX_SPLIT", "").strip()
     config["OUTPUT_PREFIX_SINGLE"] = os.getenv("OUTPUT_PREFIX_SINGLE", "").strip()
     config["LOG_DIR"] = os.getenv("LOG_DIR", "").strip()
+    config["ARCHIVE_DIR"] = os.getenv("ARCHIVE_DIR", "").strip()
+    config["SPOTIFY_CACHE_PATH"] = os.getenv("SPOTIFY_CACHE_PATH", "").strip()
     config["LOG_LEVEL"] = os.getenv("LOG_LEVEL", "INFO").strip().upper() or "INFO"
 
     return config
 
 
-def setup_logging(log_dir: Path, log_level: str):
+def setup_logging(log_dir: Path, log_level: str, log_filename: str = "my_spotify_playlists_downloader.log",
+                  tag: str = ""):
     """
     Configure logging to output to console and to a log file in the specified directory.
 
     Args:
         log_dir (Path): Directory where the log file will be saved.
         log_level (str): Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+        log_filename (str): Name of the log file.
+        tag (str): Optional text prepended to every message (e.g. the account name in batch mode).
 
     Returns:
         Logger: Configured logger instance.
     """
     log_dir.mkdir(parents=True, exist_ok=True)
-    logfile_path = log_dir / "my_spotify_playlists_downloader.log"
+    logfile_path = log_dir / log_filename
 
     logging.basicConfig(
         level=log_level,
-        format="%(asctime)s [%(levelname)s] %(message)s",
+        format=f"%(asctime)s [%(levelname)s] {tag}%(message)s",
         handlers=[
             logging.StreamHandler(sys.stdout),
             logging.FileHandler(logfile_path, encoding='utf-8')
@@ -120,6 +201,354 @@ def setup_logging(log_dir: Path, log_level: str):
     return logger
 
 
+# Profiling of a run with --profile (see RunProfiler)
+PROFILE_TOP_N = 25
+PROFILE_TRACEBACK_FRAMES = 1
+
+
+class RunProfiler:
+    """
+    CPU profile (cProfile) and allocation sites (tracemalloc) of a run, broken down by phase.
+
+    The run is divided into consecutive phases: begin_phase() ends the current phase and
+    starts the next one, so every call and allocation of the main thread is attributed to
+    exactly one phase. A phase started again (e.g. in a loop) accumulates. Only the main thread
+    is in the CPU profile; allocations are traced in every thread.
+
+    stop() writes, in a profile_<timestamp> directory next to the log file:
+        - <phase>.prof and run.prof: cProfile statistics (pstats, snakeviz...) per phase and for the run
+        - summary.txt: time, CPU, memory, top functions and top allocation sites per phase
+        - summary.json: the same figures, to compare runs
+    """
+
+    def __init__(self, top_n: int = PROFILE_TOP_N):
+        """
+        Args:
+            top_n (int): Number of functions and allocation sites listed per phase.
+        """
+        self.top_n = top_n
+        self.phases = {}
+        self._current = None
+        self._snapshot = None
+        self._memory = 0
+        self._peak = 0
+        self._phase_wall = 0.0
+        self._phase_cpu = 0.0
+
+    def start(self):
+        """Start tracing allocations and the first phase ('startup')."""
+        import tracemalloc
+        from datetime import datetime
+
+        self._started_at = datetime.now()
+        self._run_wall = time.perf_counter()
+        self._run_cpu = time.process_time()
+        tracemalloc.start(PROFILE_TRACEBACK_FRAMES)
+        self.begin_phase('startup')
+
+    def _take_snapshot(self):
+        import tracemalloc
+
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def _end_phase(self):
+        # Record the current phase up to now; returns the allocation snapshot taken at the boundary
+        import tracemalloc
+
+        phase = self._current
+        if phase is not None:
+            phase['profile'].disable()
+            phase['wall'] += time.perf_counter() - self._phase_wall
+            phase['cpu'] += time.process_time() - self._phase_cpu
+        memory, peak = tracemalloc.get_traced_memory()
+        snapshot = self._take_snapshot()
+        if phase is not None:
+            phase['peak'] = max(phase['peak'], peak)
+            phase['net'] += memory - self._memory
+            # Only the largest differences are kept, so the profiler's own allocations stay small
+            for stat in snapshot.compare_to(self._snapshot, 'lineno')[:self.top_n * 4]:
+                if stat.size_diff or stat.count_diff:
+                    site = phase['sites'].setdefault(str(stat.traceback[0]), [0, 0])
+                    site[0] += stat.size_diff
+                    site[1] += stat.count_diff
+        self._peak = max(self._peak, peak)
+        self._current = None
+        return snapshot, memory
+
+    def begin_phase(self, name: str):
+        """
+        End the current phase and start (or resume) the phase `name`.
+
+        Args:
+            name (str): Phase name, also used as file name of its CPU profile.
+        """
+        import cProfile
+        import tracemalloc
+
+        self._snapshot, self._memory = self._end_phase()
+        tracemalloc.reset_peak()
+        if name not in self.phases:
+            self.phases[name] = {'profile': cProfile.Profile(), 'calls': 0, 'wall': 0.0, 'cpu': 0.0,
+                                 'peak': 0, 'net': 0, 'sites': {}}
+        self._current = self.phases[name]
+        self._current['calls'] += 1
+        self._phase_wall = time.perf_counter()
+        self._phase_cpu = time.process_time()
+        self._current['profile'].enable()
+
+    def stop(self, log_dir: Path, logger) -> Path:
+        """
+        End the last phase, stop tracing and write the profile files.
+
+        The profiler starts before logging is set up, so the output location is only given here.
+
+        Args:
+            log_dir (Path): Directory of the log file, where the profile directory is created.
+            logger: Logger instance for logging.
+
+        Returns:
+            Path: Directory containing the profile files.
+        """
+        import io
+        import pstats
+        import tracemalloc
+
+        snapshot, _ = self._end_phase()
+        tracemalloc.stop()
+        run_wall = time.perf_counter() - self._run_wall
+        run_cpu = time.process_time() - self._run_cpu
+
+        profile_dir = log_dir / f"profile_{self._started_at.strftime('%Y%m%d_%H%M%S')}"
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+        summary = {
+            'started_at': self._started_at.isoformat(timespec='seconds'),
+            'argv': sys.argv[1:],
+            'wall_seconds': round(run_wall, 3),
+            'cpu_seconds': round(run_cpu, 3),
+            'peak_traced_bytes': self._peak,
+            'phases': [],
+        }
+        text = io.StringIO()
+        text.write(f"Profile of the run started {summary['started_at']}: {' '.join(summary['argv']) or '(no options)'}\n")
+        text.write(f"Wall time {run_wall:.2f} s, CPU time {run_cpu:.2f} s, "
+                   f"peak traced memory {self._peak / 2**20:.1f} MB\n\n")
+        text.write(f"{'Phase':<24} {'Wall (s)':>9} {'CPU (s)':>9} {'Peak (MB)':>10} {'Net (MB)':>9}\n")
+
+        run_stats = None
+        details = io.StringIO()
+        for name, phase in self.phases.items():
+            text.write(f"{name:<24} {phase['wall']:9.2f} {phase['cpu']:9.2f} "
+                       f"{phase['peak'] / 2**20:10.1f} {phase['net'] / 2**20:9.1f}\n")
+            phase['profile'].dump_stats(profile_dir / f"{name}.prof")
+            stats = pstats.Stats(str(profile_dir / f"{name}.prof"), stream=details)
+            run_stats = stats if run_stats is None else run_stats.add(stats)
+            top_functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:self.top_n]
+            top_sites = sorted(phase['sites'].items(), key=lambda item: item[1][0], reverse=True)[:self.top_n]
+
+            details.write(f"\n=== {name}: top functions by cumulative time ===\n")
+            stats.sort_stats('cumulative').print_stats(self.top_n)
+            details.write(f"=== {name}: top allocation sites (net growth) ===\n")
+            for site, (size, count) in top_sites:
+                details.write(f"{size / 1024:+12.1f} KiB {count:+10d} blocks  {site}\n")
+
+            summary['phases'].append({
+                'name': name,
+                'calls': phase['calls'],
+                'wall_seconds': round(phase['wall'], 3),
+                'cpu_seconds': round(phase['cpu'], 3),
+                'peak_traced_bytes': phase['peak'],
+                'net_allocated_bytes': phase['net'],
+                'top_functions': [{'function': f"{file}:{line}({function})", 'calls': calls,
+                                   'total_seconds': round(total, 6), 'cumulative_seconds': round(cumulative, 6)}
+                                  for (file, line, function), (_, calls, total, cumulative, _) in top_functions],
+                'top_allocations': [{'site': site, 'size_bytes': size, 'blocks': count}
+                                    for site, (size, count) in top_sites],
+            })
+
+        text.write("\n=== Largest live allocation sites at the end of the run ===\n")
+        for stat in snapshot.statistics('lineno')[:self.top_n]:
+            text.write(f"{stat.size / 1024:12.1f} KiB {stat.count:10d} blocks  {stat.traceback[0]}\n")
+        text.write(details.getvalue())
+
+        if run_stats is not None:
+            run_stats.dump_stats(profile_dir / "run.prof")
+        (profile_dir / "summary.txt").write_text(text.getvalue(), encoding='utf-8')
+        (profile_dir / "summary.json").write_text(json.dumps(summary, indent=2), encoding='utf-8')
+        logger.info(f"Profile saved to {profile_dir}")
+        return profile_dir
+
+
+def profile_phase(profiler: RunProfiler, name: str):
+    """
+    Start a new phase of the run profile, when profiling is enabled.
+
+    Args:
+        profiler (RunProfiler): Run profiler, or None when --profile is not used.
+        name (str): Phase name.
+    """
+    if profiler is not None:
+        profiler.begin_phase(name)
+
+
+def create_http_session(pool_size: int = HTTP_MIN_POOL_SIZE, compression: str = 'auto'):
+    """
+    Build the HTTP session shared by all Spotify API calls.
+
+    Connections are kept alive and the pool holds one connection per concurrent worker, so
+    parallel fetches reuse warm TLS connections instead of discarding them when the default
+    pool (10) is full. Retries mirror spotipy's defaults.
+
+    Args:
+        pool_size (int): Maximum number of pooled connections per host (at least 10).
+        compression (str): 'auto' (gzip/deflate, plus brotli when installed), 'gzip' or 'off'.
+
+    Returns:
+        requests.Session: Configured session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=HTTP_RETRIES,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        status=HTTP_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=HTTP_RETRY_STATUS_CODES)
+    pool_size = max(pool_size, HTTP_MIN_POOL_SIZE)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    encodings = {'off': 'identity', 'gzip': 'gzip, deflate'}.get(compression, 'gzip, deflate')
+    if compression == 'auto':
+        try:
+            import brotli  # noqa: F401 - urllib3 decodes "br" when brotli is installed
+            encodings += ', br'
+        except ImportError:
+            pass
+    session.headers.update({'Accept-Encoding': encodings, 'Connection': 'keep-alive'})
+    return session
+
+
+def create_spotify_client(config: dict, workers: int = 1, compression: str = 'auto',
+                          scope: str = SPOTIFY_SCOPE) -> spotipy.Spotify:
+    """
+    Build an authenticated Spotify client from the configuration.
+
+    Importing spotipy and creating the OAuth manager is deferred to this function, so it
+    only happens when an API call is actually needed.
+
+    Args:
+        config (dict): Configuration variables as returned by load_env.
+        workers (int): Number of threads that will call the API concurrently (sizes the connection pool).
+        compression (str): Response compression setting passed to create_http_session.
+        scope (str): OAuth scopes to request (see spotify_scope).
+
+    Returns:
+        spotipy.Spotify: Authenticated Spotify client.
+    Raises:
+        ValueError: If any required credential is missing or empty.
+    """
+    for var in REQUIRED_ENV_VARS:
+        if not config.get(var):
+            raise ValueError(f"Missing required environment variable: {var}")
+
+    import spotipy
+    from spotipy.cache_handler import CacheFileHandler
+    from spotipy.oauth2 import SpotifyOAuth
+
+    return spotipy.Spotify(
+        auth_manager=SpotifyOAuth(
+            client_id=config["SPOTIFY_CLIENT_ID"],
+            client_secret=config["SPOTIFY_CLIENT_SECRET"],
+            redirect_uri=config["SPOTIFY_REDIRECT_URI"],
+            scope=scope,
+            cache_handler=CacheFileHandler(cache_path=config["SPOTIFY_CACHE_PATH"]) if config.get("SPOTIFY_CACHE_PATH") else None
+        ),
+        requests_session=create_http_session(workers + 1, compression),
+        requests_timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+    )
+
+
+class RateLimiter:
+    """
+    Spaces calls at least `interval` seconds apart.
+
+    By default the state is local to the process. Passing a multiprocessing lock and shared
+    double value makes several processes draw from the same budget (batch mode).
+    """
+
+    def __init__(self, interval: float, lock=None, next_slot=None):
+        """
+        Args:
+            interval (float): Minimum number of seconds between two calls.
+            lock: Lock guarding next_slot (threading or multiprocessing).
+            next_slot: Object with a `value` attribute holding the next allowed call time.
+        """
+        from types import SimpleNamespace
+
+        self.interval = interval
+        self.lock = lock if lock is not None else threading.Lock()
+        self.next_slot = next_slot if next_slot is not None else SimpleNamespace(value=0.0)
+
+    def acquire(self):
+        """Block until the next call is allowed by the budget."""
+        with self.lock:
+            now = time.time()
+            slot = max(now, self.next_slot.value)
+            self.next_slot.value = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class LazySpotifyClient:
+    """
+    Stand-in for spotipy.Spotify that builds the real client on first attribute access.
+
+    Runs that never reach the API (argument errors, cleaning only, offline modes) therefore
+    never import spotipy nor go through the OAuth flow. An optional rate limiter is applied
+    before each API method call.
+    """
+
+    def __init__(self, factory, rate_limiter: RateLimiter = None):
+        """
+        Args:
+            factory (callable): Zero-argument callable returning the real Spotify client.
+            rate_limiter (RateLimiter, optional): Budget applied to every API method call.
+        """
+        self._factory = factory
+        self._client = None
+        self._rate_limiter = rate_limiter
+        self._lock = threading.Lock()
+
+    @property
+    def initialized(self) -> bool:
+        """bool: Whether the real client has already been created."""
+        return self._client is not None
+
+    def __getattr__(self, name):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._factory()
+        attr = getattr(self._client, name)
+        if self._rate_limiter is None or not callable(attr):
+            return attr
+
+        def limited(*args, **kwargs):
+            self._rate_limiter.acquire()
+            return attr(*args, **kwargs)
+        return limited
+
+
 def sanitize_filename(name: str) -> str:
     """
     Sanitize a string to create a safe filename by replacing invalid characters.
@@ -170,44 +599,404 @@ def sanitize_playlist_name(name: str) -> str:
     return name.strip()
 
 
-def get_all_playlists(sp: spotipy.Spotify, logger) -> list:
+PLAYLIST_INDEX_FILENAME = '.playlist_index.json'
+
+
+def parse_playlist_id(value: str) -> str:
+    """
+    Extract a playlist ID from an ID, a spotify:playlist: URI or an open.spotify.com URL.
+
+    Args:
+        value (str): Text identifying a playlist.
+
+    Returns:
+        str: Playlist ID, or an empty string if nothing usable was found.
+    """
+    value = value.strip()
+    if value.startswith('spotify:playlist:'):
+        return value.split(':', 2)[2]
+    if 'open.spotify.com/' in value:
+        match = re.search(r'/playlist/([A-Za-z0-9]+)', value)
+        return match.group(1) if match else ''
+    return value
+
+
+def read_playlist_ids_file(path: Path) -> list:
+    """
+    Read playlist IDs, URIs or URLs from a text file (one per line, '#' starts a comment).
+
+    Args:
+        path (Path): File to read.
+
+    Returns:
+        list: Playlist IDs in file order, without duplicates.
+    """
+    ids = []
+    for line in path.read_text(encoding='utf-8-sig').splitlines():
+        playlist_id = parse_playlist_id(line.split('#', 1)[0])
+        if playlist_id and playlist_id not in ids:
+            ids.append(playlist_id)
+    return ids
+
+
+class PlaylistSelector:
+    """
+    Selection of playlists by exact names, glob patterns, regular expressions and IDs.
+
+    Names and glob patterns are compared with normalized names (see normalize_playlist_name);
+    regular expressions are searched case-insensitively in the original name. All matchers
+    are compiled once: checking a playlist costs a set lookup for the IDs and the names, one search
+    for all glob patterns together, and one search per regular expression (each is compiled
+    on its own, so inline flags and backreferences keep their meaning).
+    """
+
+    def __init__(self, names=None, globs=None, regexes=None, ids=None):
+        """
+        Args:
+            names (list, optional): Exact playlist names.
+            globs (list, optional): Glob patterns such as "rock*".
+            regexes (list, optional): Regular expressions.
+            ids (list, optional): Playlist IDs.
+        Raises:
+            re.error: If a regular expression is invalid.
+        """
+        import fnmatch
+
+        self.names = {normalize_playlist_name(n) for n in names or [] if n and n.strip()}
+        self.globs = [normalize_playlist_name(g) for g in globs or [] if g and g.strip()]
+        self.regexes = [r for r in regexes or [] if r]
+        self.ordered_ids = list(dict.fromkeys(ids or []))
+        self.ids = set(self.ordered_ids)
+        self._glob_matcher = re.compile('|'.join(fnmatch.translate(g) for g in self.globs)) if self.globs else None
+        self._regex_matchers = [re.compile(r, re.IGNORECASE) for r in self.regexes]
+
+    @property
+    def is_empty(self) -> bool:
+        """bool: True when nothing was selected (all playlists are exported)."""
+        return not (self.names or self.globs or self.regexes or self.ids)
+
+    @property
+    def uses_patterns(self) -> bool:
+        """bool: True when glob or regex patterns are used (they always need the full listing)."""
+        return bool(self.globs or self.regexes)
+
+    def matches(self, playlist: dict) -> bool:
+        """
+        Check whether a playlist from the listing is selected.
+
+        Args:
+            playlist (dict): Playlist object with at least 'id' and 'name'.
+
+        Returns:
+            bool: True if selected.
+        """
+        if playlist['id'] in self.ids:
+            return True
+        normalized_name = normalize_playlist_name(playlist['name'])
+        if normalized_name in self.names:
+            return True
+        if self._glob_matcher is not None and self._glob_matcher.match(normalized_name):
+            return True
+        return any(matcher.search(playlist['name']) for matcher in self._regex_matchers)
+
+    def describe(self) -> str:
+        """str: Human readable description for logs."""
+        parts = []
+        if self.names:
+            parts.append(f"names {sorted(self.names)}")
+        if self.globs:
+            parts.append(f"globs {self.globs}")
+        if self.regexes:
+            parts.append(f"regexes {self.regexes}")
+        if self.ids:
+            parts.append(f"{len(self.ids)} IDs")
+        return ', '.join(parts)
+
+
+class PlaylistNameIndex:
+    """
+    Persisted map of normalized playlist names to playlist IDs.
+
+    It is refreshed every time the full playlists listing is read, and lets selections by
+    name be resolved to IDs on later runs without walking the whole listing again. The
+    original names of the listing are kept too, so split file names of a selection can be
+    chosen against all playlists (see known_playlists), as well as the split file last written
+    for each playlist, so a file superseded by a new name can be removed (see split_files).
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): JSON file holding the index.
+        """
+        self.path = path
+        self.names = {}
+        self.playlist_names = {}
+        self.split_files = {}
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            self.names = data.get('names', {})
+            self.playlist_names = data.get('playlists', {})
+            self.split_files = data.get('split_files', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({'names': self.names, 'playlists': self.playlist_names,
+                                             'split_files': self.split_files}, ensure_ascii=False),
+                                 encoding='utf-8')
+        except OSError:
+            pass
+
+    def update_from_listing(self, playlists: list):
+        """
+        Replace the index with the names of a full playlists listing and save it.
+
+        Args:
+            playlists (list): Playlist objects from get_all_playlists.
+        """
+        names = {}
+        for playlist in playlists:
+            names.setdefault(normalize_playlist_name(playlist['name']), []).append(playlist['id'])
+        self.names = names
+        self.playlist_names = {playlist['id']: playlist['name'] for playlist in playlists}
+        self._save()
+
+    def update_split_files(self, split_files: dict):
+        """
+        Record the split files just written and save the index.
+
+        Args:
+            split_files (dict): Mapping of playlist ID to file path relative to the output directory.
+        """
+        self.split_files.update(split_files)
+        self._save()
+
+    def known_playlists(self, playlists: list) -> list:
+        """
+        Playlists of the last full listing, updated with the given ones.
+
+        Args:
+            playlists (list): Playlist objects with 'id' and 'name' (e.g. the selected ones),
+                replacing the indexed entries with the same ID.
+
+        Returns:
+            list: Dictionaries with 'id' and 'name', in listing order, then the given playlists
+                that were not indexed.
+        """
+        current = {playlist['id']: playlist for playlist in playlists}
+        known = [current.pop(playlist_id, {'id': playlist_id, 'name': name})
+                 for playlist_id, name in self.playlist_names.items()]
+        return known + list(current.values())
+
+    def lookup(self, normalized_name: str) -> list:
+        """
+        Args:
+            normalized_name (str): Normalized playlist name.
+
+        Returns:
+            list: Known playlist IDs with that name (empty if unknown).
+        """
+        return self.names.get(normalized_name, [])
+
+
+def fetch_playlist_metadata(sp: spotipy.Spotify, playlist_id: str, logger):
+    """
+    Retrieve the listing-style metadata of one playlist by ID.
+
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        playlist_id (str): Spotify playlist ID.
+        logger (Logger): Logger instance for logging.
+
+    Returns:
+        dict: Playlist object like those in get_all_playlists, or None if it could not be retrieved.
+    """
+    try:
+        return sp.playlist(playlist_id, fields="id,name,description,snapshot_id,owner(id,display_name)")
+    except Exception as e:
+        logger.error(f"Failed to retrieve playlist ID {playlist_id}: {e}")
+        return None
+
+
+def select_playlists(sp: spotipy.Spotify, selector: PlaylistSelector, name_index: PlaylistNameIndex, logger,
+                     workers: int = 1) -> list:
+    """
+    Resolve the playlists to export, skipping the full listing when possible.
+
+    Selections made only of IDs and names found in the name index are fetched directly by
+    ID. Patterns, unknown names or cached names that no longer match (renamed playlists)
+    fall back to the full listing, which also refreshes the index.
+
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        selector (PlaylistSelector): Selection; None or empty exports all playlists.
+        name_index (PlaylistNameIndex): Name to ID index.
+        logger (Logger): Logger instance for logging.
+        workers (int): Number of listing pages fetched concurrently.
+
+    Returns:
+        list: Selected playlist objects in listing (or selection) order.
+    """
+    if selector is not None and not selector.is_empty and not selector.uses_patterns:
+        cached_ids = {name: name_index.lookup(name) for name in selector.names}
+        if all(cached_ids.values()):
+            wanted = list(dict.fromkeys(selector.ordered_ids + [i for ids in cached_ids.values() for i in ids]))
+            playlists = [fetch_playlist_metadata(sp, playlist_id, logger) for playlist_id in wanted]
+            if all(p is not None and selector.matches(p) for p in playlists):
+                logger.info(f"Resolved {len(playlists)} playlists by ID without listing all playlists")
+                return playlists
+            logger.info("Playlist name index is out of date, reading the full playlists listing")
+
+    playlists = get_all_playlists(sp, logger, workers)
+    name_index.update_from_listing(playlists)
+    if selector is None or selector.is_empty:
+        return playlists
+    return [p for p in playlists if selector.matches(p)]
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Tell whether a failed API call may succeed if tried again.
+
+    Connection errors, timeouts, rate limiting (429) and server errors (5xx) are transient;
+    configuration, authorization and other client errors (4xx) are not.
+
+    Args:
+        error (Exception): Error raised by the API call.
+
+    Returns:
+        bool: True if the call is worth retrying.
+    """
+    import requests
+    from spotipy.exceptions import SpotifyException
+
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                          requests.exceptions.ChunkedEncodingError)):
+        return True
+    if isinstance(error, SpotifyException):
+        return error.http_status == 429 or (error.http_status or 0) >= 500
+    return False
+
+
+def iter_paginated(fetch_page, logger, source_description: str, page_size: int = 50, workers: int = 1,
+                   cursor: bool = False, container: str = None, project=None, retries: int = PAGE_RETRIES):
+    """
+    Iterate over the items of a paginated Spotify collection, in order.
+
+    Offset-paginated collections are read by offset: the first page gives the total, and the
+    remaining pages are then fetched by up to `workers` threads, keeping only a small window
+    of pages ahead of the consumer. Cursor-paginated collections (cursor=True, e.g. followed
+    artists) are read one page after the other, following the `after` cursor. A page that
+    fails with a transient error (see is_transient_error) is retried with exponential backoff
+    before the error is raised; other errors are raised at once.
+
+    Args:
+        fetch_page (callable): Called with limit and offset (or limit and after, for cursor
+            pagination) keyword arguments; returns the API response.
+        logger (Logger): Logger instance for logging.
+        source_description (str): Description of the collection for logging.
+        page_size (int): Items requested per page (the API maximum for the endpoint).
+        workers (int): Number of pages fetched concurrently (offset pagination only).
+        cursor (bool): Whether the collection uses cursor pagination.
+        container (str, optional): Key of the paging object in the response (e.g. 'artists').
+        project (callable, optional): Applied to each item (in the fetching thread) before it is yielded.
+        retries (int): Attempts after the first one for each page.
+
+    Yields:
+        Items of the collection, projected if `project` is given.
+    Raises:
+        Exception: The error of the last attempt when a page cannot be fetched.
+    """
+    def fetch(**page_args):
+        for attempt in range(retries + 1):
+            try:
+                page = fetch_page(**page_args)
+                break
+            except Exception as e:
+                if attempt == retries or not is_transient_error(e):
+                    raise
+                logger.warning(f"Retrying page of {source_description} ({page_args}) after error: {e}")
+                time.sleep(PAGE_RETRY_BACKOFF * 2 ** attempt)
+        page = ((page or {}).get(container) if container else page) or {}
+        items = page.get('items') or []
+        return page, [project(item) for item in items] if project is not None else items
+
+    if cursor:
+        after = None
+        while True:
+            page, items = fetch(limit=page_size, after=after)
+            yield from items
+            after = (page.get('cursors') or {}).get('after')
+            if not (page.get('next') and after and items):
+                return
+
+    page, items = fetch(limit=page_size, offset=0)
+    yield from items
+    limit = page.get('limit') or page_size
+    total = page.get('total')
+
+    if total is None or workers <= 1:
+        offset = 0
+        while page.get('next') and items:
+            offset += limit
+            page, items = fetch(limit=limit, offset=offset)
+            yield from items
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    offsets = iter(range(limit, total, limit))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='page') as executor:
+        pending = deque(executor.submit(fetch, limit=limit, offset=offset)
+                        for offset in itertools.islice(offsets, workers * 2))
+        while pending:
+            page, items = pending.popleft().result()
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(executor.submit(fetch, limit=limit, offset=next_offset))
+            yield from items
+
+
+def get_all_playlists(sp: spotipy.Spotify, logger, workers: int = 1) -> list:
     """
     Retrieve all playlists from the current user's Spotify account.
 
     Args:
         sp (spotipy.Spotify): Authenticated Spotify client.
         logger (Logger): Logger instance for logging.
+        workers (int): Number of listing pages fetched concurrently.
 
     Returns:
         list: List of playlist objects.
     """
-    playlists = []
-    results = sp.current_user_playlists()
-    while results:
-        playlists.extend(results['items'])
-        results = sp.next(results) if results['next'] else None
+    playlists = list(iter_paginated(lambda **page: sp.current_user_playlists(**page), logger, "playlists listing",
+                                    page_size=50, workers=workers))
     logger.info(f"Retrieved {len(playlists)} playlists from account.")
     return playlists
 
 
-def _process_tracks_data(sp: spotipy.Spotify, tracks_data, logger, source_description: str) -> list:
+def _process_tracks_data(items, logger, source_description: str) -> list:
     """
     Generic function to process tracks data from any Spotify source.
     
     Args:
-        sp (spotipy.Spotify): Authenticated Spotify client for pagination
-        tracks_data: Initial tracks data from Spotify API (playlist_items or current_user_saved_tracks)
+        items: Iterable of playlist or saved track items (see iter_paginated)
         logger: Logger instance for logging
         source_description (str): Description of the source for logging (e.g., "playlist ID xyz", "liked songs")
     
     Returns:
         list: List of track dictionaries with selected metadata
+    Raises:
+        Exception: The error of a page that could not be fetched after retries; a partial list
+            is never returned, so it cannot be exported as the complete playlist.
     """
     tracks = []
     track_index = 0
 
-    while tracks_data:
-        items = tracks_data.get('items', [])
+    try:
         for item in items:
             track = item.get('track')
             if not track:
@@ -218,7 +1007,8 @@ def _process_tracks_data(sp: spotipy.Spotify, tracks_data, logger, source_descri
                 # Safely extract track data with fallbacks
                 track_name = track.get('name', 'Unknown Track')
                 artists = track.get('artists', [])
-                artist_names = ', '.join([artist.get('name', 'Unknown Artist') for artist in artists if artist.get('name')])
+                artist_list = [artist.get('name') for artist in artists if artist.get('name')]
+                artist_names = ', '.join(artist_list)
                 if not artist_names:
                     artist_names = 'Unknown Artist'
                 
@@ -238,6 +1028,7 @@ def _process_tracks_data(sp: spotipy.Spotify, tracks_data, logger, source_descri
                     'position': track_index,
                     'name': track_name,
                     'artist': artist_names,
+                    'artists': artist_list,
                     'album': album_name,
                     'album_release_date': album_release_date,
                     'spotify_url': spotify_url,
@@ -250,18 +1041,15 @@ def _process_tracks_data(sp: spotipy.Spotify, tracks_data, logger, source_descri
             except Exception as e:
                 logger.warning(f"Error processing track at position {track_index} from {source_description}: {e}")
                 continue
-
-        # Get next page of results
-        try:
-            tracks_data = sp.next(tracks_data) if tracks_data and tracks_data.get('next') else None
-        except:
-            tracks_data = None
+    except Exception as e:
+        logger.error(f"Failed to retrieve tracks from {source_description} ({len(tracks)} retrieved): {e}")
+        raise
 
     logger.debug(f"Retrieved {len(tracks)} tracks from {source_description}.")
     return tracks
 
 
-def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, logger) -> list:
+def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, logger, workers: int = 1) -> list:
     """
     Retrieve all tracks from a specific playlist by ID.
 
@@ -269,117 +1057,389 @@ def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, logger) -> list:
         sp (spotipy.Spotify): Authenticated Spotify client.
         playlist_id (str): Spotify playlist ID.
         logger (Logger): Logger instance for logging.
+        workers (int): Number of pages fetched concurrently.
 
     Returns:
         list: List of track dictionaries with selected metadata.
+    Raises:
+        Exception: When a page of the playlist cannot be fetched (see _process_tracks_data).
+    """
+    items = iter_paginated(lambda **page: sp.playlist_items(playlist_id, fields=PLAYLIST_ITEMS_FIELDS, **page),
+                           logger, f"playlist ID {playlist_id}", page_size=100, workers=workers)
+    return _process_tracks_data(items, logger, f"playlist ID {playlist_id}")
+
+
+def try_get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, logger, workers: int = 1) -> list:
+    """
+    Like get_playlist_tracks, but returns None instead of raising when the playlist cannot be
+    fetched completely (the error is logged), so callers can skip it and keep its previous export.
+
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        playlist_id (str): Spotify playlist ID.
+        logger (Logger): Logger instance for logging.
+        workers (int): Number of pages fetched concurrently.
+
+    Returns:
+        list: List of track dictionaries, or None if the playlist could not be fetched.
     """
     try:
-        tracks_data = sp.playlist_items(playlist_id)
-    except Exception as e:
-        logger.error(f"Failed to retrieve playlist items for playlist ID {playlist_id}: {e}")
-        return []
-    
-    return _process_tracks_data(sp, tracks_data, logger, f"playlist ID {playlist_id}")
+        return get_playlist_tracks(sp, playlist_id, logger, workers)
+    except Exception:
+        return None
 
 
-def get_user_saved_tracks(sp: spotipy.Spotify, logger) -> list:
+def get_user_saved_tracks(sp: spotipy.Spotify, logger, workers: int = 1) -> list:
     """
     Retrieve all liked songs (saved tracks) from the current user.
 
     Args:
         sp (spotipy.Spotify): Authenticated Spotify client.
         logger (Logger): Logger instance for logging.
+        workers (int): Number of pages fetched concurrently.
 
     Returns:
         list: List of track dictionaries with selected metadata.
+    Raises:
+        Exception: When a page of liked songs cannot be fetched (see _process_tracks_data).
     """
-    try:
-        tracks_data = sp.current_user_saved_tracks()
-    except Exception as e:
-        logger.error(f"Failed to retrieve user saved tracks: {e}")
-        return []
-    
-    return _process_tracks_data(sp, tracks_data, logger, "liked songs")
+    items = iter_paginated(lambda **page: sp.current_user_saved_tracks(**page), logger, "liked songs",
+                           page_size=50, workers=workers)
+    return _process_tracks_data(items, logger, "liked songs")
 
 
-def generate_html_report(report_data: dict, output_dir: Path, logger) -> Path:
+def _artist_list(artists: list) -> list:
+    return [a.get('name') for a in artists or [] if a and a.get('name')]
+
+
+def _artist_names(artists: list) -> str:
+    return ', '.join(_artist_list(artists)) or 'Unknown Artist'
+
+
+def _project_track(track: dict, added_at: str = '') -> dict:
+    album = track.get('album') or {}
+    return {
+        'name': track.get('name', 'Unknown Track'),
+        'artist': _artist_names(track.get('artists')),
+        'artists': _artist_list(track.get('artists')),
+        'album': album.get('name', 'Unknown Album'),
+        'album_release_date': album.get('release_date', ''),
+        'spotify_url': (track.get('external_urls') or {}).get('spotify', ''),
+        'spotify_uri': track.get('uri', ''),
+        'added_at': added_at,
+        'added_by': None,
+    }
+
+
+def _project_saved_album(item: dict) -> dict:
+    album = item.get('album') or {}
+    return {
+        'name': album.get('name', 'Unknown Album'),
+        'artist': _artist_names(album.get('artists')),
+        'artists': _artist_list(album.get('artists')),
+        'album': album.get('name', 'Unknown Album'),
+        'album_release_date': album.get('release_date', ''),
+        'spotify_url': (album.get('external_urls') or {}).get('spotify', ''),
+        'spotify_uri': album.get('uri', ''),
+        'added_at': item.get('added_at', ''),
+        'added_by': None,
+    }
+
+
+def _project_saved_show(item: dict) -> dict:
+    show = item.get('show') or {}
+    return {
+        'name': show.get('name', 'Unknown Show'),
+        'artist': show.get('publisher') or 'Unknown Publisher',
+        'artists': [show['publisher']] if show.get('publisher') else [],
+        'album': '',
+        'album_release_date': '',
+        'spotify_url': (show.get('external_urls') or {}).get('spotify', ''),
+        'spotify_uri': show.get('uri', ''),
+        'added_at': item.get('added_at', ''),
+        'added_by': None,
+    }
+
+
+def _project_saved_episode(item: dict) -> dict:
+    episode = item.get('episode') or {}
+    show = episode.get('show') or {}
+    return {
+        'name': episode.get('name', 'Unknown Episode'),
+        'artist': show.get('publisher') or 'Unknown Publisher',
+        'artists': [show['publisher']] if show.get('publisher') else [],
+        'album': show.get('name', ''),
+        'album_release_date': episode.get('release_date', ''),
+        'spotify_url': (episode.get('external_urls') or {}).get('spotify', ''),
+        'spotify_uri': episode.get('uri', ''),
+        'added_at': item.get('added_at', ''),
+        'added_by': None,
+    }
+
+
+def _project_artist(artist: dict) -> dict:
+    return {
+        'name': artist.get('name', 'Unknown Artist'),
+        'artist': artist.get('name', 'Unknown Artist'),
+        'artists': [artist['name']] if artist.get('name') else [],
+        'album': '',
+        'album_release_date': '',
+        'spotify_url': (artist.get('external_urls') or {}).get('spotify', ''),
+        'spotify_uri': artist.get('uri', ''),
+        'added_at': '',
+        'added_by': None,
+        'genres': ', '.join(artist.get('genres') or []),
+    }
+
+
+# Library collections exported with their own option, in the playlist export format. Items
+# are projected to the track fields, so every output format and the report handle them.
+LIBRARY_COLLECTIONS = {
+    'saved_albums': {
+        'title': 'Saved Albums', 'filename': 'Saved_Albums', 'scope': 'user-library-read',
+        'description': 'Albums saved in your library',
+        'fetch': lambda sp, time_range, **page: sp.current_user_saved_albums(**page),
+        'project': _project_saved_album,
+    },
+    'saved_shows': {
+        'title': 'Saved Shows', 'filename': 'Saved_Shows', 'scope': 'user-library-read',
+        'description': 'Podcasts and shows saved in your library',
+        'fetch': lambda sp, time_range, **page: sp.current_user_saved_shows(**page),
+        'project': _project_saved_show,
+    },
+    'saved_episodes': {
+        'title': 'Saved Episodes', 'filename': 'Saved_Episodes', 'scope': 'user-library-read user-read-playback-position',
+        'description': 'Episodes saved in your library',
+        'fetch': lambda sp, time_range, **page: sp.current_user_saved_episodes(**page),
+        'project': _project_saved_episode,
+    },
+    'followed_artists': {
+        'title': 'Followed Artists', 'filename': 'Followed_Artists', 'scope': 'user-follow-read',
+        'description': 'Artists you follow',
+        'fetch': lambda sp, time_range, **page: sp.current_user_followed_artists(**page),
+        'project': _project_artist, 'cursor': True, 'container': 'artists',
+    },
+    'top_tracks': {
+        'title': 'Top Tracks', 'filename': 'Top_Tracks', 'scope': 'user-top-read',
+        'description': 'Your most played tracks ({time_range})',
+        'fetch': lambda sp, time_range, **page: sp.current_user_top_tracks(time_range=time_range, **page),
+        'project': _project_track,
+    },
+    'top_artists': {
+        'title': 'Top Artists', 'filename': 'Top_Artists', 'scope': 'user-top-read',
+        'description': 'Your most played artists ({time_range})',
+        'fetch': lambda sp, time_range, **page: sp.current_user_top_artists(time_range=time_range, **page),
+        'project': _project_artist,
+    },
+}
+
+
+def is_library_collection(playlist_id: str) -> bool:
     """
-    Generate a professional HTML report with export summary and statistics.
-    
+    Whether an exported object is liked songs or a library collection rather than a playlist.
+
     Args:
-        report_data (dict): Dictionary containing all report information
-        output_dir (Path): Directory to save the report
-        logger: Logger instance for logging
-    
+        playlist_id (str): 'playlist_id' of the exported object.
+
     Returns:
-        Path: Path to the generated HTML report file
+        bool: True for liked songs and the keys of LIBRARY_COLLECTIONS.
     """
-    from datetime import datetime
-    
-    # Generate timestamp for report
-    timestamp = datetime.now().strftime("%Y-%m-%d at %I:%M:%S %p")
-    
-    # Calculate additional statistics
-    total_export_files = report_data.get('total_playlists', 0) + (1 if report_data.get('liked_songs_exported', False) else 0)
-    
-    # Create HTML content
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Playlists Export Report - {timestamp}</title>
-    <style>
-        * {{
+    return playlist_id == 'liked_songs' or playlist_id in LIBRARY_COLLECTIONS
+
+
+def spotify_scope(args) -> str:
+    """
+    OAuth scopes needed for the requested exports.
+
+    Scopes beyond SPOTIFY_SCOPE are only requested when a collection needing them is exported,
+    so existing tokens stay valid for the usual exports.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
+
+    Returns:
+        str: Space-separated scopes.
+    """
+    scopes = SPOTIFY_SCOPE.split()
+    for key, collection in LIBRARY_COLLECTIONS.items():
+        if getattr(args, key, False):
+            scopes.extend(collection['scope'].split())
+    return ' '.join(dict.fromkeys(scopes))
+
+
+def get_library_collection(sp: spotipy.Spotify, key: str, logger, workers: int = 1,
+                           time_range: str = 'medium_term') -> list:
+    """
+    Retrieve the items of a library collection (see LIBRARY_COLLECTIONS).
+
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        key (str): Collection key, e.g. 'saved_albums'.
+        logger (Logger): Logger instance for logging.
+        workers (int): Number of pages fetched concurrently.
+        time_range (str): Period of the top items: short_term, medium_term or long_term.
+
+    Returns:
+        list: Items projected to the track fields, with their position.
+    Raises:
+        Exception: When a page of the collection cannot be fetched after retries.
+    """
+    collection = LIBRARY_COLLECTIONS[key]
+    items = []
+    try:
+        for item in iter_paginated(lambda **page: collection['fetch'](sp, time_range, **page), logger,
+                                   collection['title'].lower(), page_size=50, workers=workers,
+                                   cursor=collection.get('cursor', False), container=collection.get('container'),
+                                   project=collection['project']):
+            items.append({'position': len(items), **item})
+    except Exception as e:
+        logger.error(f"Failed to retrieve {collection['title'].lower()} ({len(items)} retrieved): {e}")
+        raise
+    logger.debug(f"Retrieved {len(items)} items from {collection['title'].lower()}.")
+    return items
+
+
+SHARD_DIR_PATTERN = re.compile(r'[0-9a-f]{2}')
+REPORT_PAGE_SIZE = 60
+REPORT_TOP_N = 10
+CHANGELOG_DIRNAME = 'changelogs'
+
+
+class ReportAnalytics:
+    """
+    Single-pass aggregate statistics over exported tracks for the HTML report.
+
+    Playlists are fed one at a time as they are exported (or streamed from existing
+    exports), so tracks never need to be kept in memory; only counters are retained.
+    """
+
+    def __init__(self):
+        self.artists = Counter()
+        self.albums = Counter()
+        self.decades = Counter()
+        self.added_by_year = Counter()
+        self.track_playlists = Counter()
+        self.track_labels = {}
+        self.tracks_seen = 0
+
+    def add_playlist(self, playlist_obj: dict):
+        """
+        Accumulate statistics for one exported playlist object.
+
+        Args:
+            playlist_obj (dict): Playlist object as written to the export files.
+        """
+        if playlist_obj.get('playlist_id') in LIBRARY_COLLECTIONS:
+            # Not counted: albums, shows and artists are not tracks, and top tracks would show as duplicates
+            return
+        uris_in_playlist = set()
+        for track in playlist_obj.get('tracks') or []:
+            self.tracks_seen += 1
+            artist = track.get('artist') or 'Unknown Artist'
+            # Exports made before the 'artists' list existed only have the joined names
+            for name in track.get('artists') or artist.split(', '):
+                self.artists[name] += 1
+            album = track.get('album')
+            if album:
+                self.albums[(album, artist)] += 1
+
+            release_year = (track.get('album_release_date') or '')[:4]
+            if release_year.isdigit():
+                self.decades[f"{release_year[:3]}0s"] += 1
+
+            added_year = (track.get('added_at') or '')[:4]
+            if added_year.isdigit():
+                self.added_by_year[added_year] += 1
+
+            uri = track.get('spotify_uri')
+            if uri and uri not in uris_in_playlist:
+                uris_in_playlist.add(uri)
+                self.track_playlists[uri] += 1
+                if uri not in self.track_labels:
+                    self.track_labels[uri] = f"{track.get('name', 'Unknown Track')} - {artist}"
+
+    def summary(self, top_n: int = REPORT_TOP_N) -> dict:
+        """
+        Build the aggregated view rendered in the report.
+
+        Args:
+            top_n (int): Number of entries in each ranking.
+
+        Returns:
+            dict: Rankings and distributions ready for rendering.
+        """
+        duplicates = [(uri, count) for uri, count in self.track_playlists.items() if count > 1]
+        duplicates.sort(key=lambda item: item[1], reverse=True)
+
+        growth = []
+        cumulative = 0
+        for year in sorted(self.added_by_year):
+            cumulative += self.added_by_year[year]
+            growth.append((year, self.added_by_year[year], cumulative))
+
+        return {
+            'tracks_seen': self.tracks_seen,
+            'unique_tracks': len(self.track_playlists),
+            'top_artists': self.artists.most_common(top_n),
+            'top_albums': [(f"{album} - {artist}", count) for (album, artist), count in self.albums.most_common(top_n)],
+            'decades': sorted(self.decades.items()),
+            'growth': growth,
+            'duplicate_tracks': len(duplicates),
+            'top_duplicates': [(self.track_labels[uri], count) for uri, count in duplicates[:top_n]],
+        }
+
+
+REPORT_CSS = """
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
             background: linear-gradient(to bottom right, #f8fafc, #e2e8f0);
             min-height: 100vh;
             padding: 40px 20px;
             color: #1e293b;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
+        }
         
-        .report-header {{
+        .report-header {
             background: white;
             border-radius: 16px;
             padding: 40px;
             margin-bottom: 30px;
             box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
             border-left: 5px solid #1db954;
-        }}
+        }
         
-        .report-header h1 {{
+        .report-header h1 {
             font-size: 32px;
             font-weight: 800;
             color: #0f172a;
             margin-bottom: 8px;
             line-height: 1.2;
-        }}
+        }
         
-        .report-header .date {{
+        .report-header .date {
             color: #64748b;
             font-size: 15px;
             font-weight: 500;
-        }}
+        }
         
-        .stats-container {{
+        .stats-container {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
             gap: 24px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .stat-box {{
+        .stat-box {
             background: white;
             border-radius: 12px;
             padding: 28px;
@@ -387,14 +1447,14 @@ def generate_html_report(report_data: dict, output_dir: Path, logger) -> Path:
             position: relative;
             overflow: hidden;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .stat-box:hover {{
+        .stat-box:hover {
             box-shadow: 0 4px 12px rgba(29, 185, 84, 0.15);
             transform: translateY(-4px);
-        }}
+        }
         
-        .stat-box::before {{
+        .stat-box::before {
             content: '';
             position: absolute;
             top: 0;
@@ -402,70 +1462,70 @@ def generate_html_report(report_data: dict, output_dir: Path, logger) -> Path:
             right: 0;
             height: 4px;
             background: linear-gradient(90deg, #1db954, #1ed760);
-        }}
+        }
         
-        .stat-number {{
+        .stat-number {
             font-size: 40px;
             font-weight: 800;
             color: #1db954;
             line-height: 1;
             margin-bottom: 8px;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             color: #64748b;
             font-size: 14px;
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .card {{
+        .card {
             background: white;
             border-radius: 12px;
             padding: 32px;
             margin-bottom: 24px;
             box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-        }}
+        }
         
-        .card-title {{
+        .card-title {
             font-size: 20px;
             font-weight: 700;
             color: #0f172a;
             margin-bottom: 24px;
             padding-bottom: 16px;
             border-bottom: 2px solid #e2e8f0;
-        }}
+        }
         
-        .info-table {{
+        .info-table {
             width: 100%;
-        }}
+        }
         
-        .info-row {{
+        .info-row {
             display: flex;
             justify-content: space-between;
             padding: 14px 0;
             border-bottom: 1px solid #f1f5f9;
-        }}
+        }
         
-        .info-row:last-child {{
+        .info-row:last-child {
             border-bottom: none;
-        }}
+        }
         
-        .info-key {{
+        .info-key {
             color: #475569;
             font-weight: 600;
             font-size: 14px;
-        }}
+        }
         
-        .info-val {{
+        .info-val {
             color: #1e293b;
             font-weight: 500;
             text-align: right;
             font-size: 14px;
-        }}
+        }
         
-        .badge {{
+        .badge {
             display: inline-block;
             background: linear-gradient(135deg, #1db954, #1ed760);
             color: white;
@@ -474,118 +1534,321 @@ def generate_html_report(report_data: dict, output_dir: Path, logger) -> Path:
             font-size: 13px;
             font-weight: 700;
             letter-spacing: 0.3px;
-        }}
+        }
         
-        .playlists-grid {{
+        .playlists-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
             gap: 16px;
             max-height: 500px;
             overflow-y: auto;
             padding-right: 8px;
-        }}
+        }
         
-        .playlists-grid::-webkit-scrollbar {{
+        .playlists-grid::-webkit-scrollbar {
             width: 10px;
-        }}
+        }
         
-        .playlists-grid::-webkit-scrollbar-track {{
+        .playlists-grid::-webkit-scrollbar-track {
             background: #f1f5f9;
             border-radius: 5px;
-        }}
+        }
         
-        .playlists-grid::-webkit-scrollbar-thumb {{
+        .playlists-grid::-webkit-scrollbar-thumb {
             background: #cbd5e1;
             border-radius: 5px;
-        }}
+        }
         
-        .playlists-grid::-webkit-scrollbar-thumb:hover {{
+        .playlists-grid::-webkit-scrollbar-thumb:hover {
             background: #1db954;
-        }}
+        }
         
-        .playlist-item {{
+        .playlist-item {
             background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%);
             border-radius: 10px;
             padding: 20px;
             border: 2px solid transparent;
             transition: all 0.2s ease;
             cursor: default;
-        }}
+        }
         
-        .playlist-item:hover {{
+        .playlist-item:hover {
             border-color: #1db954;
             background: white;
             box-shadow: 0 2px 8px rgba(29, 185, 84, 0.1);
-        }}
+        }
         
-        .playlist-title {{
+        .playlist-title {
             font-size: 16px;
             font-weight: 700;
             color: #0f172a;
             margin-bottom: 8px;
             line-height: 1.3;
-        }}
+        }
         
-        .playlist-meta {{
+        .playlist-meta {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-top: 12px;
-        }}
+        }
         
-        .playlist-owner {{
+        .playlist-owner {
             color: #64748b;
             font-size: 13px;
             font-weight: 500;
-        }}
+        }
         
-        .playlist-count {{
+        .playlist-count {
             background: #1db954;
             color: white;
             padding: 4px 10px;
             border-radius: 12px;
             font-size: 12px;
             font-weight: 700;
-        }}
+        }
         
-        .playlist-path {{
+        .playlist-path {
             color: #94a3b8;
             font-size: 12px;
             margin-top: 8px;
             font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
             word-break: break-all;
             line-height: 1.4;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 32px 20px;
             color: #64748b;
             font-size: 14px;
             margin-top: 40px;
-        }}
+        }
+        
+        .footer strong {
+            color: #1db954;
+        }
+        
+        .analytics-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(340px, 1fr));
+            gap: 24px;
+            margin-bottom: 24px;
+        }
+        
+        .analytics-grid .card {
+            margin-bottom: 0;
+        }
+        
+        .bar-row {
+            margin-bottom: 12px;
+        }
+        
+        .bar-label {
+            display: flex;
+            justify-content: space-between;
+            gap: 12px;
+            color: #475569;
+            font-size: 13px;
+            font-weight: 600;
+            margin-bottom: 4px;
+        }
+        
+        .bar-track {
+            background: #f1f5f9;
+            border-radius: 4px;
+            height: 8px;
+            overflow: hidden;
+        }
+        
+        .bar {
+            background: linear-gradient(90deg, #1db954, #1ed760);
+            height: 100%;
+        }
+        
+        .empty-note {
+            color: #94a3b8;
+            font-size: 14px;
+        }
         
-        .footer strong {{
+        .show-more {
+            display: block;
+            margin: 20px auto 0;
+            background: white;
             color: #1db954;
-        }}
+            border: 2px solid #1db954;
+            border-radius: 20px;
+            padding: 8px 20px;
+            font-size: 13px;
+            font-weight: 700;
+            cursor: pointer;
+        }
+        
+        .show-more:hover {
+            background: #1db954;
+            color: white;
+        }
         
-        @media (max-width: 768px) {{
-            body {{ padding: 20px 12px; }}
-            .report-header {{ padding: 24px; }}
-            .report-header h1 {{ font-size: 26px; }}
-            .card {{ padding: 20px; }}
-            .stats-container {{ grid-template-columns: 1fr 1fr; gap: 16px; }}
-            .stat-box {{ padding: 20px; }}
-            .stat-number {{ font-size: 32px; }}
-            .playlists-grid {{ grid-template-columns: 1fr; }}
-        }}
+        @media (max-width: 768px) {
+            body { padding: 20px 12px; }
+            .report-header { padding: 24px; }
+            .report-header h1 { font-size: 26px; }
+            .card { padding: 20px; }
+            .stats-container { grid-template-columns: 1fr 1fr; gap: 16px; }
+            .stat-box { padding: 20px; }
+            .stat-number { font-size: 32px; }
+            .playlists-grid { grid-template-columns: 1fr; }
+            .analytics-grid { grid-template-columns: 1fr; }
+        }
         
-        @media (max-width: 480px) {{
-            .stats-container {{ grid-template-columns: 1fr; }}
-            .info-row {{ flex-direction: column; gap: 8px; }}
-            .info-val {{ text-align: left; }}
-        }}
-    </style>
+        @media (max-width: 480px) {
+            .stats-container { grid-template-columns: 1fr; }
+            .info-row { flex-direction: column; gap: 8px; }
+            .info-val { text-align: left; }
+        }
+"""
+
+# Renders the playlist cards that were not inlined, one page at a time, when the list is
+# scrolled near its end or "Show more" is clicked.
+REPORT_SCRIPT = """
+(function () {
+    var data = JSON.parse(document.getElementById('playlists-data').textContent);
+    var grid = document.getElementById('playlists-grid');
+    var button = document.getElementById('playlists-more');
+    var pageSize = %d;
+    var next = 0;
+
+    function card(p) {
+        var item = document.createElement('div');
+        item.className = 'playlist-item';
+        var title = document.createElement('div');
+        title.className = 'playlist-title';
+        title.textContent = p[0];
+        var meta = document.createElement('div');
+        meta.className = 'playlist-meta';
+        var owner = document.createElement('span');
+        owner.className = 'playlist-owner';
+        owner.textContent = p[1];
+        var count = document.createElement('span');
+        count.className = 'playlist-count';
+        count.textContent = p[2] + ' tracks';
+        meta.appendChild(owner);
+        meta.appendChild(count);
+        item.appendChild(title);
+        item.appendChild(meta);
+        if (p[3]) {
+            var path = document.createElement('div');
+            path.className = 'playlist-path';
+            path.textContent = p[3];
+            item.appendChild(path);
+        }
+        return item;
+    }
+
+    function renderPage() {
+        var fragment = document.createDocumentFragment();
+        var end = Math.min(next + pageSize, data.length);
+        for (; next < end; next++) {
+            fragment.appendChild(card(data[next]));
+        }
+        grid.appendChild(fragment);
+        if (next >= data.length) {
+            button.style.display = 'none';
+        }
+    }
+
+    button.addEventListener('click', renderPage);
+    grid.addEventListener('scroll', function () {
+        if (next < data.length && grid.scrollTop + grid.clientHeight >= grid.scrollHeight - 200) {
+            renderPage();
+        }
+    });
+})();
+""" % REPORT_PAGE_SIZE
+
+
+def _write_ranking_card(out, title: str, rows: list, empty_text: str):
+    """
+    Write a card with a horizontal bar chart for (label, count) rows.
+
+    Args:
+        out: Text stream the report is written to.
+        title (str): Card title.
+        rows (list): List of (label, count) tuples, in display order.
+        empty_text (str): Text shown when there are no rows.
+    """
+    out.write(f"""
+            <div class="card">
+                <div class="card-title">{escape(title)}</div>""")
+    if not rows:
+        out.write(f"""
+                <div class="empty-note">{escape(empty_text)}</div>""")
+    max_count = max((count for _, count in rows), default=0) or 1
+    for label, count in rows:
+        out.write(f"""
+                <div class="bar-row">
+                    <div class="bar-label"><span>{escape(str(label))}</span><span>{count:,}</span></div>
+                    <div class="bar-track"><div class="bar" style="width: {count * 100 / max_count:.1f}%"></div></div>
+                </div>""")
+    out.write("""
+            </div>""")
+
+
+def _write_playlist_card(out, playlist: dict):
+    """Write one playlist card of the "Exported Playlists" grid."""
+    file_path = playlist.get('file_path', '')
+    out.write(f"""
+                <div class="playlist-item">
+                    <div class="playlist-title">{escape(str(playlist.get('name', 'Unknown Playlist')))}</div>
+                    <div class="playlist-meta">
+                        <span class="playlist-owner">{escape(str(playlist.get('owner', 'Unknown')))}</span>
+                        <span class="playlist-count">{playlist.get('track_count', 0)} tracks</span>
+                    </div>""")
+    if file_path:
+        out.write(f"""
+                    <div class="playlist-path">{escape(file_path)}</div>""")
+    out.write("""
+                </div>""")
+
+
+def generate_html_report(report_data: dict, output_dir: Path, logger) -> Path:
+    """
+    Generate a professional HTML report with export summary and statistics.
+
+    The page is streamed to disk through a buffered writer. Only the first page of playlist
+    cards is rendered inline; the rest are embedded as compact JSON and rendered by the
+    browser on demand, so the report opens quickly even for thousands of playlists.
+
+    Args:
+        report_data (dict): Dictionary containing all report information
+        output_dir (Path): Directory to save the report
+        logger: Logger instance for logging
+
+    Returns:
+        Path: Path to the generated HTML report file
+    """
+    from datetime import datetime
+
+    # Generate timestamp for report
+    timestamp = datetime.now().strftime("%Y-%m-%d at %I:%M:%S %p")
+
+    # Calculate additional statistics
+    total_export_files = report_data.get('total_playlists', 0) + (1 if report_data.get('liked_songs_exported', False) else 0)
+    analytics = report_data.get('analytics')
+    summary = analytics.summary() if analytics is not None else None
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_filename = f"playlists_export_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+    report_path = output_dir / report_filename
+
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 16) as out:
+        out.write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Playlists Export Report - {timestamp}</title>
+    <style>{REPORT_CSS}    </style>
 </head>
 <body>
     <div class="container">
@@ -618,7 +1881,7 @@ def generate_html_report(report_data: dict, output_dir: Path, logger) -> Path:
             <div class="info-table">
                 <div class="info-row">
                     <span class="info-key">Output Directory</span>
-                    <span class="info-val">{report_data.get('output_dir', 'N/A')}</span>
+                    <span class="info-val">{escape(str(report_data.get('output_dir', 'N/A')))}</span>
                 </div>
                 <div class="info-row">
                     <span class="info-key">Export Mode</span>
@@ -633,91 +1896,1908 @@ def generate_html_report(report_data: dict, output_dir: Path, logger) -> Path:
                     <span class="badge">Completed Successfully</span>
                 </div>
             </div>
-        </div>"""
-    
-    # Add playlist details section if playlists were exported
-    if report_data.get('playlists_details'):
-        html_content += f"""
+        </div>""")
+
+        # Add changes since the previous export if a changelog was built
+        changes = report_data.get('changelog')
+        if changes is not None:
+            out.write(f"""
         <div class="card">
-            <div class="card-title">Exported Playlists ({len(report_data['playlists_details'])})</div>
-            <div class="playlists-grid">"""
-        
-        for playlist in report_data['playlists_details']:
-            file_path = playlist.get('file_path', '')
-            html_content += f"""
-                <div class="playlist-item">
-                    <div class="playlist-title">{playlist.get('name', 'Unknown Playlist')}</div>
-                    <div class="playlist-meta">
-                        <span class="playlist-owner">{playlist.get('owner', 'Unknown')}</span>
-                        <span class="playlist-count">{playlist.get('track_count', 0)} tracks</span>
-                    </div>"""
-            if file_path:
-                html_content += f"""
-                    <div class="playlist-path">{file_path}</div>"""
-            html_content += """
-                </div>"""
-        
-        html_content += """
+            <div class="card-title">Changes Since Previous Export</div>
+            <div class="info-table">
+                <div class="info-row">
+                    <span class="info-key">Playlists Changed / Unchanged</span>
+                    <span class="info-val">{changes['changed_playlists']:,} / {changes['unchanged_playlists']:,}</span>
+                </div>
+                <div class="info-row">
+                    <span class="info-key">Playlists New / Removed</span>
+                    <span class="info-val">{changes['new_playlists']:,} / {changes['removed_playlists']:,}</span>
+                </div>
+                <div class="info-row">
+                    <span class="info-key">Tracks Added / Removed / Moved</span>
+                    <span class="info-val">{changes['tracks_added']:,} / {changes['tracks_removed']:,} / {changes['tracks_moved']:,}</span>
+                </div>""")
+            for name, added, removed, moved in changes['top_changed']:
+                out.write(f"""
+                <div class="info-row">
+                    <span class="info-key">{escape(name)}</span>
+                    <span class="info-val">+{added:,} / -{removed:,} / moved {moved:,}</span>
+                </div>""")
+            out.write("""
             </div>
-        </div>"""
-    
-    # Add liked songs section if exported
-    if report_data.get('liked_songs_exported'):
-        liked_songs_path = report_data.get('liked_songs_path', '')
-        html_content += f"""
+        </div>""")
+
+        # Add library analytics if track statistics were collected
+        if summary is not None and summary['tracks_seen']:
+            out.write(f"""
+        <div class="card">
+            <div class="card-title">Library Analytics</div>
+            <div class="info-table">
+                <div class="info-row">
+                    <span class="info-key">Unique Tracks</span>
+                    <span class="info-val">{summary['unique_tracks']:,}</span>
+                </div>
+                <div class="info-row">
+                    <span class="info-key">Tracks in More Than One Playlist</span>
+                    <span class="info-val">{summary['duplicate_tracks']:,}</span>
+                </div>
+            </div>
+        </div>
+        <div class="analytics-grid">""")
+            _write_ranking_card(out, "Top Artists", summary['top_artists'], "No artist data")
+            _write_ranking_card(out, "Top Albums", summary['top_albums'], "No album data")
+            _write_ranking_card(out, "Release Decades", summary['decades'], "No release dates")
+            _write_ranking_card(out, "Tracks Added per Year (cumulative)",
+                                [(f"{year} (+{added:,})", total) for year, added, total in summary['growth']],
+                                "No added dates")
+            _write_ranking_card(out, "Most Repeated Tracks (playlists)", summary['top_duplicates'],
+                                "No track appears in more than one playlist")
+            out.write("""
+        </div>""")
+
+        # Add playlist details section if playlists were exported
+        playlists_details = report_data.get('playlists_details') or []
+        if playlists_details:
+            out.write(f"""
+        <div class="card">
+            <div class="card-title">Exported Playlists ({len(playlists_details)})</div>
+            <div class="playlists-grid" id="playlists-grid">""")
+
+            for playlist in playlists_details[:REPORT_PAGE_SIZE]:
+                _write_playlist_card(out, playlist)
+
+            out.write("""
+            </div>""")
+
+            remaining = playlists_details[REPORT_PAGE_SIZE:]
+            if remaining:
+                # Compact rows: [name, owner, track_count, file_path]
+                rows = [[p.get('name', 'Unknown Playlist'), p.get('owner', 'Unknown'), p.get('track_count', 0),
+                         p.get('file_path') or ''] for p in remaining]
+                data = json.dumps(rows, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+                out.write(f"""
+            <button class="show-more" id="playlists-more" type="button">Show more ({len(remaining)} remaining)</button>
+            <script type="application/json" id="playlists-data">{data}</script>
+            <script>{REPORT_SCRIPT}</script>""")
+
+            out.write("""
+        </div>""")
+
+        # Add liked songs section if exported
+        if report_data.get('liked_songs_exported'):
+            liked_songs_path = report_data.get('liked_songs_path', '')
+            out.write(f"""
         <div class="card">
             <div class="card-title">Liked Songs Collection</div>
             <div class="playlist-item">
                 <div class="playlist-title">Your Liked Songs</div>
                 <div class="playlist-meta">
                     <span class="playlist-count">{report_data.get('liked_songs_count', 0)} tracks</span>
-                </div>"""
-        if liked_songs_path:
-            html_content += f"""
-                <div class="playlist-path">{liked_songs_path}</div>"""
-        html_content += """
+                </div>""")
+            if liked_songs_path:
+                out.write(f"""
+                <div class="playlist-path">{escape(liked_songs_path)}</div>""")
+            out.write("""
             </div>
-        </div>"""
-    
-    html_content += """
+        </div>""")
+
+        out.write("""
         <div class="footer">
             <p>Generated by <strong>Spotify Playlists Downloader</strong></p>
         </div>
     </div>
 </body>
-</html>"""
-    
-    # Save HTML report
-    output_dir.mkdir(parents=True, exist_ok=True)
-    report_filename = f"playlists_export_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-    report_path = output_dir / report_filename
-    
-    report_path.write_text(html_content, encoding='utf-8')
+</html>""")
+
     logger.info(f"HTML report generated: {report_path}")
-    
+
     return report_path
 
 
-def export_liked_songs(sp: spotipy.Spotify, split: bool, output_dir: Path,
-                      output_prefix_split: str, output_prefix_single: str, logger, report_data=None):
+def iter_json_array(path: Path, chunk_size: int = 1 << 20):
     """
-    Export liked songs (saved tracks) to JSON file.
-    
+    Stream the elements of a top-level JSON array file one at a time.
+
+    The file is read in chunks and each element is decoded as soon as it is complete, so
+    memory stays bounded by the largest single element (one playlist) rather than the file.
+
     Args:
-        sp (spotipy.Spotify): Authenticated Spotify client.
-        split (bool): Whether to export as individual file (for consistency).
-        output_dir (Path): Directory to save output files.
-        output_prefix_split (str): Prefix for split output filenames.
-        output_prefix_single (str): Prefix for single output filename.
-        logger (Logger): Logger instance for logging.
-        report_data (dict, optional): Dictionary to collect report statistics.
-    
+        path (Path): JSON file whose top-level value is an array.
+        chunk_size (int): Number of characters read from disk at a time.
+
+    Yields:
+        Any: Each decoded array element, in file order.
+    Raises:
+        ValueError: If the file does not contain a top-level JSON array.
+        json.JSONDecodeError: If an element is malformed.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+
+        def fill(min_size: int):
+            # Drop consumed data and append at least min_size more characters
+            nonlocal buffer, pos, eof
+            chunk = f.read(max(chunk_size, min_size))
+            if not chunk:
+                eof = True
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+        def peek():
+            # Next non-whitespace character, reading more data as needed (None at EOF)
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if eof:
+                    return None
+                fill(0)
+
+        if peek() != '[':
+            raise ValueError(f"{path} does not contain a JSON array")
+        pos += 1
+        if peek() == ']':
+            return
+
+        while True:
+            if peek() is None:
+                raise ValueError(f"Unexpected end of file in {path}")
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # Element not complete yet: at least double the pending data and retry
+                fill(len(buffer) - pos)
+                continue
+            if end >= len(buffer) and not eof:
+                # A scalar could continue past the buffer end; make sure it is complete
+                fill(len(buffer) - pos)
+                continue
+            pos = end
+            yield element
+
+            token = peek()
+            if token == ',':
+                pos += 1
+            elif token == ']':
+                return
+            else:
+                raise ValueError(f"Unexpected content after element in {path}: {token!r}")
+
+
+def iter_export_file(path: Path):
+    """
+    Stream playlist objects from an export file in JSON array or NDJSON format.
+
+    Args:
+        path (Path): Export file (.json with a top-level array, or .ndjson with one object per line).
+
+    Yields:
+        dict: Playlist objects (with 'playlist_id' and 'tracks') found in the file.
+    """
+    if path.suffix.lower() == '.ndjson':
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            elements = (json.loads(line) for line in f if line.strip())
+            for element in elements:
+                if isinstance(element, dict) and 'playlist_id' in element and 'tracks' in element:
+                    yield element
+        return
+
+    for element in iter_json_array(path):
+        if isinstance(element, dict) and 'playlist_id' in element and 'tracks' in element:
+            yield element
+
+
+def find_export_files(output_dir: Path, suffixes: tuple = ('.json', '.ndjson')) -> list:
+    """
+    List candidate export files (JSON and NDJSON by default) in the output directory and its shard subdirectories.
+
+    Args:
+        output_dir (Path): Directory containing previous exports.
+        suffixes (tuple): File extensions to include (lowercase, with the dot).
+
     Returns:
-        tuple: (1, total_tracks_exported)
+        list: Sorted list of file paths.
+    """
+    if not output_dir.is_dir():
+        return []
+    candidates = list(output_dir.iterdir())
+    for shard_dir in candidates[:]:
+        if shard_dir.is_dir() and SHARD_DIR_PATTERN.fullmatch(shard_dir.name):
+            candidates.extend(shard_dir.iterdir())
+    return sorted(p for p in candidates
+                  if p.is_file() and p.suffix.lower() in suffixes and not p.name.startswith('.'))
+
+
+def iter_latest_export_playlists(output_dir: Path, logger):
+    """
+    Stream the playlists of the exports in output_dir (see find_export_files), each one once.
+
+    A playlist present in several files (split and combined exports, a stale filtered export,
+    a split file left behind by a rename) is taken from the most recently modified file, so
+    older copies never shadow the current one. Files are read newest first, which keeps this
+    a single streaming pass.
+
+    Args:
+        output_dir (Path): Directory containing the exports.
+        logger: Logger instance for logging.
+
+    Yields:
+        tuple: (path, playlist_obj) for each distinct playlist ID.
+    """
+    def modified(path: Path):
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    seen_ids = set()
+    for path in sorted(find_export_files(output_dir), key=lambda path: (-modified(path), path)):
+        try:
+            for playlist in iter_export_file(path):
+                playlist_id = playlist.get('playlist_id')
+                if playlist_id in seen_ids:
+                    logger.debug(f"Skipping older copy of playlist '{playlist_id}' in {path}")
+                    continue
+                seen_ids.add(playlist_id)
+                yield path, playlist
+        except (ValueError, OSError) as e:
+            logger.warning(f"Skipping {path}: not a readable playlist export ({e})")
+
+
+def build_report_data_from_exports(output_dir: Path, logger) -> dict:
+    """
+    Build report data by streaming over existing exports, without calling the Spotify API.
+
+    Only per-playlist summaries and aggregate counters are kept in memory; tracks are
+    discarded as they are parsed, so multi-gigabyte exports can be processed. A playlist present in
+    several files (e.g. both split and combined exports) is counted once, from its most recent
+    copy (see iter_latest_export_playlists).
+
+    Args:
+        output_dir (Path): Directory containing previous exports.
+        logger: Logger instance for logging.
+
+    Returns:
+        dict: Report data in the same format collected during a live export.
+    """
+    start_time = time.time()
+    report_data = {
+        'total_playlists': 0,
+        'total_tracks': 0,
+        'execution_time': 0,
+        'output_dir': str(output_dir),
+        'split_mode': True,
+        'liked_songs_exported': False,
+        'liked_songs_count': 0,
+        'playlists_details': [],
+        'analytics': ReportAnalytics()
+    }
+    playlists_per_file = Counter()
+
+    for path, playlist in iter_latest_export_playlists(output_dir, logger):
+        playlists_per_file[path] += 1
+        playlist_id = playlist.get('playlist_id')
+        track_count = len(playlist.get('tracks') or [])
+        report_data['analytics'].add_playlist(playlist)
+
+        if playlist_id == 'liked_songs':
+            report_data['liked_songs_exported'] = True
+            report_data['liked_songs_count'] = track_count
+            report_data['liked_songs_path'] = str(path)
+        else:
+            report_data['playlists_details'].append({
+                'name': playlist.get('playlist_name', 'Unknown Playlist'),
+                'owner': playlist.get('owner', 'Unknown'),
+                'track_count': track_count,
+                'file_path': str(path)
+            })
+        report_data['total_tracks'] += track_count
+
+    files_read = len(playlists_per_file)
+    if any(count > 1 for count in playlists_per_file.values()):
+        report_data['split_mode'] = False
+
+    report_data['total_playlists'] = len(report_data['playlists_details']) + (
+        1 if report_data['liked_songs_exported'] else 0)
+    report_data['execution_time'] = time.time() - start_time
+    logger.info(f"Read {report_data['total_playlists']} playlists ({report_data['total_tracks']} tracks) "
+                f"from {files_read} export files in {output_dir}")
+    return report_data
+
+
+def load_previous_export_state(output_dir: Path, logger) -> dict:
+    """
+    Read the track order of every playlist in the previous export, by streaming the files.
+    Each playlist is read from its most recent copy (see iter_latest_export_playlists).
+
+    Args:
+        output_dir (Path): Directory containing the previous export.
+        logger: Logger instance for logging.
+
+    Returns:
+        dict: Mapping of playlist_id to {'name', 'snapshot_id', 'uris'} (uris in playlist order).
+    """
+    state = {}
+    for path, playlist in iter_latest_export_playlists(output_dir, logger):
+        state[playlist.get('playlist_id')] = {
+            'name': playlist.get('playlist_name', ''),
+            'snapshot_id': playlist.get('snapshot_id', ''),
+            'uris': [t.get('spotify_uri') for t in playlist.get('tracks') or [] if t.get('spotify_uri')]
+        }
+    logger.info(f"Loaded previous export state for {len(state)} playlists from {output_dir}")
+    return state
+
+
+def _longest_increasing_subsequence(values: list) -> set:
+    """
+    Return the indices of one longest strictly increasing subsequence of values (O(n log n)).
+
+    Args:
+        values (list): Sequence of comparable values.
+
+    Returns:
+        set: Indices into values belonging to the subsequence.
+    """
+    tails = []        # tails[k]: index of the smallest tail of an increasing run of length k+1
+    tail_values = []  # values[tails[k]], kept separately for bisect
+    parents = [-1] * len(values)
+    for i, value in enumerate(values):
+        k = bisect_left(tail_values, value)
+        if k > 0:
+            parents[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+
+    indices = set()
+    i = tails[-1] if tails else -1
+    while i != -1:
+        indices.add(i)
+        i = parents[i]
+    return indices
+
+
+def diff_track_lists(old_uris: list, new_uris: list) -> dict:
+    """
+    Compare two versions of a playlist's track URIs.
+
+    Repeated URIs are paired by occurrence. Tracks present in both versions keep their place
+    when they belong to the longest run that preserved its relative order; the rest are
+    reported as moved. Runs in O(n log n).
+
+    Args:
+        old_uris (list): Track URIs of the previous version, in order.
+        new_uris (list): Track URIs of the current version, in order.
+
+    Returns:
+        dict: {'added': [{'uri', 'position'}], 'removed': [{'uri', 'position'}],
+               'moved': [{'uri', 'from', 'to'}]}
+    """
+    old_positions = defaultdict(deque)
+    for position, uri in enumerate(old_uris):
+        old_positions[uri].append(position)
+
+    added = []
+    matched = []  # (old_position, new_position, uri) in new order
+    for position, uri in enumerate(new_uris):
+        positions = old_positions.get(uri)
+        if positions:
+            matched.append((positions.popleft(), position, uri))
+        else:
+            added.append({'uri': uri, 'position': position})
+
+    removed = sorted(({'uri': uri, 'position': position}
+                      for uri, positions in old_positions.items() for position in positions),
+                     key=lambda entry: entry['position'])
+
+    kept = _longest_increasing_subsequence([old for old, _, _ in matched])
+    moved = [{'uri': uri, 'from': old, 'to': new}
+             for i, (old, new, uri) in enumerate(matched) if i not in kept]
+
+    return {'added': added, 'removed': removed, 'moved': moved}
+
+
+class PlaylistChangelog:
+    """
+    Collects per-playlist differences against the previous export while playlists are exported.
+
+    Playlists whose snapshot_id did not change are counted as unchanged without comparing
+    their tracks. Liked songs have no snapshot_id and are always compared.
+    """
+
+    def __init__(self, previous_state: dict):
+        """
+        Args:
+            previous_state (dict): Previous export state from load_previous_export_state.
+        """
+        self.previous_state = previous_state
+        self.seen_ids = set()
+        self.entries = []
+        self.unchanged = 0
+
+    def add_playlist(self, playlist_obj: dict):
+        """
+        Compare one exported playlist object against its previous version.
+
+        Args:
+            playlist_obj (dict): Playlist object as written to the export files.
+        """
+        playlist_id = playlist_obj['playlist_id']
+        self.seen_ids.add(playlist_id)
+        previous = self.previous_state.get(playlist_id)
+        name = playlist_obj.get('playlist_name', '')
+
+        if previous is None:
+            self.entries.append({'playlist_id': playlist_id, 'name': name, 'status': 'new',
+                                 'track_count': len(playlist_obj.get('tracks') or [])})
+            return
+
+        snapshot_id = playlist_obj.get('snapshot_id')
+        if snapshot_id and snapshot_id == previous['snapshot_id']:
+            self.unchanged += 1
+            return
+
+        new_uris = [t.get('spotify_uri') for t in playlist_obj.get('tracks') or [] if t.get('spotify_uri')]
+        diff = diff_track_lists(previous['uris'], new_uris)
+        if not (diff['added'] or diff['removed'] or diff['moved'] or name != previous['name']):
+            self.unchanged += 1
+            return
+
+        entry = {'playlist_id': playlist_id, 'name': name, 'status': 'changed'}
+        if name != previous['name']:
+            entry['previous_name'] = previous['name']
+        entry.update(diff)
+        self.entries.append(entry)
+
+    def keep_playlist(self, playlist_id: str):
+        """
+        Mark a playlist that could not be exported this time as still present, so that
+        finish() does not report it as removed.
+
+        Args:
+            playlist_id (str): Playlist ID.
+        """
+        self.seen_ids.add(playlist_id)
+
+    def finish(self, full_listing: bool):
+        """
+        Record playlists from the previous export that were not exported this time.
+
+        Args:
+            full_listing (bool): Whether this run exported every playlist. Removals are only
+                reported then, since a filtered run does not see the other playlists.
+        """
+        if not full_listing:
+            return
+        for playlist_id, previous in self.previous_state.items():
+            if playlist_id not in self.seen_ids and not is_library_collection(playlist_id):
+                self.entries.append({'playlist_id': playlist_id, 'name': previous['name'], 'status': 'removed',
+                                     'track_count': len(previous['uris'])})
+
+    def summary(self, top_n: int = REPORT_TOP_N) -> dict:
+        """
+        Build the summary shown in logs and in the HTML report.
+
+        Args:
+            top_n (int): Number of most changed playlists to list.
+
+        Returns:
+            dict: Counters and the most changed playlists.
+        """
+        changed = [e for e in self.entries if e['status'] == 'changed']
+        changed.sort(key=lambda e: len(e['added']) + len(e['removed']) + len(e['moved']), reverse=True)
+        return {
+            'new_playlists': sum(1 for e in self.entries if e['status'] == 'new'),
+            'removed_playlists': sum(1 for e in self.entries if e['status'] == 'removed'),
+            'changed_playlists': len(changed),
+            'unchanged_playlists': self.unchanged,
+            'tracks_added': sum(len(e['added']) for e in changed),
+            'tracks_removed': sum(len(e['removed']) for e in changed),
+            'tracks_moved': sum(len(e['moved']) for e in changed),
+            'top_changed': [(e['name'], len(e['added']), len(e['removed']), len(e['moved'])) for e in changed[:top_n]],
+        }
+
+    def write(self, output_dir: Path, logger) -> Path:
+        """
+        Write the changelog as compact JSON to the changelogs subdirectory of the output directory.
+
+        Args:
+            output_dir (Path): Export output directory.
+            logger: Logger instance for logging.
+
+        Returns:
+            Path: Path to the changelog file.
+        """
+        from datetime import datetime
+
+        changelog_dir = output_dir / CHANGELOG_DIRNAME
+        changelog_dir.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        changelog_path = changelog_dir / f"changelog_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        summary = self.summary()
+        del summary['top_changed']
+        changelog = {'generated_at': now.isoformat(timespec='seconds'), 'summary': summary, 'playlists': self.entries}
+        changelog_path.write_text(json.dumps(changelog, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        logger.info(f"Changelog saved to {changelog_path}")
+        return changelog_path
+
+
+# Archived run IDs: run start time, with a counter when several runs start in the same second
+ARCHIVE_RUN_ID_PATTERN = re.compile(r'\d{8}_\d{6}(?:_\d+)?')
+ARCHIVE_DIGEST_PATTERN = re.compile(r'[0-9a-f]{64}')
+
+
+class PlaylistArchive:
+    """
+    Content-addressed history of exports.
+
+    Each distinct playlist version is stored once under objects/, keyed by the SHA-256 of its
+    compact JSON, and compressed with gzip. Every run adds a small manifest under runs/
+    listing, per exported file, the versions it contained, so any archived run can be
+    materialized back into the regular file layout while storage only grows with changes.
+    """
+
+    def __init__(self, archive_dir: Path, logger):
+        """
+        Args:
+            archive_dir (Path): Root directory of the archive.
+            logger: Logger instance for logging.
+        """
+        self.archive_dir = archive_dir
+        self.objects_dir = archive_dir / 'objects'
+        self.runs_dir = archive_dir / 'runs'
+        self.logger = logger
+        self.files = {}
+        self.stored = 0
+        self.reused = 0
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json.gz"
+
+    def store_playlist(self, playlist_obj: dict) -> str:
+        """
+        Store a playlist version unless an identical one is already archived.
+
+        Args:
+            playlist_obj (dict): Playlist object as written to the export files.
+
+        Returns:
+            str: Content hash identifying the stored version.
+        """
+        import gzip
+        import hashlib
+
+        # Key order is preserved (not sorted) so restored files match the original exports byte for byte
+        content = json.dumps(playlist_obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        if object_path.exists():
+            self.reused += 1
+            return digest
+
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = object_path.with_name(object_path.name + '.tmp')
+        tmp_path.write_bytes(gzip.compress(content))
+        os.replace(tmp_path, object_path)
+        self.stored += 1
+        return digest
+
+    def add_file(self, filename: str, playlist_objs: list):
+        """
+        Archive the playlists written to one export file and record them in this run's manifest.
+
+        Args:
+            filename (str): Export filename, relative to the output directory.
+            playlist_objs (list): Playlist objects contained in the file, in order.
+        """
+        self.files[filename] = [self.store_playlist(obj) for obj in playlist_objs]
+
+    def write_manifest(self, split: bool) -> Path:
+        """
+        Write the manifest of the current run.
+
+        Args:
+            split (bool): Whether the run used split mode.
+
+        Returns:
+            Path: Path to the manifest file.
+        """
+        from datetime import datetime
+
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        base_id = now.strftime('%Y%m%d_%H%M%S')
+        # Create the manifest exclusively, so runs started in the same second never overwrite each other
+        suffix = 1
+        while True:
+            run_id = base_id if suffix == 1 else f"{base_id}_{suffix}"
+            manifest_path = self.runs_dir / f"{run_id}.json"
+            try:
+                manifest_file = open(manifest_path, 'x', encoding='utf-8')
+                break
+            except FileExistsError:
+                suffix += 1
+        manifest = {'run_id': run_id, 'created_at': now.isoformat(timespec='seconds'),
+                    'split_mode': split, 'files': self.files}
+        with manifest_file:
+            manifest_file.write(json.dumps(manifest, ensure_ascii=False, indent=4))
+        self.logger.info(f"Archived run {run_id}: {self.stored} new playlist versions stored, "
+                         f"{self.reused} reused. Manifest: {manifest_path}")
+        return manifest_path
+
+    def list_runs(self) -> list:
+        """
+        List archived runs, oldest first.
+
+        Unreadable or malformed manifests are skipped with a warning.
+
+        Returns:
+            list: Manifest dictionaries.
+        """
+        if not self.runs_dir.is_dir():
+            return []
+        runs = []
+        for path in sorted(self.runs_dir.glob('*.json')):
+            try:
+                manifest = self._read_manifest(path)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Skipping archived run {path.name}: {e}")
+                continue
+            runs.append(manifest)
+        return runs
+
+    @staticmethod
+    def _read_manifest(path: Path) -> dict:
+        """
+        Read and check a run manifest.
+
+        Args:
+            path (Path): Manifest file.
+
+        Returns:
+            dict: Manifest dictionary.
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a valid manifest.
+        """
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+        if (not isinstance(manifest, dict) or not isinstance(manifest.get('run_id'), str)
+                or not isinstance(manifest.get('created_at'), str) or not isinstance(manifest.get('files'), dict)
+                or not all(isinstance(digests, list) for digests in manifest['files'].values())):
+            raise ValueError("not a valid run manifest")
+        return manifest
+
+    def restore_run(self, run_id: str, output_dir: Path) -> int:
+        """
+        Materialize an archived run into output_dir using the regular export file layout.
+
+        Args:
+            run_id (str): Identifier of the run (manifest name without extension).
+            output_dir (Path): Directory where the files are written.
+
+        Returns:
+            int: Number of files written.
+        Raises:
+            FileNotFoundError: If the run or one of its playlist versions is not in the archive.
+            ValueError: If the run ID or the manifest is invalid, or a file of the manifest would be
+                written outside output_dir.
+        """
+        import gzip
+
+        if not ARCHIVE_RUN_ID_PATTERN.fullmatch(run_id):
+            raise ValueError(f"Invalid archived run ID: {run_id} (use an ID shown by --list_archive)")
+        manifest_path = self.runs_dir / f"{run_id}.json"
+        if not manifest_path.is_file():
+            raise FileNotFoundError(f"Archived run not found: {run_id}")
+        manifest = self._read_manifest(manifest_path)
+
+        # Check every target before writing anything
+        output_dir = output_dir.resolve()
+        targets = []
+        for filename, digests in manifest['files'].items():
+            filepath = (output_dir / filename).resolve()
+            if filepath == output_dir or not filepath.is_relative_to(output_dir):
+                raise ValueError(f"Archived file {filename!r} would be restored outside {output_dir}")
+            if not all(isinstance(digest, str) and ARCHIVE_DIGEST_PATTERN.fullmatch(digest) for digest in digests):
+                raise ValueError(f"Invalid playlist version in archived file {filename!r}")
+            targets.append((filepath, digests))
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for filepath, digests in targets:
+            playlist_objs = [json.loads(gzip.decompress(self._object_path(digest).read_bytes()))
+                             for digest in digests]
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            filepath.write_text(json.dumps(playlist_objs, ensure_ascii=False, indent=4), encoding='utf-8')
+            self.logger.debug(f"Restored {filepath}")
+        self.logger.info(f"Restored {len(manifest['files'])} files from archived run {run_id} into {output_dir}")
+        return len(manifest['files'])
+
+
+SEARCH_INDEX_FILENAME = '.search_index.sqlite'
+SEARCH_INDEX_VERSION = 1
+SEARCH_FIELDS = {'track': 0, 'artist': 1, 'album': 2}
+SEARCH_RESULT_LIMIT = 200
+
+
+def normalize_search_text(text: str) -> list:
+    """
+    Split text into normalized search terms.
+
+    Like normalize_playlist_name, case and spacing are ignored; accents are also removed so
+    that "beyonce" finds "Beyoncé".
+
+    Args:
+        text (str): Track, artist or album name, or a search query.
+
+    Returns:
+        list: Normalized terms, in order.
+    """
+    text = unicodedata.normalize('NFKD', normalize_playlist_name(text))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return re.findall(r'\w+', text)
+
+
+class SearchIndex:
+    """
+    Inverted index of the exported tracks, stored in a SQLite file in the output directory.
+
+    Terms of the track, artist and album names point to tracks, and tracks to the playlists
+    containing them, so lookups read only the matching rows instead of the export files.
+    The index is updated playlist by playlist: playlists whose snapshot_id (or, for liked
+    songs, track list) did not change since they were indexed are skipped.
+
+    The index is secondary to the exports: if updating it fails with a database error, the
+    error is logged and the index is disabled (db is None) for the rest of the run, and the
+    updates made since the last finish() are discarded.
+    """
+
+    def __init__(self, path: Path, logger):
+        """
+        Args:
+            path (Path): SQLite file holding the index (created if missing).
+            logger: Logger instance for logging.
+        """
+        import sqlite3
+
+        self.path = path
+        self.logger = logger
+        self.seen_ids = set()
+        self.indexed = 0
+        self.unchanged = 0
+        self.removed = 0
+        self._term_ids = {}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('PRAGMA cache_size=-65536')
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != SEARCH_INDEX_VERSION:
+            self._create_schema()
+
+    def _create_schema(self):
+        self.db.executescript(f"""
+            DROP TABLE IF EXISTS playlists;
+            DROP TABLE IF EXISTS tracks;
+            DROP TABLE IF EXISTS membership;
+            DROP TABLE IF EXISTS postings;
+            DROP TABLE IF EXISTS terms;
+            CREATE TABLE playlists (playlist_id TEXT PRIMARY KEY, name TEXT, owner TEXT, fingerprint TEXT);
+            CREATE TABLE tracks (track_key INTEGER PRIMARY KEY, uri TEXT UNIQUE, name TEXT, artist TEXT, album TEXT);
+            CREATE TABLE membership (playlist_id TEXT, position INTEGER, track_key INTEGER,
+                                     PRIMARY KEY (playlist_id, position)) WITHOUT ROWID;
+            CREATE INDEX membership_track ON membership (track_key);
+            CREATE TABLE terms (term_id INTEGER PRIMARY KEY, term TEXT UNIQUE);
+            CREATE TABLE postings (term_id INTEGER, track_key INTEGER, field INTEGER,
+                                   PRIMARY KEY (term_id, track_key, field)) WITHOUT ROWID;
+            CREATE INDEX postings_track ON postings (track_key);
+            PRAGMA user_version = {SEARCH_INDEX_VERSION};
+        """)
+
+    @staticmethod
+    def _fingerprint(playlist_obj: dict) -> str:
+        import hashlib
+
+        if playlist_obj.get('snapshot_id'):
+            return playlist_obj['snapshot_id']
+        uris = '\n'.join(t.get('spotify_uri') or '' for t in playlist_obj.get('tracks') or [])
+        return hashlib.sha1(uris.encode('utf-8')).hexdigest()
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            row = self.db.execute('SELECT term_id FROM terms WHERE term = ?', (term,)).fetchone()
+            term_id = row[0] if row else self.db.execute('INSERT INTO terms (term) VALUES (?)', (term,)).lastrowid
+            self._term_ids[term] = term_id
+        return term_id
+
+    def _track_key(self, track: dict) -> int:
+        name, artist, album = track.get('name') or '', track.get('artist') or '', track.get('album') or ''
+        # Tracks without URI (e.g. unavailable ones) are identified by their names
+        uri = track.get('spotify_uri') or f"\x1f{name}\x1f{artist}\x1f{album}"
+        row = self.db.execute('SELECT track_key FROM tracks WHERE uri = ?', (uri,)).fetchone()
+        if row:
+            return row[0]
+        track_key = self.db.execute('INSERT INTO tracks (uri, name, artist, album) VALUES (?, ?, ?, ?)',
+                                    (uri, name, artist, album)).lastrowid
+        postings = {(self._term_id(term), track_key, field)
+                    for field, text in ((SEARCH_FIELDS['track'], name), (SEARCH_FIELDS['artist'], artist),
+                                        (SEARCH_FIELDS['album'], album))
+                    for term in normalize_search_text(text)}
+        self.db.executemany('INSERT INTO postings (term_id, track_key, field) VALUES (?, ?, ?)', postings)
+        return track_key
+
+    def _disable(self, error: Exception):
+        """Log a database error and stop updating the index for the rest of the run."""
+        self.logger.error(f"Search index update failed, the index is disabled for this run ({self.path}): {error}")
+        try:
+            self.db.close()
+        except Exception:
+            pass
+        self.db = None
+
+    def add_playlist(self, playlist_obj: dict):
+        """
+        Index one exported playlist, unless it is unchanged since it was last indexed.
+
+        Args:
+            playlist_obj (dict): Playlist object as written to the export files.
+        """
+        import sqlite3
+
+        if self.db is None:
+            return
+        try:
+            self._add_playlist(playlist_obj)
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def _add_playlist(self, playlist_obj: dict):
+        playlist_id = playlist_obj['playlist_id']
+        self.seen_ids.add(playlist_id)
+        fingerprint = self._fingerprint(playlist_obj)
+        row = self.db.execute('SELECT name, fingerprint FROM playlists WHERE playlist_id = ?',
+                              (playlist_id,)).fetchone()
+        if row == (playlist_obj.get('playlist_name', ''), fingerprint):
+            self.unchanged += 1
+            return
+
+        self.db.execute('DELETE FROM membership WHERE playlist_id = ?', (playlist_id,))
+        self.db.execute('INSERT OR REPLACE INTO playlists (playlist_id, name, owner, fingerprint) VALUES (?, ?, ?, ?)',
+                        (playlist_id, playlist_obj.get('playlist_name', ''), playlist_obj.get('owner', ''), fingerprint))
+        self.db.executemany('INSERT OR REPLACE INTO membership (playlist_id, position, track_key) VALUES (?, ?, ?)',
+                            [(playlist_id, position, self._track_key(track))
+                             for position, track in enumerate(playlist_obj.get('tracks') or [])])
+        self.indexed += 1
+
+    def keep_playlist(self, playlist_id: str):
+        """
+        Keep the indexed version of a playlist that could not be exported this time, so that
+        finish() does not remove it.
+
+        Args:
+            playlist_id (str): Playlist ID.
+        """
+        self.seen_ids.add(playlist_id)
+
+    def remove_playlists(self, playlist_ids):
+        """
+        Remove playlists from the index.
+
+        Args:
+            playlist_ids (iterable): IDs of the playlists to remove.
+        """
+        import sqlite3
+
+        if self.db is None:
+            return
+        try:
+            for playlist_id in playlist_ids:
+                self.db.execute('DELETE FROM membership WHERE playlist_id = ?', (playlist_id,))
+                self.removed += self.db.execute('DELETE FROM playlists WHERE playlist_id = ?', (playlist_id,)).rowcount
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def finish(self, full_listing: bool):
+        """
+        Drop what is no longer exported and save the index.
+
+        Args:
+            full_listing (bool): Whether this run exported every playlist. Playlists that were
+                not exported are only removed then, since a filtered run does not see them.
+        """
+        import sqlite3
+
+        if self.db is None:
+            return
+        try:
+            self._finish(full_listing)
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def _finish(self, full_listing: bool):
+        if full_listing:
+            known_ids = [row[0] for row in self.db.execute('SELECT playlist_id FROM playlists')]
+            self.remove_playlists(i for i in known_ids if i not in self.seen_ids and not is_library_collection(i))
+            if self.db is None:
+                # remove_playlists failed and disabled the index
+                return
+        if self.indexed or self.removed:
+            # Tracks left in no playlist
+            self.db.execute('DELETE FROM postings WHERE track_key IN (SELECT track_key FROM tracks WHERE track_key '
+                            'NOT IN (SELECT track_key FROM membership))')
+            self.db.execute('DELETE FROM tracks WHERE track_key NOT IN (SELECT track_key FROM membership)')
+        self.db.commit()
+        self.logger.info(f"Search index updated: {self.indexed} playlists indexed, {self.unchanged} unchanged, "
+                         f"{self.removed} removed ({self.path})")
+        self.seen_ids.clear()
+        self.indexed = self.unchanged = self.removed = 0
+
+    def rebuild_from_exports(self, output_dir: Path):
+        """
+        Index every playlist found in the export files of output_dir, from its most recent copy
+        (see iter_latest_export_playlists).
+
+        Args:
+            output_dir (Path): Directory containing the exports.
+        """
+        for _, playlist_obj in iter_latest_export_playlists(output_dir, self.logger):
+            self.add_playlist(playlist_obj)
+        self.finish(full_listing=True)
+
+    def search(self, query: str, field: str = 'any', limit: int = SEARCH_RESULT_LIMIT) -> tuple:
+        """
+        Find the playlists containing tracks that match every term of the query.
+
+        The last term matches as a prefix ("beat" finds "Beatles"), the others as whole words.
+
+        Args:
+            query (str): Search text.
+            field (str): 'track', 'artist', 'album' or 'any'.
+            limit (int): Maximum number of rows returned.
+
+        Returns:
+            tuple: (rows, total, playlists) where rows are (playlist_name, playlist_id, position, track, artist,
+                album) tuples ordered by playlist and position, total is the number of matching rows and
+                playlists the number of playlists containing them.
+        """
+        terms = normalize_search_text(query)
+        if not terms:
+            return [], 0, 0
+        field_clause = '' if field == 'any' else f' AND o.field = {SEARCH_FIELDS[field]}'
+
+        # Terms matched by each query term; the last one matches as a prefix
+        ranges = [(term, term + '\x00') for term in terms[:-1]] + [(terms[-1], terms[-1] + '\U0010ffff')]
+        postings = f'terms w JOIN postings o ON o.term_id = w.term_id WHERE w.term >= ? AND w.term < ?{field_clause}'
+
+        # Scan the postings of the rarest term, then check the others on each candidate track
+        def estimate(term_range):
+            return self.db.execute(f'SELECT COUNT(*) FROM (SELECT 1 FROM {postings} LIMIT 5000)', term_range).fetchone()[0]
+
+        ranges.sort(key=estimate)
+        conditions = ''.join(f' AND EXISTS (SELECT 1 FROM {postings} AND o.track_key = d.track_key)'
+                             for _ in ranges[1:])
+        matches = f'SELECT DISTINCT d.track_key FROM terms dw JOIN postings d ON d.term_id = dw.term_id ' \
+                  f'WHERE dw.term >= ? AND dw.term < ?{field_clause.replace("o.", "d.")}{conditions}'
+        params = [value for term_range in ranges for value in term_range]
+        # Matching tracks are kept in a temporary table; CROSS JOIN makes SQLite start from them
+        self.db.execute('DROP TABLE IF EXISTS temp.search_matches')
+        self.db.execute('CREATE TEMP TABLE search_matches (track_key INTEGER PRIMARY KEY)')
+        self.db.execute(f'INSERT INTO search_matches {matches}', params)
+        total, playlists = self.db.execute('SELECT COUNT(*), COUNT(DISTINCT m.playlist_id) FROM search_matches s '
+                                           'CROSS JOIN membership m ON m.track_key = s.track_key').fetchone()
+        rows = self.db.execute('SELECT p.name, p.playlist_id, m.position, t.name, t.artist, t.album '
+                               'FROM search_matches s CROSS JOIN membership m ON m.track_key = s.track_key '
+                               'JOIN tracks t ON t.track_key = s.track_key JOIN playlists p ON p.playlist_id = m.playlist_id '
+                               'ORDER BY p.name, p.playlist_id, m.position LIMIT ?', (limit,)).fetchall()
+        return rows, total, playlists
+
+    def close(self):
+        """Close the database."""
+        if self.db is not None:
+            self.db.close()
+
+
+def open_search_index(output_dir: Path, logger):
+    """
+    Open the search index of output_dir for updating.
+
+    Args:
+        output_dir (Path): Directory containing the exports.
+        logger: Logger instance for logging.
+
+    Returns:
+        SearchIndex: The index, or None if it cannot be opened (the error is logged and the
+            export goes on without it).
+    """
+    import sqlite3
+
+    try:
+        return SearchIndex(output_dir / SEARCH_INDEX_FILENAME, logger)
+    except (sqlite3.Error, OSError) as e:
+        logger.error(f"Failed to open search index in {output_dir}, it will not be updated: {e}")
+        return None
+
+
+def iter_playlists_with_tracks(sp: spotipy.Spotify, playlists: list, workers: int, logger):
+    """
+    Fetch the tracks of several playlists, optionally in parallel, yielding them in listing order.
+
+    At most `workers` playlists are fetched at the same time and only a small window of
+    results is kept ahead of the consumer, so memory stays bounded.
+
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        playlists (list): Playlist objects from the playlists listing.
+        workers (int): Number of concurrent fetches (1 fetches serially).
+        logger (Logger): Logger instance for logging.
+
+    Yields:
+        tuple: (playlist, tracks) for each playlist, in the same order as `playlists`; tracks is
+            None when the playlist could not be fetched completely (see try_get_playlist_tracks).
+    """
+    if workers <= 1:
+        for playlist in playlists:
+            yield playlist, try_get_playlist_tracks(sp, playlist['id'], logger)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch') as executor:
+        pending = deque()
+        playlists_iter = iter(playlists)
+        for playlist in playlists_iter:
+            pending.append((playlist, executor.submit(try_get_playlist_tracks, sp, playlist['id'], logger)))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            playlist, future = pending.popleft()
+            next_playlist = next(playlists_iter, None)
+            if next_playlist is not None:
+                pending.append((next_playlist, executor.submit(try_get_playlist_tracks, sp, next_playlist['id'], logger)))
+            yield playlist, future.result()
+
+
+def iter_playlists_reusing_export(sp: spotipy.Spotify, playlists: list, previous_export: ExportIndex, workers: int,
+                                  logger):
+    """
+    Like iter_playlists_with_tracks, but playlists unchanged since the previous combined export
+    (same snapshot_id and metadata) are read from it instead of being fetched.
+
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        playlists (list): Playlist objects from the playlists listing.
+        previous_export (ExportIndex): Index of the previous combined export.
+        workers (int): Number of concurrent fetches (1 fetches serially).
+        logger (Logger): Logger instance for logging.
+
+    Yields:
+        tuple: (playlist, tracks, entry, segment) for each playlist, in the same order as
+            `playlists`. For a reused playlist, tracks is None and entry and segment are its
+            index entry and encoded element in the previous export; otherwise both are None (and
+            tracks is None when the playlist could not be fetched).
+    """
+    reused = {}
+    for playlist in playlists:
+        entry = previous_export.unchanged_entry(playlist)
+        if entry is not None:
+            reused[playlist['id']] = entry
+    logger.info(f"{len(reused)} of {len(playlists)} playlists are unchanged since the previous export")
+
+    fetched = iter_playlists_with_tracks(sp, [p for p in playlists if p['id'] not in reused], workers, logger)
+    for playlist in playlists:
+        entry = reused.get(playlist['id'])
+        if entry is None:
+            yield (*next(fetched), None, None)
+            continue
+        segment = previous_export.segment(playlist['id'])
+        if segment is None:
+            # Unreadable in the previous export: fetch it after all, with a single page thread since
+            # up to `workers` playlists may still be fetched concurrently (the HTTP pool has workers + 1 connections)
+            yield playlist, try_get_playlist_tracks(sp, playlist['id'], logger), None, None
+        else:
+            yield playlist, None, entry, segment
+
+
+def get_current_user_identity(sp: spotipy.Spotify, logger) -> tuple:
+    """
+    Retrieve the current user's ID and display name.
+
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        logger (Logger): Logger instance for logging.
+
+    Returns:
+        tuple: (user_id, user_name), with placeholders if the request fails.
+    """
+    try:
+        user_info = sp.current_user()
+        user_id = user_info.get('id', 'unknown')
+        return user_id, user_info.get('display_name') or user_id
+    except Exception as e:
+        logger.warning(f"Could not retrieve user info: {e}")
+        return 'unknown', 'Unknown User'
+
+
+def build_liked_songs_obj(user_id: str, user_name: str, tracks: list) -> dict:
+    """
+    Build the exported object for the liked songs collection.
+
+    Args:
+        user_id (str): Current user ID.
+        user_name (str): Current user display name.
+        tracks (list): Track dictionaries as returned by get_user_saved_tracks.
+
+    Returns:
+        dict: Liked songs object in the playlist export format.
+    """
+    return {
+        'playlist_name': 'Liked Songs',
+        'playlist_id': 'liked_songs',  # Special identifier
+        'owner_id': user_id,
+        'owner': user_name,
+        'description': 'Your liked songs from Spotify',
+        'snapshot_id': '',
+        'tracks': tracks
+    }
+
+
+def build_playlist_obj(playlist: dict, tracks: list) -> dict:
+    """
+    Build the exported object for a playlist.
+
+    Args:
+        playlist (dict): Playlist object from the playlists listing.
+        tracks (list): Track dictionaries as returned by get_playlist_tracks.
+
+    Returns:
+        dict: Playlist object in the export format.
+    """
+    return {
+        'playlist_name': playlist['name'],
+        'playlist_id': playlist['id'],
+        'owner_id': playlist.get('owner', {}).get('id', 'unknown'),
+        'owner': playlist.get('owner', {}).get('display_name', 'Unknown'),
+        'description': playlist.get('description', ''),
+        'snapshot_id': playlist.get('snapshot_id', ''),
+        'tracks': tracks
+    }
+
+
+def build_collection_obj(key: str, user_id: str, user_name: str, items: list, time_range: str = 'medium_term') -> dict:
+    """
+    Build the exported object for a library collection (see LIBRARY_COLLECTIONS).
+
+    Args:
+        key (str): Collection key, e.g. 'saved_albums'.
+        user_id (str): Current user ID.
+        user_name (str): Current user display name.
+        items (list): Items as returned by get_library_collection.
+        time_range (str): Period of the top items, shown in their description.
+
+    Returns:
+        dict: Collection object in the playlist export format.
+    """
+    collection = LIBRARY_COLLECTIONS[key]
+    return {
+        'playlist_name': collection['title'],
+        'playlist_id': key,  # Special identifier, like liked_songs
+        'owner_id': user_id,
+        'owner': user_name,
+        'description': collection['description'].format(time_range=time_range.replace('_', ' ')),
+        'snapshot_id': '',
+        'tracks': items
+    }
+
+
+def write_export_file(filepath: Path, playlist_objs: list):
+    """
+    Write playlist objects to an export file as an indented JSON array.
+
+    Args:
+        filepath (Path): Destination file.
+        playlist_objs (list): Playlist objects to write, in order.
+    """
+    filepath.write_text(json.dumps(playlist_objs, ensure_ascii=False, indent=4), encoding='utf-8')
+
+
+class ExportSink:
+    """
+    Base class of the export formats (see EXPORT_SINKS).
+
+    A sink writes one output file and receives playlist objects one at a time, so files are
+    written as playlists arrive instead of being built in memory. A split file is a sink
+    receiving a single playlist, a combined file one receiving them all. The file is written
+    under a temporary name and moved into place by close(); abort() discards it.
+    """
+
+    extension = ''
+    binary = False
+
+    def __init__(self, filepath: Path, title: str = '', executor=None):
+        """
+        Args:
+            filepath (Path): Destination file.
+            title (str): Title of the file, for formats that have one (defaults to the file name).
+            executor (ProcessPoolExecutor, optional): Pool that sinks supporting it use to encode
+                playlists in parallel (see create_serialization_pool).
+        """
+        self.filepath = filepath
+        self.title = title or filepath.stem
+        self.executor = executor
+        self.count = 0
+        self._tmp_path = filepath.with_name(filepath.name + '.part')
+        if self.binary:
+            self._file = open(self._tmp_path, 'wb')
+        else:
+            self._file = open(self._tmp_path, 'w', encoding='utf-8', newline='')
+        self.begin()
+
+    def begin(self):
+        """Write the file header."""
+
+    def write_playlist(self, playlist_obj: dict):
+        """
+        Append one playlist to the file.
+
+        Args:
+            playlist_obj (dict): Playlist object in the export format.
+        """
+        raise NotImplementedError
+
+    def end(self):
+        """Write the file footer."""
+
+    def close(self):
+        """Finish the file and move it into place."""
+        self.end()
+        self._file.close()
+        os.replace(self._tmp_path, self.filepath)
+
+    def abort(self):
+        """Discard the partially written file."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def encode_playlists_chunk(playlist_objs: list) -> list:
+    """
+    Encode consecutive playlist objects as they appear inside an indented JSON array.
+
+    Joining the encoded elements with ",\\n" between "[\\n" and "\\n]" gives exactly
+    json.dumps(playlist_objs, ensure_ascii=False, indent=4) in UTF-8. Defined at module level
+    so that it can run in a process pool.
+
+    Args:
+        playlist_objs (list): Playlist objects, in order.
+
+    Returns:
+        list: (encoded element (bytes), SHA-256 hex digest of it) for each playlist object,
+            each element indented one level.
+    """
+    import hashlib
+
+    encoded = []
+    for obj in playlist_objs:
+        data = ('    ' + json.dumps(obj, ensure_ascii=False, indent=4).replace('\n', '\n    ')).encode('utf-8')
+        encoded.append((data, hashlib.sha256(data).hexdigest()))
+    return encoded
+
+
+def create_serialization_pool(workers: int):
+    """
+    Create the process pool used to encode combined JSON exports in parallel.
+
+    Worker processes are spawned rather than forked, since the exporter runs fetching threads.
+
+    Args:
+        workers (int): Number of processes.
+
+    Returns:
+        ProcessPoolExecutor: The pool; shut it down when the export is written.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+class JsonSink(ExportSink):
+    """
+    Indented JSON array, byte-identical to write_export_file.
+
+    With a process pool, playlists are grouped into chunks of about SERIALIZE_CHUNK_TRACKS
+    tracks that are encoded in the pool, and the encoded chunks are written in order. The
+    byte range and hash of every playlist are recorded in index_entries; with write_index set,
+    close() saves them as the sidecar index of the file (see ExportIndex).
+    """
+
+    extension = '.json'
+    binary = True
+
+    def begin(self):
+        self.write_index = False
+        self.index_entries = []
+        self._size = 0
+        self._chunk = []
+        self._chunk_headers = []
+        self._chunk_tracks = 0
+        self._pending = deque()
+
+    def _write_encoded(self, headers: list, encoded: list):
+        for header, (data, digest) in zip(headers, encoded):
+            separator = b',\n' if self.index_entries else b'[\n'
+            self._file.write(separator)
+            self._file.write(data)
+            self._size += len(separator)
+            self.index_entries.append(dict(header, offset=self._size, length=len(data), sha256=digest))
+            self._size += len(data)
+
+    def _flush_chunk(self):
+        if self._chunk:
+            self._pending.append((self._chunk_headers, self.executor.submit(encode_playlists_chunk, self._chunk)))
+            self._chunk = []
+            self._chunk_headers = []
+            self._chunk_tracks = 0
+        while self._pending and (len(self._pending) > SERIALIZE_MAX_PENDING_CHUNKS or self._pending[0][1].done()):
+            headers, future = self._pending.popleft()
+            self._write_encoded(headers, future.result())
+
+    def write_playlist(self, playlist_obj: dict, listed_tracks: int = None):
+        """
+        Append one playlist to the file.
+
+        Args:
+            playlist_obj (dict): Playlist object in the export format.
+            listed_tracks (int, optional): Track total of the playlist in the playlists listing, recorded
+                in the index when the playlist was fetched completely (see ExportIndex.unchanged_entry).
+        """
+        self.count += 1
+        header = playlist_index_header(playlist_obj)
+        if listed_tracks is not None:
+            header['listed_tracks'] = listed_tracks
+        if self.executor is None:
+            self._write_encoded([header], encode_playlists_chunk([playlist_obj]))
+            return
+        self._chunk.append(playlist_obj)
+        self._chunk_headers.append(header)
+        self._chunk_tracks += len(playlist_obj.get('tracks') or []) + 1
+        if self._chunk_tracks >= SERIALIZE_CHUNK_TRACKS:
+            self._flush_chunk()
+
+    def write_segment(self, entry: dict, data: bytes):
+        """
+        Append a playlist copied verbatim from a previous export (see ExportIndex.segment).
+
+        Args:
+            entry (dict): Index entry of the playlist in the previous export.
+            data (bytes): Encoded element of the playlist in the previous export.
+        """
+        self.count += 1
+        header = {key: entry[key] for key in (*EXPORT_INDEX_FIELDS, 'track_count', 'listed_tracks') if key in entry}
+        if self.executor is None:
+            self._write_encoded([header], [(data, entry['sha256'])])
+            return
+        from concurrent.futures import Future
+
+        # Keep the file order: queue the segment behind the chunks still being encoded
+        self._flush_chunk()
+        future = Future()
+        future.set_result([(data, entry['sha256'])])
+        self._pending.append(([header], future))
+
+    def end(self):
+        if self.executor is not None:
+            self._flush_chunk()
+            while self._pending:
+                headers, future = self._pending.popleft()
+                self._write_encoded(headers, future.result())
+        self._file.write(b'\n]' if self.index_entries else b'[]')
+
+    def close(self):
+        super().close()
+        if self.write_index:
+            write_export_index(self.filepath, self.index_entries)
+
+    def abort(self):
+        for _, future in self._pending:
+            future.cancel()
+        super().abort()
+
+
+class CsvSink(ExportSink):
+    """One row per track, with the playlist name and ID in the first columns."""
+
+    extension = '.csv'
+    columns = ('playlist_name', 'playlist_id', 'position', 'name', 'artist', 'album', 'album_release_date',
+               'spotify_url', 'spotify_uri', 'added_at', 'added_by')
+
+    def begin(self):
+        import csv
+
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write_playlist(self, playlist_obj: dict):
+        for track in playlist_obj['tracks']:
+            row = dict(track, playlist_name=playlist_obj['playlist_name'], playlist_id=playlist_obj['playlist_id'])
+            self._writer.writerow(['' if row.get(column) is None else row.get(column) for column in self.columns])
+        self.count += 1
+
+
+class M3uSink(ExportSink):
+    """Extended M3U playlist of Spotify links; each exported playlist starts an #EXTGRP group."""
+
+    extension = '.m3u'
+
+    def begin(self):
+        self._file.write(f"#EXTM3U\n#PLAYLIST:{self.title}\n")
+
+    def write_playlist(self, playlist_obj: dict):
+        self._file.write(f"#EXTGRP:{playlist_obj['playlist_name']}\n")
+        for track in playlist_obj['tracks']:
+            location = track.get('spotify_url') or track.get('spotify_uri')
+            if location:
+                self._file.write(f"#EXTINF:-1,{track.get('artist', '')} - {track.get('name', '')}\n{location}\n")
+        self.count += 1
+
+
+class XspfSink(ExportSink):
+    """XSPF (XML shareable playlist) document; each track is annotated with its playlist name."""
+
+    extension = '.xspf'
+
+    def begin(self):
+        self._file.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                         '<playlist version="1" xmlns="http://xspf.org/ns/0/">\n'
+                         f"  <title>{escape(self.title, quote=False)}</title>\n"
+                         "  <trackList>\n")
+
+    def write_playlist(self, playlist_obj: dict):
+        annotation = escape(playlist_obj['playlist_name'], quote=False)
+        for track in playlist_obj['tracks']:
+            fields = [('location', track.get('spotify_url')), ('identifier', track.get('spotify_uri')),
+                      ('title', track.get('name')), ('creator', track.get('artist')), ('album', track.get('album'))]
+            self._file.write("    <track>\n")
+            for tag, value in fields:
+                if value:
+                    self._file.write(f"      <{tag}>{escape(value, quote=False)}</{tag}>\n")
+            self._file.write(f"      <annotation>{annotation}</annotation>\n    </track>\n")
+        self.count += 1
+
+    def end(self):
+        self._file.write("  </trackList>\n</playlist>\n")
+
+
+# Parallel encoding of combined JSON exports (see JsonSink)
+SERIALIZE_CHUNK_TRACKS = 2000
+SERIALIZE_MAX_PENDING_CHUNKS = 64
+
+# Export formats selectable with --formats, by name
+EXPORT_SINKS = {
+    'json': JsonSink,
+    'csv': CsvSink,
+    'm3u': M3uSink,
+    'xspf': XspfSink,
+}
+DEFAULT_EXPORT_FORMATS = ('json',)
+
+
+def export_format_paths(filepath: Path, formats=DEFAULT_EXPORT_FORMATS) -> list:
+    """
+    Paths of the files written for an export in each format.
+
+    Args:
+        filepath (Path): Export path with the .json extension (as used by the JSON format).
+        formats (sequence): Format names (keys of EXPORT_SINKS).
+
+    Returns:
+        list: One path per format, in the same order.
+    """
+    return [filepath.with_suffix(EXPORT_SINKS[name].extension) for name in formats]
+
+
+def open_export_sinks(filepath: Path, formats=DEFAULT_EXPORT_FORMATS, title: str = '', executor=None,
+                      index: bool = False) -> list:
+    """
+    Open one sink per format for an export file.
+
+    Args:
+        filepath (Path): Export path with the .json extension; other formats replace the extension.
+        formats (sequence): Format names (keys of EXPORT_SINKS).
+        title (str): Title for formats that have one.
+        executor (ProcessPoolExecutor, optional): Pool for sinks that encode in parallel.
+        index (bool): Write the sidecar index of the JSON file (used for combined exports).
+
+    Returns:
+        list: Open sinks, in the order of formats.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    sinks = []
+    try:
+        for name, path in zip(formats, export_format_paths(filepath, formats)):
+            sinks.append(EXPORT_SINKS[name](path, title, executor))
+            if index and name == 'json':
+                sinks[-1].write_index = True
+    except BaseException:
+        for sink in sinks:
+            sink.abort()
+        raise
+    return sinks
+
+
+def write_export_files(filepath: Path, playlist_objs: list, formats=DEFAULT_EXPORT_FORMATS, title: str = '',
+                       index: bool = False) -> list:
+    """
+    Write playlist objects to an export file in each of the given formats.
+
+    Args:
+        filepath (Path): Export path with the .json extension; other formats replace the extension.
+        playlist_objs (list): Playlist objects to write, in order.
+        formats (sequence): Format names (keys of EXPORT_SINKS).
+        title (str): Title for formats that have one.
+        index (bool): Write the sidecar index of the JSON file (used for combined exports).
+
+    Returns:
+        list: Paths of the written files, in the order of formats.
+    """
+    sinks = open_export_sinks(filepath, formats, title, index=index)
+    try:
+        for playlist_obj in playlist_objs:
+            for sink in sinks:
+                sink.write_playlist(playlist_obj)
+    except BaseException:
+        for sink in sinks:
+            sink.abort()
+        raise
+    for sink in sinks:
+        sink.close()
+    return [sink.filepath for sink in sinks]
+
+
+# Sidecar index of combined JSON exports (see JsonSink and ExportIndex)
+EXPORT_INDEX_SUFFIX = '.index'
+EXPORT_INDEX_VERSION = 1
+EXPORT_INDEX_FIELDS = ('playlist_id', 'playlist_name', 'owner_id', 'owner', 'description', 'snapshot_id')
+
+
+def export_index_path(json_path: Path) -> Path:
+    """
+    Path of the sidecar index of a combined JSON export (hidden, next to the file).
+
+    Args:
+        json_path (Path): Combined JSON export.
+
+    Returns:
+        Path: Index path, e.g. .spotify_playlists.json.index for spotify_playlists.json.
+    """
+    return json_path.with_name(f".{json_path.name}{EXPORT_INDEX_SUFFIX}")
+
+
+def playlist_index_header(playlist_obj: dict) -> dict:
+    """
+    Playlist metadata recorded in the export index: everything but the tracks, and their count.
+
+    Args:
+        playlist_obj (dict): Playlist object in the export format.
+
+    Returns:
+        dict: Values of EXPORT_INDEX_FIELDS and 'track_count'.
+    """
+    header = {key: playlist_obj.get(key, '') for key in EXPORT_INDEX_FIELDS}
+    header['track_count'] = len(playlist_obj.get('tracks') or [])
+    return header
+
+
+def write_export_index(json_path: Path, entries: list) -> Path:
+    """
+    Write the sidecar index of a combined JSON export that was just written.
+
+    The index records the size and modification time of the export, so an index left
+    behind by an interrupted or external rewrite of the file is recognized as stale.
+
+    Args:
+        json_path (Path): Combined JSON export, already in place.
+        entries (list): Index entries of its playlists, in file order (see JsonSink).
+
+    Returns:
+        Path: Path to the index file.
+    """
+    stat = json_path.stat()
+    index = {
+        'version': EXPORT_INDEX_VERSION,
+        'file': json_path.name,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'playlists': entries,
+    }
+    index_path = export_index_path(json_path)
+    tmp_path = index_path.with_name(index_path.name + '.part')
+    tmp_path.write_text(json.dumps(index, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+class ExportIndex:
+    """
+    Sidecar index of a previous combined JSON export, written by JsonSink next to the file.
+
+    Gives the metadata, byte range and SHA-256 of each playlist of the export, so single
+    playlists can be read, or copied verbatim into a new export, from a memory map of the file
+    without parsing the rest. An index that does not match the file (size or modification
+    time) is ignored, and a playlist whose bytes do not match its hash is not returned.
+    """
+
+    def __init__(self, json_path: Path, logger):
+        """
+        Args:
+            json_path (Path): Combined JSON export.
+            logger: Logger instance for logging.
+        """
+        self.path = json_path
+        self.logger = logger
+        self.entries = {}
+        self._file = None
+        self._map = None
+        index_path = export_index_path(json_path)
+        try:
+            index = json.loads(index_path.read_text(encoding='utf-8'))
+            stat = json_path.stat()
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable export index {index_path}: {e}")
+            return
+        if (index.get('version') != EXPORT_INDEX_VERSION or index.get('size') != stat.st_size
+                or index.get('mtime_ns') != stat.st_mtime_ns):
+            logger.info(f"Ignoring export index {index_path}: it does not match {json_path.name}")
+            return
+        self.entries = {entry['playlist_id']: entry for entry in index['playlists']}
+
+    def unchanged_entry(self, playlist: dict) -> dict:
+        """
+        Find the entry of a listed playlist whose previous export can be reused as is.
+
+        Args:
+            playlist (dict): Playlist object from the playlists listing.
+
+        Returns:
+            dict: Index entry when the playlist has the same snapshot_id and metadata as in the
+                previous export, and was fetched completely with the track total it has in the
+                listing; None otherwise.
+        """
+        entry = self.entries.get(playlist['id'])
+        if entry is None or not entry['snapshot_id']:
+            return None
+        # Only complete fetches record the listing total ('listed_tracks'); anything else is fetched again
+        listed_tracks = (playlist.get('tracks') or {}).get('total')
+        if (listed_tracks is None or entry.get('listed_tracks') != listed_tracks
+                or entry['track_count'] > listed_tracks):
+            return None
+        header = playlist_index_header(build_playlist_obj(playlist, []))
+        if any(entry.get(key) != header[key] for key in EXPORT_INDEX_FIELDS):
+            return None
+        return entry
+
+    def segment(self, playlist_id: str) -> bytes:
+        """
+        Read the encoded element of one playlist from the export.
+
+        Args:
+            playlist_id (str): Playlist ID.
+
+        Returns:
+            bytes: The element as written in the export (one level of indentation), or None
+                when the playlist is not indexed or its bytes do not match the recorded hash.
+        """
+        import hashlib
+        import mmap
+
+        entry = self.entries.get(playlist_id)
+        if entry is None:
+            return None
+        try:
+            if self._map is None:
+                self._file = open(self.path, 'rb')
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            data = self._map[entry['offset']:entry['offset'] + entry['length']]
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Cannot read {self.path} through its index: {e}")
+            self.entries = {}
+            return None
+        if hashlib.sha256(data).hexdigest() != entry['sha256']:
+            self.logger.warning(f"Playlist '{entry['playlist_name']}' does not match its entry in the index of {self.path}")
+            return None
+        return data
+
+    def load_playlist(self, playlist_id: str) -> dict:
+        """
+        Decode one playlist of the export.
+
+        Args:
+            playlist_id (str): Playlist ID.
+
+        Returns:
+            dict: Playlist object, or None (see segment).
+        """
+        data = self.segment(playlist_id)
+        return None if data is None else json.loads(data)
+
+    def close(self):
+        """Release the memory map (required before the export is replaced on Windows)."""
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+
+def split_shard_dir(playlist_id: str) -> str:
+    """
+    Shard subdirectory of a playlist in split mode: two hex characters derived from its ID.
+
+    Args:
+        playlist_id (str): Spotify playlist ID.
+
+    Returns:
+        str: Subdirectory name ('00' to 'ff').
+    """
+    import hashlib
+
+    return hashlib.sha1(playlist_id.encode('utf-8')).hexdigest()[:2]
+
+
+def assign_split_filenames(playlists: list, output_prefix_split: str, shard: bool = False) -> dict:
+    """
+    Choose a unique file name for each playlist exported in split mode.
+
+    Names come from sanitize_playlist_name. When several playlists reduce to the same name
+    (compared case-insensitively, as on Windows and macOS), or a name is empty or clashes with
+    the liked songs file, every playlist involved gets its ID appended, so the result does
+    not depend on listing order.
+
+    Args:
+        playlists (list): Playlist objects with 'id' and 'name'.
+        output_prefix_split (str): Prefix for split output filenames.
+        shard (bool): Place each file in a shard subdirectory (see split_shard_dir).
+
+    Returns:
+        dict: Mapping of playlist ID to file path relative to the output directory (as a string).
+    """
+    bases = {p['id']: sanitize_playlist_name(p['name']) for p in playlists}
+    counts = Counter(base.casefold() for base in bases.values())
+    for reserved in ['Liked_Songs'] + [collection['filename'] for collection in LIBRARY_COLLECTIONS.values()]:
+        counts[reserved.casefold()] += 1
+
+    filenames = {}
+    for playlist_id, base in bases.items():
+        if not base or counts[base.casefold()] > 1:
+            base = f"{base}_{playlist_id}" if base else playlist_id
+        filename = f"{output_prefix_split}{base}.json"
+        filenames[playlist_id] = f"{split_shard_dir(playlist_id)}/{filename}" if shard else filename
+    return filenames
+
+
+class AsyncExportWriter:
+    """
+    Writes export files from a small thread pool, so disk writes overlap with fetching.
+
+    The number of files waiting to be written is bounded (twice the thread count), which
+    keeps memory bounded when the disk is slower than the network. Errors are logged and the
+    files that could not be written are collected in failed_paths; close() waits for pending
+    writes.
+    """
+
+    def __init__(self, threads: int, logger, formats=DEFAULT_EXPORT_FORMATS):
+        """
+        Args:
+            threads (int): Number of writer threads.
+            logger: Logger instance for logging.
+            formats (sequence): Export formats written for each file (keys of EXPORT_SINKS).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.logger = logger
+        self.formats = formats
+        self.failed_paths = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='writer')
+        self._slots = threading.BoundedSemaphore(threads * 2)
+
+    def _write(self, filepath: Path, playlist_objs: list) -> bool:
+        try:
+            write_export_files(filepath, playlist_objs, self.formats, playlist_objs[0]['playlist_name'])
+            self.logger.info(f"Saved playlist to {filepath}")
+            return True
+        except Exception as e:
+            with self._lock:
+                self.failed_paths.add(filepath)
+            self.logger.error(f"Failed to write {filepath}: {e}")
+            return False
+        finally:
+            self._slots.release()
+
+    def submit(self, filepath: Path, playlist_objs: list):
+        """
+        Queue a file to be written; blocks while too many writes are pending.
+
+        Args:
+            filepath (Path): Destination file.
+            playlist_objs (list): Playlist objects to write.
+
+        Returns:
+            concurrent.futures.Future: Resolves to True once the file is written, False if it could not be.
+        """
+        self._slots.acquire()
+        return self._executor.submit(self._write, filepath, playlist_objs)
+
+    def close(self):
+        """Wait for all pending writes to finish."""
+        self._executor.shutdown(wait=True)
+        if self.failed_paths:
+            self.logger.error(f"{len(self.failed_paths)} export files could not be written")
+
+
+def export_liked_songs(sp: spotipy.Spotify, split: bool, output_dir: Path,
+                      output_prefix_split: str, output_prefix_single: str, logger, report_data=None,
+                      changelog=None, archive=None, formats=DEFAULT_EXPORT_FORMATS, search_index=None,
+                      workers: int = 1):
+    """
+    Export liked songs (saved tracks) to a file in each of the selected formats.
+    
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        split (bool): Whether to export as individual file (for consistency).
+        output_dir (Path): Directory to save output files.
+        output_prefix_split (str): Prefix for split output filenames.
+        output_prefix_single (str): Prefix for single output filename.
+        logger (Logger): Logger instance for logging.
+        report_data (dict, optional): Dictionary to collect report statistics.
+        changelog (PlaylistChangelog, optional): Collector of changes against the previous export.
+        archive (PlaylistArchive, optional): History archive receiving the written files.
+        formats (sequence): Export formats (keys of EXPORT_SINKS).
+        search_index (SearchIndex, optional): Search index updated with the exported tracks.
+        workers (int): Number of pages fetched concurrently.
+    
+    Returns:
+        tuple: (1, total_tracks_exported)
     """
     logger.info("Exporting liked songs (saved tracks)")
     
-    tracks = get_user_saved_tracks(sp, logger)
+    try:
+        tracks = get_user_saved_tracks(sp, logger, workers)
+    except Exception:
+        logger.error("Liked songs were not exported; the previous export is kept")
+        return 0, 0
     
     if not tracks:
         logger.warning("No liked songs found to export")
@@ -727,24 +3807,8 @@ def export_liked_songs(sp: spotipy.Spotify, split: bool, output_dir: Path,
         return 0, 0
     
     # Get current user info
-    try:
-        user_info = sp.current_user()
-        user_id = user_info.get('id', 'unknown')
-        user_name = user_info.get('display_name') or user_id
-    except Exception as e:
-        logger.warning(f"Could not retrieve user info: {e}")
-        user_id = 'unknown'
-        user_name = 'Unknown User'
-    
-    liked_songs_obj = {
-        'playlist_name': 'Liked Songs',
-        'playlist_id': 'liked_songs',  # Special identifier
-        'owner_id': user_id,
-        'owner': user_name,
-        'description': 'Your liked songs from Spotify',
-        'snapshot_id': '',
-        'tracks': tracks
-    }
+    user_id, user_name = get_current_user_identity(sp, logger)
+    liked_songs_obj = build_liked_songs_obj(user_id, user_name, tracks)
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -753,12 +3817,20 @@ def export_liked_songs(sp: spotipy.Spotify, split: bool, output_dir: Path,
     else:
         filename = f"{output_prefix_single}liked_songs.json"
     
-    filepath = output_dir / filename
-    filepath.write_text(json.dumps([liked_songs_obj], ensure_ascii=False, indent=4), encoding='utf-8')
+    filepath = write_export_files(output_dir / filename, [liked_songs_obj], formats, 'Liked Songs')[0]
     logger.info(f"Liked songs exported to: {filepath}")
+
+    if changelog is not None:
+        changelog.add_playlist(liked_songs_obj)
+    if search_index is not None:
+        search_index.add_playlist(liked_songs_obj)
+    if archive is not None:
+        archive.add_file(filename, [liked_songs_obj])
     
     # Collect data for report
     if report_data is not None:
+        if report_data.get('analytics') is not None:
+            report_data['analytics'].add_playlist(liked_songs_obj)
         report_data['liked_songs_exported'] = True
         report_data['liked_songs_count'] = len(tracks)
         report_data['liked_songs_path'] = str(filepath)
@@ -766,11 +3838,91 @@ def export_liked_songs(sp: spotipy.Spotify, split: bool, output_dir: Path,
     return 1, len(tracks)
 
 
+def export_library_collection(sp: spotipy.Spotify, key: str, split: bool, output_dir: Path,
+                              output_prefix_split: str, output_prefix_single: str, logger, report_data=None,
+                              changelog=None, archive=None, formats=DEFAULT_EXPORT_FORMATS, search_index=None,
+                              workers: int = 1, time_range: str = 'medium_term'):
+    """
+    Export a library collection (saved albums, shows or episodes, followed artists, top items)
+    like liked songs, to a file in each of the selected formats.
+
+    Args:
+        sp (spotipy.Spotify): Authenticated Spotify client.
+        key (str): Collection key (see LIBRARY_COLLECTIONS).
+        split (bool): Whether split file naming is used.
+        output_dir (Path): Directory to save output files.
+        output_prefix_split (str): Prefix for split output filenames.
+        output_prefix_single (str): Prefix for single output filename.
+        logger (Logger): Logger instance for logging.
+        report_data (dict, optional): Dictionary to collect report statistics.
+        changelog (PlaylistChangelog, optional): Collector of changes against the previous export.
+        archive (PlaylistArchive, optional): History archive receiving the written files.
+        formats (sequence): Export formats (keys of EXPORT_SINKS).
+        search_index (SearchIndex, optional): Search index updated with the exported items.
+        workers (int): Number of pages fetched concurrently.
+        time_range (str): Period of the top items: short_term, medium_term or long_term.
+
+    Returns:
+        tuple: (1, total_items_exported), or (0, 0) if the collection is empty
+    """
+    collection = LIBRARY_COLLECTIONS[key]
+    logger.info(f"Exporting {collection['title'].lower()}")
+
+    try:
+        items = get_library_collection(sp, key, logger, workers, time_range)
+    except Exception:
+        logger.error(f"{collection['title']} were not exported; the previous export is kept")
+        return 0, 0
+    if not items:
+        logger.warning(f"No {collection['title'].lower()} found to export")
+        return 0, 0
+
+    user_id, user_name = get_current_user_identity(sp, logger)
+    collection_obj = build_collection_obj(key, user_id, user_name, items, time_range)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    filename = f"{output_prefix_split}{collection['filename']}.json" if split else f"{output_prefix_single}{key}.json"
+    filepath = write_export_files(output_dir / filename, [collection_obj], formats, collection['title'])[0]
+    logger.info(f"{collection['title']} exported to: {filepath}")
+
+    if changelog is not None:
+        changelog.add_playlist(collection_obj)
+    if search_index is not None:
+        search_index.add_playlist(collection_obj)
+    if archive is not None:
+        archive.add_file(filename, [collection_obj])
+
+    if report_data is not None:
+        report_data['playlists_details'].append({
+            'name': collection['title'],
+            'owner': user_name,
+            'track_count': len(items),
+            'file_path': str(filepath)
+        })
+
+    return 1, len(items)
+
+
 def export_playlists(sp: spotipy.Spotify, split: bool, output_dir: Path,
-                     output_prefix_split: str, output_prefix_single: str, playlist_name_filter: str, logger, report_data=None):
+                     output_prefix_split: str, output_prefix_single: str, playlist_selector: PlaylistSelector, logger,
+                     report_data=None,
+                     changelog=None, archive=None, workers: int = 1, writer_threads: int = 0,
+                     shard: bool = False, formats=DEFAULT_EXPORT_FORMATS, search_index=None,
+                     serialize_workers: int = 0, incremental: bool = False):
     """
-    Export all playlists to JSON files, either as individual files or a single combined file.
-    Optionally filter by normalized playlist name.
+    Export all playlists, either as individual files or a single combined file, in each of the
+    selected formats. Combined files are streamed: each playlist is written as soon as it is fetched.
+    Optionally restrict the export to a selection of playlists (names, patterns, IDs).
+
+    With `incremental`, playlists unchanged since the previous combined file are copied from it
+    through its sidecar index instead of being fetched again, and are only decoded when another
+    output (report, changelog, archive, search index, non-JSON format) needs their tracks.
+
+    A playlist that cannot be fetched completely is never exported partially: its previous
+    version is kept (its split file is left as is, and in a combined file its previous entry
+    is copied when the file has an index), and it is not reported as removed. Split files
+    that could not be written are left out of the totals, the report, the archive, the
+    changelog and the search index.
 
     Args:
         sp (spotipy.Spotify): Authenticated Spotify client.
@@ -778,14 +3930,22 @@ def export_playlists(sp: spotipy.Spotify, split: bool, output_dir: Path,
         output_dir (Path): Directory to save output files.
         output_prefix_split (str): Prefix for split output filenames.
         output_prefix_single (str): Prefix for single output filename.
-        playlist_name_filter (str): Normalized playlist name to filter.
+        playlist_selector (PlaylistSelector): Playlists to export; None exports all of them.
         logger (Logger): Logger instance for logging.
         report_data (dict, optional): Dictionary to collect report statistics.
+        changelog (PlaylistChangelog, optional): Collector of changes against the previous export.
+        archive (PlaylistArchive, optional): History archive receiving the written files.
+        workers (int): Number of playlists fetched concurrently.
+        writer_threads (int): In split mode, number of background threads writing files (0 writes inline).
+        shard (bool): In split mode, place files in shard subdirectories.
+        formats (sequence): Export formats (keys of EXPORT_SINKS).
+        search_index (SearchIndex, optional): Search index updated with the exported tracks.
+        serialize_workers (int): In combined mode, number of processes encoding the JSON file (0 encodes inline).
+        incremental (bool): In combined mode, reuse unchanged playlists from the previous combined file.
 
     Returns:
         tuple: (total_playlists_exported (int), total_tracks_exported (int))
     """
-    playlists = get_all_playlists(sp, logger)
     export = []
     total_playlists = 0
     total_tracks = 0
@@ -793,86 +3953,206 @@ def export_playlists(sp: spotipy.Spotify, split: bool, output_dir: Path,
     output_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Output directory set to: {output_dir}")
 
-    # Normalize filter if provided
-    normalized_filter = normalize_playlist_name(playlist_name_filter) if playlist_name_filter else None
-    if normalized_filter:
-        logger.info(f"Running with playlist_name filter: '{playlist_name_filter}' (normalized: '{normalized_filter}')")
-    filtered_playlists = []
-    for playlist in playlists:
-        normalized_name = normalize_playlist_name(playlist['name'])
-        if normalized_filter:
-            if normalized_name == normalized_filter:
-                filtered_playlists.append(playlist)
-        else:
-            filtered_playlists.append(playlist)
+    selected = playlist_selector is not None and not playlist_selector.is_empty
+    if selected:
+        logger.info(f"Running with playlist selection: {playlist_selector.describe()}")
+    name_index = PlaylistNameIndex(output_dir / PLAYLIST_INDEX_FILENAME)
+    filtered_playlists = select_playlists(sp, playlist_selector, name_index, logger, workers)
 
     logger.info(f"Number of playlists to export: {len(filtered_playlists)}")
 
-    if normalized_filter and not filtered_playlists:
-        logger.error(f"No playlist matched the name: '{playlist_name_filter}' (normalized: '{normalized_filter}')")
+    if selected and not filtered_playlists:
+        logger.error(f"No playlist matched the selection: {playlist_selector.describe()}")
         return 0, 0
 
     # Initialize report data for playlists
     if report_data is not None:
-        report_data['playlists_details'] = []
-
-    for playlist in filtered_playlists:
-        playlist_name = playlist['name']
-        owner_name = playlist.get('owner', {}).get('display_name', 'Unknown')
-        owner_id = playlist.get('owner', {}).get('id', 'unknown')
-        logger.info(f"Exporting playlist: '{playlist_name}' (Owner: {owner_name} [{owner_id}])")
-
-        tracks = get_playlist_tracks(sp, playlist['id'], logger)
-        total_tracks += len(tracks)
-
-        playlist_obj = {
-            'playlist_name': playlist_name,
-            'playlist_id': playlist['id'],
-            'owner_id': owner_id,
-            'owner': owner_name,
-            'description': playlist.get('description', ''),
-            'snapshot_id': playlist.get('snapshot_id', ''),
-            'tracks': tracks
-        }
+        report_data.setdefault('playlists_details', [])
 
-        if split:
-            export_filename = f"{output_prefix_split}{sanitize_playlist_name(playlist_name)}.json"
-            filename = export_filename
-            filepath = output_dir / filename
-            filepath.write_text(json.dumps([playlist_obj], ensure_ascii=False, indent=4), encoding='utf-8')
-            logger.info(f"Saved playlist to {filepath}")
-            total_playlists += 1
-            
-            # Collect playlist data for report (with file path for split mode)
-            if report_data is not None:
-                report_data['playlists_details'].append({
-                    'name': playlist_name,
-                    'owner': owner_name,
-                    'track_count': len(tracks),
-                    'file_path': str(filepath)
-                })
-        else:
-            export.append(playlist_obj)
-            total_playlists += 1
-            
-            # Collect playlist data for report (without file path yet for combined mode)
-            if report_data is not None:
-                report_data['playlists_details'].append({
-                    'name': playlist_name,
-                    'owner': owner_name,
-                    'track_count': len(tracks),
-                    'file_path': None  # Will be set after combined file is saved
-                })
+    # Names are chosen against all known playlists, so a selection gets the same file names as a full export
+    split_filenames = (assign_split_filenames(name_index.known_playlists(filtered_playlists), output_prefix_split, shard)
+                       if split else {})
+    writer = AsyncExportWriter(writer_threads, logger, formats) if split and writer_threads > 0 else None
+    # Split files written in the background are counted, reported and archived once written, in order
+    pending_writes = deque()
+    written_split_files = {}  # playlist ID -> split file written by this run
+
+    def record_split_file(filename, filepath, playlist_obj, playlist_name, owner_name, track_count):
+        nonlocal total_playlists, total_tracks
+        total_playlists += 1
+        total_tracks += track_count
+        written_split_files[playlist_obj['playlist_id']] = filename
+        if report_data is not None:
+            if report_data.get('analytics') is not None:
+                report_data['analytics'].add_playlist(playlist_obj)
+            report_data['playlists_details'].append({
+                'name': playlist_name,
+                'owner': owner_name,
+                'track_count': track_count,
+                'file_path': str(filepath)
+            })
+        if archive is not None:
+            archive.add_file(filename, [playlist_obj])
+        if changelog is not None:
+            changelog.add_playlist(playlist_obj)
+        if search_index is not None:
+            search_index.add_playlist(playlist_obj)
+
+    def settle_split_write(future, record):
+        if future.result():
+            record_split_file(*record)
+            return
+        # Not written: its previous file (if any) is still the current one
+        for collector in (changelog, search_index):
+            if collector is not None:
+                collector.keep_playlist(record[2]['playlist_id'])
 
+    combined_sinks = []
+    serialization_pool = None
+    previous_export = None
     if not split and filtered_playlists:
-        if normalized_filter:
-            export_filename = f"{output_prefix_single}filtered_spotify_playlists.json"
+        if selected:
+            combined_filename = f"{output_prefix_single}filtered_spotify_playlists.json"
         else:
-            export_filename = f"{output_prefix_single}spotify_playlists.json"
-        filename = export_filename
-        filepath = output_dir / filename
-        filepath.write_text(json.dumps(export, ensure_ascii=False, indent=4), encoding='utf-8')
+            combined_filename = f"{output_prefix_single}spotify_playlists.json"
+        if 'json' in formats:
+            # Also keeps the previous version of playlists that cannot be fetched
+            previous_export = ExportIndex(output_dir / combined_filename, logger)
+            if incremental and not previous_export.entries:
+                logger.info(f"No usable index of a previous {combined_filename}: fetching all playlists")
+        if serialize_workers > 0 and 'json' in formats:
+            serialization_pool = create_serialization_pool(serialize_workers)
+        combined_sinks = open_export_sinks(output_dir / combined_filename, formats, 'Spotify playlists',
+                                           serialization_pool, index=True)
+
+    # Reused playlists are only decoded for the outputs that need their tracks
+    decode_reused = (report_data is not None or changelog is not None or archive is not None
+                     or search_index is not None or list(formats) != ['json'])
+    if incremental and previous_export is not None and previous_export.entries:
+        playlists_iter = iter_playlists_reusing_export(sp, filtered_playlists, previous_export, workers, logger)
+    else:
+        playlists_iter = ((playlist, tracks, None, None)
+                          for playlist, tracks in iter_playlists_with_tracks(sp, filtered_playlists, workers, logger))
+    reused_playlists = 0
+    failed_playlists = 0
+
+    try:
+        for playlist, tracks, entry, segment in playlists_iter:
+            playlist_name = playlist['name']
+            owner_name = playlist.get('owner', {}).get('display_name', 'Unknown')
+            owner_id = playlist.get('owner', {}).get('id', 'unknown')
+
+            if tracks is None and segment is None:
+                # Not fetched completely: keep its previous version rather than a partial one
+                failed_playlists += 1
+                entry = previous_export.entries.get(playlist['id']) if previous_export is not None else None
+                segment = previous_export.segment(playlist['id']) if entry is not None else None
+                if segment is None:
+                    logger.error(f"Playlist '{playlist_name}' could not be fetched and was not exported"
+                                 f"{'; any previous file is kept' if split else ''}")
+                    for collector in (changelog, search_index):
+                        if collector is not None:
+                            collector.keep_playlist(playlist['id'])
+                    continue
+                logger.warning(f"Playlist '{playlist_name}' could not be fetched: its previous version is kept")
+            elif segment is not None:
+                logger.info(f"Reusing unchanged playlist: '{playlist_name}' (Owner: {owner_name} [{owner_id}])")
+                reused_playlists += 1
+            else:
+                logger.info(f"Exporting playlist: '{playlist_name}' (Owner: {owner_name} [{owner_id}])")
+
+            if segment is not None:
+                track_count = entry['track_count']
+                playlist_obj = json.loads(segment) if decode_reused else None
+            else:
+                track_count = len(tracks)
+                playlist_obj = build_playlist_obj(playlist, tracks)
+
+            if not split:
+                total_tracks += track_count
+                if report_data is not None and report_data.get('analytics') is not None:
+                    report_data['analytics'].add_playlist(playlist_obj)
+                if changelog is not None:
+                    changelog.add_playlist(playlist_obj)
+                if search_index is not None:
+                    search_index.add_playlist(playlist_obj)
+
+            if split:
+                filename = split_filenames[playlist['id']]
+                filepath = export_format_paths(output_dir / filename, formats)[0]
+                record = (filename, filepath, playlist_obj, playlist_name, owner_name, track_count)
+                if writer is not None:
+                    pending_writes.append((writer.submit(output_dir / filename, [playlist_obj]), record))
+                    while pending_writes and pending_writes[0][0].done():
+                        settle_split_write(*pending_writes.popleft())
+                else:
+                    write_export_files(output_dir / filename, [playlist_obj], formats, playlist_name)
+                    logger.info(f"Saved playlist to {filepath}")
+                    record_split_file(*record)
+            else:
+                for sink in combined_sinks:
+                    if segment is not None and isinstance(sink, JsonSink):
+                        sink.write_segment(entry, segment)
+                    elif isinstance(sink, JsonSink):
+                        sink.write_playlist(playlist_obj, (playlist.get('tracks') or {}).get('total'))
+                    else:
+                        sink.write_playlist(playlist_obj)
+                if archive is not None:
+                    export.append(playlist_obj)
+                total_playlists += 1
+            
+                # Collect playlist data for report (without file path yet for combined mode)
+                if report_data is not None:
+                    report_data['playlists_details'].append({
+                        'name': playlist_name,
+                        'owner': owner_name,
+                        'track_count': track_count,
+                        'file_path': None  # Will be set after combined file is saved
+                    })
+        if previous_export is not None:
+            # The previous file is about to be replaced
+            previous_export.close()
+        for sink in combined_sinks:
+            sink.close()
+    except BaseException:
+        for sink in combined_sinks:
+            sink.abort()
+        raise
+    finally:
+        if previous_export is not None:
+            previous_export.close()
+        if writer is not None:
+            writer.close()
+        if serialization_pool is not None:
+            serialization_pool.shutdown(cancel_futures=True)
+    for future, record in pending_writes:
+        settle_split_write(future, record)
+
+    if written_split_files:
+        # A playlist whose file name changed (renamed, or a new name clash added its ID) leaves its
+        # previous file behind; remove it unless another playlist now uses that name
+        current_names = {filename.casefold() for filename in split_filenames.values()}
+        for playlist_id, filename in written_split_files.items():
+            old_filename = name_index.split_files.get(playlist_id)
+            if (old_filename and old_filename.casefold() != filename.casefold()
+                    and old_filename.casefold() not in current_names):
+                for path in export_format_paths(output_dir / old_filename, formats):
+                    try:
+                        path.unlink()
+                        logger.info(f"Removed superseded file {path}")
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logger.warning(f"Failed to remove superseded file {path}: {e}")
+        name_index.update_split_files(written_split_files)
+
+    if combined_sinks:
+        filepath = combined_sinks[0].filepath
+        if incremental:
+            logger.info(f"Reused {reused_playlists} unchanged playlists from the previous export")
         logger.info(f"Export completed. File saved as {filepath}")
+        if archive is not None:
+            archive.add_file(combined_filename, export)
         
         # Update all playlists with the combined file path
         if report_data is not None:
@@ -880,73 +4160,75 @@ def export_playlists(sp: spotipy.Spotify, split: bool, output_dir: Path,
                 if playlist_detail.get('file_path') is None:
                     playlist_detail['file_path'] = str(filepath)
 
+    if failed_playlists:
+        logger.error(f"{failed_playlists} playlists could not be fetched completely; see the errors above")
+
     return total_playlists, total_tracks
 
 
-def main():
-    """
-    Entry point for script execution. Parses arguments, loads configuration,
-    initializes logging and Spotify client, and runs export process.
+def build_playlist_selector(args):
     """
-    start_time = time.time()
+    Build the playlist selection from the command-line options.
 
-    config = load_env()
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
 
-    parser = argparse.ArgumentParser(description="Download Spotify playlists to JSON")
-    parser.add_argument('--split', action='store_true',
-                        help='Export each playlist as an individual JSON file')
-    parser.add_argument('--output_dir', type=str, default=None,
-                        help='Override the output directory path defined in .env or default.')
-    parser.add_argument('--playlist_name', type=str, default=None,
-                        help='Export only the playlist with this name (case-insensitive, normalized).')
-    parser.add_argument('--liked_songs', action='store_true',
-                        help='Export liked songs (saved tracks). Can be combined with other options.')
-    parser.add_argument('--all_playlists', action='store_true',
-                        help='Export all playlists. Can be combined with --liked_songs.')
-    parser.add_argument('--html_report', action='store_true',
-                        help='Generate a HTML report with export summary and statistics.')
-    parser.add_argument('--clean_output', action='store_true',
-                        help='Delete all JSON files in the output directory before exporting playlists.')
-    args = parser.parse_args()
+    Returns:
+        PlaylistSelector: Selection, or None when no selection option was given.
+    """
+    ids = read_playlist_ids_file(Path(args.playlist_ids_file).expanduser()) if args.playlist_ids_file else []
+    selector = PlaylistSelector(args.playlist_name, args.playlist_glob, args.playlist_regex, ids)
+    return None if selector.is_empty else selector
 
-    # Validate argument combinations
-    if args.playlist_name and args.all_playlists:
-        parser.error("--playlist_name and --all_playlists cannot be used together. Use --playlist_name for a specific playlist, or --all_playlists for all playlists.")
 
-    # Determine log directory and logging
-    log_dir = Path(config["LOG_DIR"]).expanduser().resolve() if config["LOG_DIR"] else Path(__file__).parent
-    logger = setup_logging(log_dir, config["LOG_LEVEL"])
+def run_export(args, config: dict, sp: spotipy.Spotify, output_dir: Path, archive_dir: Path, logger,
+               start_time: float, profiler: RunProfiler = None) -> dict:
+    """
+    Run one export (liked songs and/or playlists) with the given options and client.
 
-    # Determine output directory
-    output_dir = Path(args.output_dir).expanduser().resolve() if args.output_dir else Path(
-        config["OUTPUT_DIR"]).expanduser().resolve() if config["OUTPUT_DIR"] else Path(__file__).parent / 'playlists'
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
+        config (dict): Configuration variables as returned by load_env.
+        sp (spotipy.Spotify): Spotify client (usually a LazySpotifyClient).
+        output_dir (Path): Directory to save output files.
+        archive_dir (Path): Directory of the history archive (used with --archive).
+        logger: Logger instance for logging.
+        start_time (float): Start time of the run, as returned by time.time().
+        profiler (RunProfiler, optional): Profiler receiving the phases of the export (--profile).
 
+    Returns:
+        dict: Run statistics (total_playlists, total_tracks, execution_time, output_dir, report_path).
+    """
     output_prefix_split = config["OUTPUT_PREFIX_SPLIT"] or ""
     output_prefix_single = config["OUTPUT_PREFIX_SINGLE"] or ""
 
-    # Initialize Spotify client with OAuth
-    sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-        client_id=config["SPOTIFY_CLIENT_ID"],
-        client_secret=config["SPOTIFY_CLIENT_SECRET"],
-        redirect_uri=config["SPOTIFY_REDIRECT_URI"],
-        scope="playlist-read-private user-library-read"
-    ))
+    # Read the previous export before it is cleaned or overwritten
+    changelog = None
+    if args.changelog:
+        profile_phase(profiler, 'previous_export')
+        changelog = PlaylistChangelog(load_previous_export_state(output_dir, logger))
+
+    archive = PlaylistArchive(archive_dir, logger) if args.archive else None
+    search_index = open_search_index(output_dir, logger) if args.search_index else None
 
     # Clean output directory if requested
     if args.clean_output:
-        json_files = list(output_dir.glob('*.json'))
+        profile_phase(profiler, 'clean_output')
+        export_files = find_export_files(output_dir, tuple(sink.extension for sink in EXPORT_SINKS.values()))
         html_files = list(output_dir.glob('*.html'))
-        files_to_delete = json_files + html_files
+        files_to_delete = export_files + html_files
         for f in files_to_delete:
             try:
                 f.unlink()
                 logger.debug(f"Deleted old output file: {f}")
             except Exception as e:
                 logger.error(f"Failed to delete {f}: {e}")
-        logger.info(f"Output directory cleaned: {output_dir} ({len(json_files)} JSON, {len(html_files)} HTML files deleted)")
+            if f.suffix.lower() == '.json':
+                export_index_path(f).unlink(missing_ok=True)
+        logger.info(f"Output directory cleaned: {output_dir} ({len(export_files)} export, {len(html_files)} HTML files deleted)")
 
-    # Pass playlist_name filter if provided and not blank
-    playlist_name_filter = args.playlist_name if args.playlist_name and args.playlist_name.strip() else None
+    # Playlist selection (names, patterns, IDs); None when exporting all playlists
+    playlist_selector = build_playlist_selector(args)
 
     # Initialize report data collection if HTML report is requested
     report_data = None
@@ -959,7 +4241,8 @@ def main():
             'split_mode': args.split,
             'liked_songs_exported': False,
             'liked_songs_count': 0,
-            'playlists_details': []
+            'playlists_details': [],
+            'analytics': ReportAnalytics()
         }
 
     # Handle liked songs and/or playlists export
@@ -968,24 +4251,40 @@ def main():
     
     # Export liked songs if requested
     if args.liked_songs:
+        profile_phase(profiler, 'liked_songs')
         logger.info("Exporting liked songs...")
         liked_playlists, liked_tracks = export_liked_songs(
-            sp, args.split, output_dir, output_prefix_split, output_prefix_single, logger, report_data)
+            sp, args.split, output_dir, output_prefix_split, output_prefix_single, logger, report_data, changelog,
+            archive, args.formats, search_index, args.workers)
         total_playlists += liked_playlists
         total_tracks += liked_tracks
+
+    # Export the requested library collections (saved albums, followed artists, top items...)
+    for key in LIBRARY_COLLECTIONS:
+        if getattr(args, key):
+            profile_phase(profiler, key)
+            collection_count, collection_items = export_library_collection(
+                sp, key, args.split, output_dir, output_prefix_split, output_prefix_single, logger, report_data,
+                changelog, archive, args.formats, search_index, args.workers, args.top_time_range)
+            total_playlists += collection_count
+            total_tracks += collection_items
     
     # Export playlists based on filter, all_playlists flag, or default behavior
-    # Skip playlist export only if --liked_songs is used alone (without --playlist_name or --all_playlists)
-    should_export_playlists = not args.liked_songs or playlist_name_filter is not None or args.all_playlists
+    # Skip playlist export only if --liked_songs or collections are requested alone (without --playlist_name or --all_playlists)
+    should_export_playlists = (not (args.liked_songs or any(getattr(args, key) for key in LIBRARY_COLLECTIONS))
+                               or playlist_selector is not None or args.all_playlists)
     
     if should_export_playlists:
-        if playlist_name_filter:
-            logger.info(f"Exporting playlist matching: '{playlist_name_filter}'")
+        profile_phase(profiler, 'playlists')
+        if playlist_selector is not None:
+            logger.info(f"Exporting playlists matching: {playlist_selector.describe()}")
         else:
             logger.info("Exporting all playlists...")
         
         playlist_count, playlist_tracks = export_playlists(
-            sp, args.split, output_dir, output_prefix_split, output_prefix_single, playlist_name_filter, logger, report_data)
+            sp, args.split, output_dir, output_prefix_split, output_prefix_single, playlist_selector, logger, report_data,
+            changelog, archive, args.workers, args.writer_threads, args.shard_split, args.formats,
+            search_index, args.serialize_workers, args.incremental)
         total_playlists += playlist_count
         total_tracks += playlist_tracks
 
@@ -999,12 +4298,12 @@ def main():
         report_data['execution_time'] = elapsed_time
     
     # Log results based on what was exported
-    if args.liked_songs and (playlist_name_filter or args.all_playlists):
+    if args.liked_songs and (playlist_selector is not None or args.all_playlists):
         if args.all_playlists:
             logger.info(f"Total exports: {total_playlists} (including liked songs + all playlists)")
         else:
             logger.info(f"Total exports: {total_playlists} (including liked songs + filtered playlists)")
-    elif args.liked_songs and not playlist_name_filter and not args.all_playlists:
+    elif args.liked_songs and playlist_selector is None and not args.all_playlists:
         if total_playlists > 0:
             logger.info(f"Liked songs export completed successfully")
         else:
@@ -1013,14 +4312,844 @@ def main():
         logger.info(f"Total playlists exported: {total_playlists}")
     
     logger.info(f"Total tracks exported: {total_tracks}")
+
+    # Record this run in the history archive
+    if archive is not None:
+        profile_phase(profiler, 'archive')
+        try:
+            archive.write_manifest(args.split)
+        except OSError as e:
+            logger.error(f"Failed to write archive manifest: {e}")
+
+    # Save the search index, dropping playlists that are no longer exported
+    if search_index is not None:
+        profile_phase(profiler, 'search_index')
+        try:
+            search_index.finish(full_listing=should_export_playlists and playlist_selector is None)
+        except Exception as e:
+            logger.error(f"Failed to update search index: {e}")
+        finally:
+            search_index.close()
+
+    # Write the changelog against the previous export
+    if changelog is not None:
+        profile_phase(profiler, 'changelog')
+        changelog.finish(full_listing=should_export_playlists and playlist_selector is None)
+        changes = changelog.summary()
+        logger.info(f"Changes since previous export: {changes['changed_playlists']} changed, "
+                    f"{changes['new_playlists']} new, {changes['removed_playlists']} removed playlists; "
+                    f"{changes['tracks_added']} tracks added, {changes['tracks_removed']} removed, "
+                    f"{changes['tracks_moved']} moved")
+        try:
+            changelog.write(output_dir, logger)
+        except OSError as e:
+            logger.error(f"Failed to write changelog: {e}")
+        if report_data is not None:
+            report_data['changelog'] = changes
     
     # Generate HTML report if requested
+    report_path = None
     if args.html_report and report_data is not None:
+        profile_phase(profiler, 'html_report')
+        try:
+            report_path = generate_html_report(report_data, output_dir, logger)
+            logger.info(f"HTML report available at: {report_path}")
+        except Exception as e:
+            logger.error(f"Failed to generate HTML report: {e}")
+
+    return {
+        'total_playlists': total_playlists,
+        'total_tracks': total_tracks,
+        'execution_time': elapsed_time,
+        'output_dir': str(output_dir),
+        'report_path': str(report_path) if report_path else None
+    }
+
+
+LIKED_SONGS_POLL_LIMIT = 20
+
+
+def _liked_songs_marker(sp: spotipy.Spotify) -> tuple:
+    """
+    Cheap fingerprint of the liked songs: total count plus the newest saved tracks.
+
+    Returns:
+        tuple: (total, ((uri, added_at), ...)) for the newest page of saved tracks.
+    """
+    page = sp.current_user_saved_tracks(limit=LIKED_SONGS_POLL_LIMIT)
+    newest = tuple(((item.get('track') or {}).get('uri'), item.get('added_at')) for item in page.get('items', []))
+    return page.get('total'), newest
+
+
+def watch_playlists(args, config: dict, sp: spotipy.Spotify, output_dir: Path, logger):
+    """
+    Keep the exports in output_dir mirrored with the account, polling for changes.
+
+    The client (and its HTTP connection pool) and the exported objects stay in memory between
+    polls. Each poll lists the playlists and compares their snapshot_id, and checks only the
+    newest page of liked songs; only what changed is fetched again and rewritten. A change is
+    recorded only once it was fetched completely and written, so a failed fetch or write is
+    retried on the next poll. The poll interval doubles while nothing changes, up to
+    --max_poll_interval, and resets on a change or a failure.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
+        config (dict): Configuration variables as returned by load_env.
+        sp (spotipy.Spotify): Spotify client, kept for the whole session.
+        output_dir (Path): Directory to save output files.
+        logger: Logger instance for logging.
+    """
+    output_prefix_split = config["OUTPUT_PREFIX_SPLIT"] or ""
+    output_prefix_single = config["OUTPUT_PREFIX_SINGLE"] or ""
+    playlist_selector = build_playlist_selector(args)
+    watch_playlists_enabled = not args.liked_songs or playlist_selector is not None or args.all_playlists
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    combined_filename = (f"{output_prefix_single}filtered_spotify_playlists.json" if playlist_selector is not None
+                         else f"{output_prefix_single}spotify_playlists.json")
+
+    # Seed the state from the files this mode writes, so a restart does not refetch everything
+    playlists_state = {}
+    split_paths = {}  # playlist ID -> file currently holding it (split mode)
+    if args.split:
+        seed_playlists = iter_latest_export_playlists(output_dir, logger)
+    else:
+        combined_path = output_dir / combined_filename
+        try:
+            seed_playlists = [(combined_path, playlist_obj) for playlist_obj in iter_export_file(combined_path)]
+        except (ValueError, OSError) as e:
+            logger.debug(f"Ignoring {combined_path} while seeding watch state: {e}")
+            seed_playlists = []
+    for path, playlist_obj in seed_playlists:
+        if (not is_library_collection(playlist_obj['playlist_id'])
+                and playlist_obj['playlist_id'] not in playlists_state):
+            playlists_state[playlist_obj['playlist_id']] = playlist_obj
+            split_paths[playlist_obj['playlist_id']] = path
+    search_index = open_search_index(output_dir, logger) if args.search_index else None
+    if search_index is not None:
+        for playlist_obj in playlists_state.values():
+            search_index.add_playlist(playlist_obj)
+        search_index.finish(full_listing=False)
+    liked_marker = None
+    interval = args.poll_interval
+    polls = 0
+    logger.info(f"Watching for changes every {args.poll_interval}s (up to {args.max_poll_interval}s when idle). "
+                f"{len(playlists_state)} playlists loaded from existing exports.")
+
+    while True:
+        polls += 1
+        changed = 0
+        retry = False
+        try:
+            if args.liked_songs:
+                marker = _liked_songs_marker(sp)
+                if marker != liked_marker:
+                    tracks = get_user_saved_tracks(sp, logger, args.workers)
+                    user_id, user_name = get_current_user_identity(sp, logger)
+                    filename = (f"{output_prefix_split}Liked_Songs.json" if args.split
+                                else f"{output_prefix_single}liked_songs.json")
+                    liked_songs_obj = build_liked_songs_obj(user_id, user_name, tracks)
+                    write_export_files(output_dir / filename, [liked_songs_obj], args.formats, 'Liked Songs')
+                    if search_index is not None:
+                        search_index.add_playlist(liked_songs_obj)
+                    logger.info(f"Liked songs changed: {len(tracks)} tracks written to {output_dir / filename}")
+                    liked_marker = marker
+                    changed += 1
+
+            if watch_playlists_enabled:
+                all_listed = get_all_playlists(sp, logger, args.workers)
+                listing = [p for p in all_listed if playlist_selector is None or playlist_selector.matches(p)]
+                current_ids = {p['id'] for p in listing}
+                # The state only takes what was fetched completely and written, so anything else
+                # still differs from the listing on the next poll and is retried
+                fetched = {}
+                failed_ids = set()
+                for playlist in listing:
+                    previous = playlists_state.get(playlist['id'])
+                    if (previous is not None and previous['snapshot_id'] == playlist.get('snapshot_id', '')
+                            and previous['playlist_name'] == playlist['name']):
+                        continue
+                    tracks = try_get_playlist_tracks(sp, playlist['id'], logger, args.workers)
+                    if tracks is None:
+                        logger.warning(f"Playlist '{playlist['name']}' could not be fetched; retrying on the next poll")
+                        failed_ids.add(playlist['id'])
+                        retry = True
+                        continue
+                    fetched[playlist['id']] = build_playlist_obj(playlist, tracks)
+                    logger.info(f"Playlist changed: '{playlist['name']}' ({len(tracks)} tracks)")
+
+                removed = [playlists_state[playlist_id] for playlist_id in playlists_state
+                           if playlist_id not in current_ids]
+                for playlist_obj in removed:
+                    logger.info(f"Playlist no longer listed: '{playlist_obj['playlist_name']}'")
+
+                written = []
+                if args.split:
+                    for playlist_obj in removed:
+                        for path in export_format_paths(split_paths.pop(playlist_obj['playlist_id']), args.formats):
+                            path.unlink(missing_ok=True)
+                        del playlists_state[playlist_obj['playlist_id']]
+                    filenames = assign_split_filenames(all_listed, output_prefix_split, args.shard_split)
+                    for playlist in listing:
+                        playlist_obj = fetched.get(playlist['id'], playlists_state.get(playlist['id']))
+                        if playlist_obj is None or playlist['id'] in failed_ids:
+                            continue
+                        filepath = output_dir / filenames[playlist['id']]
+                        old_path = split_paths.get(playlist['id'])
+                        paths = export_format_paths(filepath, args.formats)
+                        if (playlist['id'] not in fetched and old_path == filepath
+                                and all(path.exists() for path in paths)):
+                            continue
+                        try:
+                            write_export_files(filepath, [playlist_obj], args.formats, playlist['name'])
+                        except OSError as e:
+                            logger.error(f"Failed to write {paths[0]}: {e}; retrying on the next poll")
+                            retry = True
+                            continue
+                        logger.info(f"Saved playlist to {paths[0]}")
+                        if old_path is not None and old_path != filepath:
+                            for path in export_format_paths(old_path, args.formats):
+                                path.unlink(missing_ok=True)
+                        split_paths[playlist['id']] = filepath
+                        if playlist['id'] in fetched:
+                            playlists_state[playlist['id']] = playlist_obj
+                            written.append(playlist_obj)
+                elif fetched or removed or (listing and not all(
+                        path.exists() for path in export_format_paths(output_dir / combined_filename, args.formats))):
+                    # The combined file keeps the account's playlist order; playlists that could not
+                    # be fetched keep their previous version
+                    playlist_objs = [fetched.get(p['id'], playlists_state.get(p['id'])) for p in listing]
+                    playlist_objs = [playlist_obj for playlist_obj in playlist_objs if playlist_obj is not None]
+                    paths = write_export_files(output_dir / combined_filename, playlist_objs,
+                                               args.formats, 'Spotify playlists', index=True)
+                    logger.info(f"Saved {len(playlist_objs)} playlists to {', '.join(str(path) for path in paths)}")
+                    for playlist_obj in removed:
+                        del playlists_state[playlist_obj['playlist_id']]
+                    playlists_state.update(fetched)
+                    written = list(fetched.values())
+
+                if search_index is not None:
+                    for playlist_obj in written:
+                        search_index.add_playlist(playlist_obj)
+                    search_index.remove_playlists(p['playlist_id'] for p in removed)
+                changed += len(written) + len(removed)
+            if search_index is not None and changed:
+                search_index.finish(full_listing=False)
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            logger.error(f"Poll {polls} failed: {e}")
+            retry = True
+
+        logger.info(f"Poll {polls}: {changed} changes.")
+        if args.watch_cycles and polls >= args.watch_cycles:
+            logger.info(f"Stopping after {polls} polls.")
+            return
+
+        interval = args.poll_interval if changed or retry else min(interval * 2, args.max_poll_interval)
+        logger.debug(f"Next poll in {interval}s.")
+        time.sleep(interval)
+
+
+# Keys accepted in each batch account entry, mapped to configuration variables
+BATCH_ACCOUNT_KEYS = {
+    'client_id': 'SPOTIFY_CLIENT_ID',
+    'client_secret': 'SPOTIFY_CLIENT_SECRET',
+    'redirect_uri': 'SPOTIFY_REDIRECT_URI',
+    'cache_path': 'SPOTIFY_CACHE_PATH',
+    'output_prefix_split': 'OUTPUT_PREFIX_SPLIT',
+    'output_prefix_single': 'OUTPUT_PREFIX_SINGLE',
+}
+
+# Shared request budget of the current batch worker process (set by _init_batch_worker)
+_batch_rate_limiter = None
+
+
+def load_batch_config(path: Path) -> list:
+    """
+    Load and validate the list of accounts for batch mode.
+
+    The file is JSON: either a list of accounts or an object with an "accounts" list. Each
+    account needs a unique "name" and may set client_id, client_secret, redirect_uri,
+    cache_path, output_dir, output_prefix_split and output_prefix_single. Missing credentials
+    fall back to the .env values; cache_path defaults to ".cache-<name>".
+
+    Args:
+        path (Path): Batch configuration file.
+
+    Returns:
+        list: Account dictionaries.
+    Raises:
+        ValueError: If the file is malformed or account names are missing or repeated.
+    """
+    data = json.loads(path.read_text(encoding='utf-8'))
+    accounts = data.get('accounts') if isinstance(data, dict) else data
+    if not isinstance(accounts, list) or not accounts:
+        raise ValueError(f"{path} must contain a non-empty list of accounts")
+
+    names = set()
+    for account in accounts:
+        name = account.get('name', '').strip() if isinstance(account, dict) else ''
+        if not name:
+            raise ValueError(f"Every account in {path} needs a non-empty 'name'")
+        if sanitize_filename(name) in names:
+            raise ValueError(f"Duplicate account name in {path}: '{name}'")
+        names.add(sanitize_filename(name))
+    return accounts
+
+
+def _init_batch_worker(lock, next_slot, interval: float):
+    """Process pool initializer: install the request budget shared by all batch workers."""
+    global _batch_rate_limiter
+    if interval > 0:
+        _batch_rate_limiter = RateLimiter(interval, lock, next_slot)
+
+
+def _batch_account_settings(account: dict, base_config: dict, output_root: Path) -> tuple:
+    """
+    Resolve the configuration and output directory of one batch account.
+
+    Args:
+        account (dict): Account entry from the batch configuration.
+        base_config (dict): Configuration loaded from .env.
+        output_root (Path): Default parent directory of the per-account output directories.
+
+    Returns:
+        tuple: (config, output_dir)
+    """
+    safe_name = sanitize_filename(account['name'].strip())
+    config = dict(base_config)
+    for key, config_key in BATCH_ACCOUNT_KEYS.items():
+        if account.get(key):
+            config[config_key] = str(account[key]).strip()
+    if not account.get('cache_path'):
+        config['SPOTIFY_CACHE_PATH'] = str(Path(__file__).parent / f".cache-{safe_name}")
+
+    output_dir = Path(account['output_dir']).expanduser().resolve() if account.get('output_dir') else output_root / safe_name
+    return config, output_dir
+
+
+def _authorize_batch_account(name: str, config: dict, args, logger) -> str:
+    """
+    Make sure a batch account has a cached token before it is exported in a worker process.
+
+    Worker processes cannot answer the OAuth prompt (their stdin is closed) and would compete
+    for the redirect port, so accounts without a usable cached token are authorized here, in
+    the main process and one at a time.
+
+    Args:
+        name (str): Account name.
+        config (dict): Account configuration (see _batch_account_settings).
+        args (argparse.Namespace): Parsed command-line options (for the OAuth scopes).
+        logger: Logger instance for logging.
+
+    Returns:
+        str: None when the account is authorized, otherwise the reason it is not.
+    """
+    try:
+        auth_manager = getattr(create_spotify_client(config, scope=spotify_scope(args)), 'auth_manager', None)
+        if auth_manager is None or auth_manager.validate_token(auth_manager.cache_handler.get_cached_token()):
+            return None
+        logger.info(f"Account '{name}' has no cached token, authorize it now")
+        auth_manager.get_access_token(as_dict=False)
+        return None
+    except Exception as e:
+        return (f"authorization failed ({e}); authorize this account first by running the script for it "
+                f"alone, with the same credentials and cache_path")
+
+
+def _run_batch_account(account: dict, args, base_config: dict, output_root: Path, log_dir: Path) -> dict:
+    """
+    Export one batch account. Runs in a worker process with its own logging, token cache and output.
+
+    Args:
+        account (dict): Account entry from the batch configuration.
+        args (argparse.Namespace): Parsed command-line options shared by all accounts.
+        base_config (dict): Configuration loaded from .env.
+        output_root (Path): Default parent directory of the per-account output directories.
+        log_dir (Path): Directory for the per-account log files.
+
+    Returns:
+        dict: Run statistics plus 'account' and 'status' ('completed' or 'failed', with 'error').
+    """
+    start_time = time.time()
+    name = account['name'].strip()
+    safe_name = sanitize_filename(name)
+    config, output_dir = _batch_account_settings(account, base_config, output_root)
+    logger = setup_logging(log_dir, config["LOG_LEVEL"], f"my_spotify_playlists_downloader_{safe_name}.log", f"[{name}] ")
+
+    sp = LazySpotifyClient(lambda: create_spotify_client(config, args.workers, args.http_compression, spotify_scope(args)),
+                           rate_limiter=_batch_rate_limiter)
+    try:
+        stats = run_export(args, config, sp, output_dir, output_dir / 'archive', logger, start_time)
+        stats['status'] = 'completed'
+    except Exception as e:
+        logger.error(f"Export failed: {e}")
+        stats = {'total_playlists': 0, 'total_tracks': 0, 'execution_time': time.time() - start_time,
+                 'output_dir': str(output_dir), 'report_path': None, 'status': 'failed', 'error': str(e)}
+    stats['account'] = name
+    return stats
+
+
+def run_batch(args, config: dict, batch_path: Path, output_root: Path, log_dir: Path, logger) -> list:
+    """
+    Export several accounts in parallel worker processes.
+
+    Parallelism is capped by --batch_workers and all processes share one API request budget
+    (--batch_max_rps). Each account gets its own token cache, output directory and log file.
+    Accounts without a cached token are first authorized one at a time in this process (see
+    _authorize_batch_account); those that cannot be authorized are reported as failed.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line options shared by all accounts.
+        config (dict): Configuration loaded from .env.
+        batch_path (Path): Batch configuration file.
+        output_root (Path): Default parent directory of the per-account output directories.
+        log_dir (Path): Directory for log files.
+        logger: Logger instance for logging.
+
+    Returns:
+        list: Per-account statistics, in configuration order.
+    Raises:
+        ValueError: If the configuration is invalid or two accounts share an output directory or token cache.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    accounts = load_batch_config(batch_path)
+    settings = [_batch_account_settings(account, config, output_root) for account in accounts]
+    for label, values in (('output_dir', [output_dir for _, output_dir in settings]),
+                          ('cache_path', [Path(account_config['SPOTIFY_CACHE_PATH']).expanduser().resolve()
+                                          for account_config, _ in settings])):
+        owners = {}
+        for account, value in zip(accounts, values):
+            if value in owners:
+                raise ValueError(f"Accounts '{owners[value]}' and '{account['name']}' use the same {label}: {value}")
+            owners[value] = account['name']
+
+    errors = {}
+    for account, (account_config, output_dir) in zip(accounts, settings):
+        error = _authorize_batch_account(account['name'], account_config, args, logger)
+        if error is not None:
+            errors[account['name']] = {'account': account['name'], 'status': 'failed', 'error': error,
+                                       'total_playlists': 0, 'total_tracks': 0, 'execution_time': 0,
+                                       'output_dir': str(output_dir), 'report_path': None}
+
+    workers = max(1, min(args.batch_workers, len(accounts)))
+    interval = 1.0 / args.batch_max_rps if args.batch_max_rps > 0 else 0.0
+    logger.info(f"Batch export of {len(accounts)} accounts with {workers} worker processes"
+                + (f" and a shared budget of {args.batch_max_rps:g} requests/s" if interval else ""))
+
+    # "spawn" gives every worker a fresh interpreter (own logging setup) on all platforms
+    context = multiprocessing.get_context('spawn')
+    lock = context.Lock()
+    next_slot = context.Value('d', 0.0, lock=False)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_batch_worker,
+                             initargs=(lock, next_slot, interval)) as executor:
+        futures = [None if account['name'] in errors else
+                   executor.submit(_run_batch_account, account, args, config, output_root, log_dir)
+                   for account in accounts]
+        results = []
+        for account, future in zip(accounts, futures):
+            try:
+                results.append(errors[account['name']] if future is None else future.result())
+            except Exception as e:
+                results.append({'account': account['name'], 'status': 'failed', 'error': str(e),
+                                'total_playlists': 0, 'total_tracks': 0, 'execution_time': 0,
+                                'output_dir': '', 'report_path': None})
+            result = results[-1]
+            if result['status'] == 'completed':
+                logger.info(f"Account '{result['account']}': {result['total_playlists']} playlists, "
+                            f"{result['total_tracks']} tracks in {result['execution_time']:.1f}s")
+            else:
+                logger.error(f"Account '{result['account']}' failed: {result.get('error')}")
+    return results
+
+
+def write_batch_summary(results: list, output_root: Path, elapsed_time: float, logger) -> tuple:
+    """
+    Write the combined metrics file (JSON) and summary report (HTML) of a batch run.
+
+    Args:
+        results (list): Per-account statistics returned by run_batch.
+        output_root (Path): Directory where both files are written.
+        elapsed_time (float): Wall time of the whole batch, in seconds.
+        logger: Logger instance for logging.
+
+    Returns:
+        tuple: (metrics_path, report_path)
+    """
+    from datetime import datetime
+
+    now = datetime.now()
+    output_root.mkdir(parents=True, exist_ok=True)
+    totals = {
+        'accounts': len(results),
+        'completed': sum(1 for r in results if r['status'] == 'completed'),
+        'failed': sum(1 for r in results if r['status'] != 'completed'),
+        'total_playlists': sum(r['total_playlists'] for r in results),
+        'total_tracks': sum(r['total_tracks'] for r in results),
+        'wall_time': elapsed_time,
+        'accounts_time': sum(r['execution_time'] for r in results),
+    }
+
+    metrics_path = output_root / f"batch_metrics_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    metrics_path.write_text(json.dumps({'generated_at': now.isoformat(timespec='seconds'), 'totals': totals,
+                                        'accounts': results}, ensure_ascii=False, indent=4), encoding='utf-8')
+    logger.info(f"Batch metrics saved to {metrics_path}")
+
+    report_path = output_root / f"batch_export_report_{now.strftime('%Y%m%d_%H%M%S')}.html"
+    timestamp = now.strftime("%Y-%m-%d at %I:%M:%S %p")
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 16) as out:
+        out.write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Batch Export Report - {timestamp}</title>
+    <style>{REPORT_CSS}    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="report-header">
+            <h1>Batch Export Report</h1>
+            <div class="date">{timestamp}</div>
+        </div>
+        
+        <div class="stats-container">
+            <div class="stat-box">
+                <div class="stat-number">{totals['completed']}/{totals['accounts']}</div>
+                <div class="stat-label">Accounts Exported</div>
+            </div>
+            <div class="stat-box">
+                <div class="stat-number">{totals['total_playlists']:,}</div>
+                <div class="stat-label">Playlists Exported</div>
+            </div>
+            <div class="stat-box">
+                <div class="stat-number">{totals['total_tracks']:,}</div>
+                <div class="stat-label">Total Tracks</div>
+            </div>
+            <div class="stat-box">
+                <div class="stat-number">{elapsed_time:.1f}s</div>
+                <div class="stat-label">Execution Time</div>
+            </div>
+        </div>
+        
+        <div class="card">
+            <div class="card-title">Accounts ({len(results)})</div>
+            <div class="playlists-grid">""")
+        for result in results:
+            status = "Completed" if result['status'] == 'completed' else f"Failed: {result.get('error', '')}"
+            out.write(f"""
+                <div class="playlist-item">
+                    <div class="playlist-title">{escape(result['account'])}</div>
+                    <div class="playlist-meta">
+                        <span class="playlist-owner">{escape(status)} ({result['execution_time']:.1f}s)</span>
+                        <span class="playlist-count">{result['total_playlists']} playlists / {result['total_tracks']:,} tracks</span>
+                    </div>
+                    <div class="playlist-path">{escape(result.get('report_path') or result['output_dir'])}</div>
+                </div>""")
+        out.write("""
+            </div>
+        </div>
+        
+        <div class="footer">
+            <p>Generated by <strong>Spotify Playlists Downloader</strong></p>
+        </div>
+    </div>
+</body>
+</html>""")
+    logger.info(f"Batch report generated: {report_path}")
+    return metrics_path, report_path
+
+
+def run_command(args, config: dict, log_dir: Path, logger, start_time: float, profiler: RunProfiler = None):
+    """
+    Run the command selected by the parsed options: batch export, archive maintenance,
+    offline report, search, watch mode or a regular export.
+
+    Args:
+        args (argparse.Namespace): Parsed and validated command-line options.
+        config (dict): Configuration variables as returned by load_env.
+        log_dir (Path): Directory of the log files.
+        logger: Logger instance for logging.
+        start_time (float): Start time of the run, as returned by time.time().
+        profiler (RunProfiler, optional): Profiler receiving the phases of the run (--profile).
+    """
+    # Determine output directory
+    output_dir = Path(args.output_dir).expanduser().resolve() if args.output_dir else Path(
+        config["OUTPUT_DIR"]).expanduser().resolve() if config["OUTPUT_DIR"] else Path(__file__).parent / 'playlists'
+
+    # Batch mode: export every configured account, with output_dir as the parent directory
+    if args.batch_config:
+        profile_phase(profiler, 'batch')
+        try:
+            results = run_batch(args, config, Path(args.batch_config).expanduser().resolve(), output_dir, log_dir, logger)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to run batch export: {e}")
+            return
+        write_batch_summary(results, output_dir, time.time() - start_time, logger)
+        return
+
+    # Determine archive directory
+    archive_dir = Path(args.archive_dir).expanduser().resolve() if args.archive_dir else Path(
+        config["ARCHIVE_DIR"]).expanduser().resolve() if config["ARCHIVE_DIR"] else output_dir / 'archive'
+
+    # Archive maintenance: list or restore runs and stop
+    if args.list_archive:
+        profile_phase(profiler, 'list_archive')
+        runs = PlaylistArchive(archive_dir, logger).list_runs()
+        for run in runs:
+            playlists = sum(len(digests) for digests in run['files'].values())
+            logger.info(f"Run {run['run_id']} ({run['created_at']}): {len(run['files'])} files, {playlists} playlists")
+        logger.info(f"{len(runs)} archived runs in {archive_dir}")
+        return
+    if args.restore_run:
+        profile_phase(profiler, 'restore_run')
+        try:
+            PlaylistArchive(archive_dir, logger).restore_run(args.restore_run, output_dir)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to restore archived run {args.restore_run}: {e}")
+        return
+
+    # Offline report: rebuild the HTML report from existing exports and stop
+    if args.offline_report:
+        profile_phase(profiler, 'read_exports')
+        logger.info(f"Generating offline report from exports in: {output_dir}")
+        report_data = build_report_data_from_exports(output_dir, logger)
+        if not report_data['total_playlists']:
+            logger.error(f"No playlist exports found in: {output_dir}")
+            return
+        profile_phase(profiler, 'html_report')
         try:
             report_path = generate_html_report(report_data, output_dir, logger)
             logger.info(f"HTML report available at: {report_path}")
         except Exception as e:
             logger.error(f"Failed to generate HTML report: {e}")
+        return
+
+    # Search: query the local index (built from the existing exports if missing) and stop
+    if args.search is not None:
+        import sqlite3
+
+        profile_phase(profiler, 'search')
+        index_path = output_dir / SEARCH_INDEX_FILENAME
+        index_exists = index_path.is_file()
+        search_index = open_search_index(output_dir, logger)
+        if search_index is None:
+            return
+        try:
+            if not index_exists:
+                logger.info(f"Building search index from exports in: {output_dir}")
+                search_index.rebuild_from_exports(output_dir)
+                if search_index.db is None:
+                    # Do not leave an empty index behind: the next search builds it again
+                    index_path.unlink(missing_ok=True)
+                    logger.error(f"The search index could not be built from the exports in {output_dir}")
+                    return
+            query_start = time.perf_counter()
+            rows, total, playlists = search_index.search(args.search, args.search_field)
+            elapsed_ms = (time.perf_counter() - query_start) * 1000
+        except sqlite3.Error as e:
+            logger.error(f"Search failed, the index may be damaged (delete {index_path} to rebuild it): {e}")
+            return
+        finally:
+            search_index.close()
+        previous_playlist = None
+        for playlist_name, playlist_id, position, track_name, artist, album in rows:
+            if playlist_id != previous_playlist:
+                logger.info(f"{playlist_name} [{playlist_id}]")
+                previous_playlist = playlist_id
+            logger.info(f"    {position + 1}. {artist} - {track_name} ({album})")
+        shown = f", showing the first {len(rows)}" if total > len(rows) else ""
+        logger.info(f"{total} matching tracks in {playlists} playlists for "
+                    f"'{args.search}'{shown} ({elapsed_ms:.1f} ms)")
+        return
+
+    # The client is created lazily, so check the credentials now: a missing one must stop the run
+    # before any export starts, not fail (and be retried) inside the first API call
+    missing_vars = [var for var in REQUIRED_ENV_VARS if not config.get(var)]
+    if missing_vars:
+        logger.error(f"Missing required environment variables: {', '.join(missing_vars)} (set them in the .env file)")
+        sys.exit(1)
+
+    # Spotify client with OAuth, created on the first API call
+    sp = LazySpotifyClient(lambda: create_spotify_client(config, args.workers, args.http_compression,
+                                                         spotify_scope(args)))
+
+    if args.watch:
+        profile_phase(profiler, 'watch')
+        try:
+            watch_playlists(args, config, sp, output_dir, logger)
+        except KeyboardInterrupt:
+            logger.info("Watch mode stopped.")
+        return
+
+    run_export(args, config, sp, output_dir, archive_dir, logger, start_time, profiler)
+
+
+def main():
+    """
+    Entry point for script execution. Parses arguments, loads configuration,
+    initializes logging and Spotify client, and runs export process.
+    """
+    start_time = time.time()
+
+    parser = argparse.ArgumentParser(description="Download Spotify playlists to JSON")
+    parser.add_argument('--split', action='store_true',
+                        help='Export each playlist as an individual JSON file')
+    parser.add_argument('--output_dir', type=str, default=None,
+                        help='Override the output directory path defined in .env or default.')
+    parser.add_argument('--playlist_name', type=str, action='append', default=None,
+                        help='Export only the playlist with this name (case-insensitive, normalized). Can be repeated.')
+    parser.add_argument('--playlist_glob', type=str, action='append', default=None,
+                        help='Export playlists whose normalized name matches this glob pattern (e.g. "rock*"). Can be repeated.')
+    parser.add_argument('--playlist_regex', type=str, action='append', default=None,
+                        help='Export playlists whose name matches this regular expression (case-insensitive). Can be repeated.')
+    parser.add_argument('--playlist_ids_file', type=str, default=None,
+                        help='Export the playlists listed in this file (IDs, spotify:playlist: URIs or URLs, one per line).')
+    parser.add_argument('--liked_songs', action='store_true',
+                        help='Export liked songs (saved tracks). Can be combined with other options.')
+    parser.add_argument('--saved_albums', action='store_true',
+                        help='Export the albums saved in your library. Can be combined with other options.')
+    parser.add_argument('--saved_shows', action='store_true',
+                        help='Export the podcasts and shows saved in your library.')
+    parser.add_argument('--saved_episodes', action='store_true',
+                        help='Export the episodes saved in your library.')
+    parser.add_argument('--followed_artists', action='store_true',
+                        help='Export the artists you follow.')
+    parser.add_argument('--top_tracks', action='store_true',
+                        help='Export your most played tracks.')
+    parser.add_argument('--top_artists', action='store_true',
+                        help='Export your most played artists.')
+    parser.add_argument('--top_time_range', choices=['short_term', 'medium_term', 'long_term'], default='medium_term',
+                        help='Period of --top_tracks and --top_artists: about 4 weeks, 6 months or 1 year (default: medium_term).')
+    parser.add_argument('--all_playlists', action='store_true',
+                        help='Export all playlists. Can be combined with --liked_songs.')
+    parser.add_argument('--html_report', action='store_true',
+                        help='Generate a HTML report with export summary and statistics.')
+    parser.add_argument('--clean_output', action='store_true',
+                        help='Delete all export files (JSON, CSV, M3U, XSPF) in the output directory before exporting playlists.')
+    parser.add_argument('--changelog', action='store_true',
+                        help='Compare with the previous export in the output directory and write a changelog of added, removed and moved tracks.')
+    parser.add_argument('--archive', action='store_true',
+                        help='Store this export in the history archive (each playlist version is stored only once).')
+    parser.add_argument('--archive_dir', type=str, default=None,
+                        help='Override the archive directory defined in .env or default (<output_dir>/archive).')
+    parser.add_argument('--list_archive', action='store_true',
+                        help='List the runs stored in the history archive and exit.')
+    parser.add_argument('--restore_run', type=str, default=None,
+                        help='Write the files of an archived run (see --list_archive) into the output directory and exit.')
+    parser.add_argument('--offline_report', action='store_true',
+                        help='Generate the HTML report from existing exports in the output directory, without calling the Spotify API.')
+    parser.add_argument('--search_index', action='store_true',
+                        help='Update the local search index of the exported tracks (used by --search) after exporting.')
+    parser.add_argument('--search', type=str, default=None, metavar='QUERY',
+                        help='Find the exported playlists containing tracks that match QUERY, using the local search index, and exit.')
+    parser.add_argument('--search_field', choices=['any', *SEARCH_FIELDS], default='any',
+                        help='Restrict --search to track names, artists or albums (default: any).')
+    parser.add_argument('--formats', type=str, default=','.join(DEFAULT_EXPORT_FORMATS),
+                        help=f"Comma-separated export formats written in the same pass: {', '.join(EXPORT_SINKS)} (default: json).")
+    parser.add_argument('--serialize_workers', type=int, default=0,
+                        help='Without --split, number of processes encoding the combined JSON file in parallel (0 = encode inline, default: 0).')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Without --split, copy playlists unchanged since the previous combined file from it (using its index) instead of downloading them again.')
+    parser.add_argument('--writer_threads', type=int, default=2,
+                        help='In --split mode, number of background threads writing files while fetching continues (0 = write inline, default: 2).')
+    parser.add_argument('--shard_split', action='store_true',
+                        help='In --split mode, place playlist files in subdirectories (00-ff) to keep directories small.')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of playlists (or pages of liked songs, listings and collections) fetched concurrently; also sizes the HTTP connection pool (default: 1).')
+    parser.add_argument('--http_compression', choices=['auto', 'gzip', 'off'], default='auto',
+                        help='Response compression requested from the API (default: auto = gzip, plus brotli if installed).')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and mirror changes: poll for playlist/liked songs changes and rewrite only what changed.')
+    parser.add_argument('--poll_interval', type=int, default=300,
+                        help='Seconds between polls in --watch mode (default: 300).')
+    parser.add_argument('--max_poll_interval', type=int, default=3600,
+                        help='Longest wait between polls when nothing changes in --watch mode (default: 3600).')
+    parser.add_argument('--watch_cycles', type=int, default=0,
+                        help='Stop --watch mode after this many polls (default: run until interrupted).')
+    parser.add_argument('--batch_config', type=str, default=None,
+                        help='Export several accounts listed in this JSON file, in parallel processes.')
+    parser.add_argument('--batch_workers', type=int, default=2,
+                        help='Maximum number of accounts exported at the same time in batch mode (default: 2).')
+    parser.add_argument('--batch_max_rps', type=float, default=0,
+                        help='Global limit of API requests per second shared by all batch workers (default: no limit).')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record a CPU profile and the top allocation sites of each phase of the run, in a directory next to the log file (slows the run down).')
+    args = parser.parse_args()
+
+    # Validate argument combinations
+    selection_given = bool(args.playlist_name or args.playlist_glob or args.playlist_regex or args.playlist_ids_file)
+    collections_given = any(getattr(args, key) for key in LIBRARY_COLLECTIONS)
+    if selection_given and args.all_playlists:
+        parser.error("--playlist_name, --playlist_glob, --playlist_regex and --playlist_ids_file cannot be used together with --all_playlists. Use them for specific playlists, or --all_playlists for all playlists.")
+    for pattern in args.playlist_regex or []:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            parser.error(f"Invalid --playlist_regex '{pattern}': {e}")
+    if args.playlist_ids_file and not Path(args.playlist_ids_file).expanduser().is_file():
+        parser.error(f"--playlist_ids_file not found: {args.playlist_ids_file}")
+    if args.offline_report and (args.clean_output or args.liked_songs or args.all_playlists or selection_given
+                                or args.changelog or collections_given):
+        parser.error("--offline_report only reads existing exports and cannot be combined with --clean_output, --liked_songs, --all_playlists, playlist selection options, library collections or --changelog.")
+
+    if args.search is not None and (args.clean_output or args.liked_songs or args.all_playlists or selection_given
+                                    or collections_given or args.changelog or args.archive or args.offline_report or args.watch
+                                    or args.batch_config or args.list_archive or args.restore_run):
+        parser.error("--search only reads the local search index and cannot be combined with export options.")
+    if (args.list_archive or args.restore_run) and (args.clean_output or args.liked_songs or args.all_playlists
+                                                    or selection_given or collections_given or args.changelog or args.archive
+                                                    or args.offline_report):
+        parser.error("--list_archive and --restore_run do not export and cannot be combined with export options.")
+    if args.batch_config and (args.list_archive or args.restore_run or args.offline_report or args.archive_dir):
+        parser.error("--batch_config cannot be combined with --list_archive, --restore_run, --offline_report or --archive_dir.")
+
+    if args.watch and (args.clean_output or args.changelog or args.archive or args.html_report or args.batch_config
+                       or args.list_archive or args.restore_run or args.offline_report or collections_given):
+        parser.error("--watch cannot be combined with --clean_output, --changelog, --archive, --html_report, --batch_config, --list_archive, --restore_run, --offline_report or library collections.")
+    args.formats = list(dict.fromkeys(name.strip().lower() for name in args.formats.split(',') if name.strip()))
+    unknown_formats = [name for name in args.formats if name not in EXPORT_SINKS]
+    if unknown_formats or not args.formats:
+        parser.error(f"--formats accepts a comma-separated list of: {', '.join(EXPORT_SINKS)}.")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1.")
+    if args.writer_threads < 0:
+        parser.error("--writer_threads cannot be negative.")
+    if args.serialize_workers < 0:
+        parser.error("--serialize_workers cannot be negative.")
+    if 'json' not in args.formats and (args.changelog or args.offline_report or args.search is not None or args.watch):
+        parser.error("--changelog, --offline_report, --search and --watch read the existing JSON exports: they require json in --formats.")
+    if args.incremental and (args.split or args.clean_output or args.watch or 'json' not in args.formats):
+        parser.error("--incremental reuses the previous combined JSON file: it requires json in --formats and cannot be combined with --split, --clean_output or --watch.")
+    if args.poll_interval < 1 or args.max_poll_interval < args.poll_interval:
+        parser.error("--poll_interval must be at least 1 and not greater than --max_poll_interval.")
+
+    # Profile the whole run, phase by phase, when requested (the setup below is the 'startup' phase)
+    profiler = None
+    if args.profile:
+        profiler = RunProfiler()
+        profiler.start()
+
+    # Credentials are validated when the Spotify client is first used
+    config = load_env(require_credentials=False)
+
+    # Determine log directory and logging
+    log_dir = Path(config["LOG_DIR"]).expanduser().resolve() if config["LOG_DIR"] else Path(__file__).parent
+    logger = setup_logging(log_dir, config["LOG_LEVEL"])
+
+    try:
+        run_command(args, config, log_dir, logger, start_time, profiler)
+    finally:
+        if profiler is not None:
+            # Never hide an error of the run behind one of the profiler
+            try:
+                profiler.stop(log_dir, logger)
+            except Exception as e:
+                logger.error(f"Failed to save the profile: {e}")
 
 
 if __name__ == "__main__":